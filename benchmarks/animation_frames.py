@@ -0,0 +1,76 @@
+"""
+Building 500 trainers: Animation frames cut and scaled per instance (the
+old Animation.__init__) against the shared frame cache in ResourceManager.
+Reports construction time and the memory held by distinct frame surfaces.
+
+Run from the project root:
+    python -m benchmarks.animation_frames --trainers 500
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+from src.core.services import resource_manager
+from src.entities.enemy_trainer import EnemyTrainer
+from src.utils import GameSettings
+
+SHEET = "character/ow1.png"
+ROWS = ["down", "left", "right", "up"]
+KEYFRAMES = 4
+
+
+def frames_uncached(size: tuple[int, int]) -> dict[str, list[pg.Surface]]:
+    sheet = resource_manager.get_image(SHEET)
+    sheet_w, sheet_h = sheet.get_size()
+    frame_w = sheet_w // KEYFRAMES
+    frame_h = sheet_h // len(ROWS)
+    animations = {}
+    for r, name in enumerate(ROWS):
+        animations[name] = [
+            pg.transform.smoothscale(sheet.subsurface(pg.Rect(c * frame_w, r * frame_h, frame_w, frame_h)), size)
+            for c in range(KEYFRAMES)
+        ]
+    return animations
+
+
+def surface_bytes(animations: list[dict]) -> int:
+    seen = {}
+    for frames in animations:
+        for row in frames.values():
+            for surface in row:
+                seen[id(surface)] = surface.get_width() * surface.get_height() * surface.get_bytesize()
+    return sum(seen.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trainers", type=int, default=500)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1, 1))
+    ts = GameSettings.TILE_SIZE
+    resource_manager.get_image(SHEET)   # loading the sheet itself is cached either way
+
+    start = time.perf_counter()
+    uncached = [frames_uncached((ts, ts)) for _ in range(args.trainers)]
+    uncached_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    trainers = [EnemyTrainer(i * ts, 0, None) for i in range(args.trainers)]
+    cached_time = time.perf_counter() - start
+
+    print(f"{args.trainers} trainers")
+    print(f"per-instance frames : {uncached_time * 1000:7.1f} ms (frames only)   "
+          f"{surface_bytes(uncached) / 2**20:6.2f} MiB of frames")
+    print(f"shared frame cache  : {cached_time * 1000:7.1f} ms (whole EnemyTrainer)   "
+          f"{surface_bytes([t.animation.animations for t in trainers]) / 2**20:6.2f} MiB of frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Update throughput for bots and relays that move many players at once.
+One connection moves --players players for --duration seconds each way:
+
+    single        one POST /players per update, keep-alive
+    batch json    POST /players/batch with --batch updates per request
+    batch binary  the same with back to back binary position records
+    relay         NDJSON relay mode of the push channel (server/pushServer.py)
+
+and reports updates/s and server CPU per update for each.
+
+Run from the project root:
+    python -m benchmarks.batch_updates --players 256 --batch 64
+"""
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import time
+
+from benchmarks.push_vs_poll import cpu_seconds
+from benchmarks.server_load import free_port, wait_for_server
+from shared.wireFormat import BINARY_CONTENT_TYPE, KNOWN_MAPS, POSITION
+
+MAP = "map.tmx"
+
+
+def single(conn: http.client.HTTPConnection, pids: list[int], step: int) -> int:
+    for pid in pids:
+        body = json.dumps({"id": pid, "x": float(step), "y": 0.0, "map": MAP}).encode()
+        conn.request("POST", "/players", body=body, headers={"Content-Type": "application/json"})
+        conn.getresponse().read()
+    return len(pids)
+
+
+def batch_json(conn: http.client.HTTPConnection, pids: list[int], step: int, size: int) -> int:
+    for start in range(0, len(pids), size):
+        items = [{"id": pid, "x": float(step), "y": 0.0, "map": MAP} for pid in pids[start:start + size]]
+        conn.request("POST", "/players/batch", body=json.dumps(items).encode(),
+                     headers={"Content-Type": "application/json"})
+        conn.getresponse().read()
+    return len(pids)
+
+
+def batch_binary(conn: http.client.HTTPConnection, pids: list[int], step: int, size: int) -> int:
+    map_id = KNOWN_MAPS.index(MAP)
+    for start in range(0, len(pids), size):
+        body = b"".join(POSITION.pack(pid, float(step), 0.0, map_id) for pid in pids[start:start + size])
+        conn.request("POST", "/players/batch", body=body, headers={"Content-Type": BINARY_CONTENT_TYPE})
+        conn.getresponse().read()
+    return len(pids)
+
+
+def relay(sock: socket.socket, pids: list[int], step: int) -> int:
+    lines = [json.dumps({"id": pid, "x": float(step), "y": 0.0, "map": MAP}) for pid in pids]
+    sock.sendall(("\n".join(lines) + "\n").encode())
+    return len(pids)
+
+
+def run(label: str, port: int, push_port: int, server_pid: int, pids: list[int],
+        batch: int, duration: float) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    sock = None
+    if label == "relay":
+        sock = socket.create_connection(("127.0.0.1", push_port))
+        sock.sendall(b'{"type": "relay"}\n')
+    send = {
+        "single": lambda step: single(conn, pids, step),
+        "batch json": lambda step: batch_json(conn, pids, step, batch),
+        "batch binary": lambda step: batch_binary(conn, pids, step, batch),
+        "relay": lambda step: relay(sock, pids, step),
+    }[label]
+
+    done = 0
+    step = 0
+    cpu_start, start = cpu_seconds(server_pid), time.perf_counter()
+    while time.perf_counter() - start < duration:
+        step += 1
+        done += send(step)
+    if sock is not None:
+        # The relay is fire and forget; wait until the last round landed
+        expected = float(step)
+        while True:
+            conn.request("GET", f"/players?map={MAP}")
+            players = json.loads(conn.getresponse().read())["players"]
+            if all(p["x"] == expected for p in players.values()):
+                break
+            time.sleep(0.001)
+        sock.close()
+    elapsed = time.perf_counter() - start
+    cpu = cpu_seconds(server_pid) - cpu_start
+    conn.close()
+    print(f"{label:13} {done / elapsed:9.0f} updates/s   server CPU {cpu / done * 1e6:6.1f} us/update")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=256)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--mode", default="threaded", choices=["threaded", "asyncio"])
+    args = parser.parse_args()
+
+    port, push_port = free_port(), free_port()
+    server = subprocess.Popen(
+        [sys.executable, "server.py", "--mode", args.mode, "--port", str(port), "--push-port", str(push_port),
+         "--no-cache"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server("127.0.0.1", port)
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        pids = []
+        for _ in range(args.players):
+            conn.request("GET", "/register")
+            pids.append(json.loads(conn.getresponse().read())["id"])
+        conn.close()
+        print(f"{args.players} players, batches of {args.batch}, {args.mode} server")
+        for label in ("single", "batch json", "batch binary", "relay"):
+            run(label, port, push_port, server.pid, pids, args.batch, args.duration)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Scene-transition stall and resident memory of background music: the old
+SoundManager.play_bgm, which decoded the whole track into a pygame Sound,
+against the streaming pygame.mixer.music path with its fade. Each variant
+runs in a fresh process through a menu -> game -> battle -> game -> menu
+sequence; the stall is the time the main thread spends in play_bgm (and,
+for streaming, in the update() that starts the next track after the fade).
+
+Run from the project root:
+    python -m benchmarks.bgm_switch
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+TRACKS = [
+    "RBY 101 Opening (Part 1).ogg",         # menu
+    "RBY 103 Pallet Town.ogg",              # game
+    "RBY 110 Battle! (Wild Pokemon).ogg",   # battle
+    "RBY 103 Pallet Town.ogg",
+    "RBY 101 Opening (Part 1).ogg",
+]
+SCENE_TIME = 1.0    # seconds spent in each scene, 60 updates per second
+
+
+def rss_mib() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def run_decoded() -> None:
+    from src.utils import GameSettings, load_sound
+
+    pg.mixer.init()
+    current = None
+    stalls = []
+    rss = [rss_mib()]
+    for track in TRACKS:
+        start = time.perf_counter()
+        if current:
+            current.stop()
+        audio = load_sound(track)
+        audio.set_volume(GameSettings.AUDIO_VOLUME)
+        audio.play(-1)
+        current = audio
+        stalls.append(time.perf_counter() - start)
+        time.sleep(SCENE_TIME)
+        rss.append(rss_mib())
+    report("decoded Sound", stalls, rss)
+
+
+def run_streamed() -> None:
+    from src.core.services import sound_manager
+
+    stalls = []
+    rss = [rss_mib()]
+    for track in TRACKS:
+        start = time.perf_counter()
+        sound_manager.play_bgm(track)
+        stall = time.perf_counter() - start
+        for _ in range(int(SCENE_TIME * 60)):
+            start = time.perf_counter()
+            sound_manager.update()
+            stall = max(stall, time.perf_counter() - start)
+            time.sleep(1 / 60)
+        stalls.append(stall)
+        rss.append(rss_mib())
+    report("streamed music", stalls, rss)
+
+
+def report(label: str, stalls: list[float], rss: list[float]) -> None:
+    # rss[0] is taken before the first track, the rest after each scene
+    print(f"{label:15} stall per switch: mean {sum(stalls) / len(stalls) * 1000:6.1f} ms, "
+          f"max {max(stalls) * 1000:6.1f} ms   RSS over start: max {max(rss) - rss[0]:+6.1f} MiB, "
+          f"end {rss[-1] - rss[0]:+6.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--variant", choices=["decoded", "streamed"])
+    args = parser.parse_args()
+
+    if args.variant is None:
+        for variant in ("decoded", "streamed"):
+            subprocess.run([sys.executable, "-m", "benchmarks.bgm_switch", "--variant", variant], check=True)
+    elif args.variant == "decoded":
+        run_decoded()
+    else:
+        run_streamed()
+
+
+if __name__ == "__main__":
+    main()
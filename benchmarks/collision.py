@@ -0,0 +1,77 @@
+"""
+Compare the old linear rect scan in Map.check_collision against the tile
+occupancy grid on a synthetic 500x500-tile map.
+
+Run from the project root:
+    python -m benchmarks.collision
+"""
+import os
+import random
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+from src.maps.map import Map
+from src.utils import GameSettings
+
+MAP_TILES = 500
+BLOCKED_RATIO = 0.2
+QUERIES = 2000
+
+
+def build_map() -> Map:
+    ts = GameSettings.TILE_SIZE
+    rng = random.Random(0)
+    m = Map.__new__(Map)
+    m.tmxdata = SimpleNamespace(width=MAP_TILES, height=MAP_TILES)
+    m._collision_map = [
+        pg.Rect(x * ts, y * ts, ts, ts)
+        for y in range(MAP_TILES)
+        for x in range(MAP_TILES)
+        if rng.random() < BLOCKED_RATIO
+    ]
+    m._collision_grid = m._create_collision_grid(m._collision_map)
+    return m
+
+
+def linear_scan(m: Map, rect: pg.Rect) -> bool:
+    for coll_rect in m._collision_map:
+        if rect.colliderect(coll_rect):
+            return True
+    return False
+
+
+def main() -> None:
+    ts = GameSettings.TILE_SIZE
+    m = build_map()
+    rng = random.Random(1)
+    queries = [
+        pg.Rect(rng.randrange(MAP_TILES * ts), rng.randrange(MAP_TILES * ts), ts, ts)
+        for _ in range(QUERIES)
+    ]
+    print(f"{MAP_TILES}x{MAP_TILES} tiles, {len(m._collision_map)} collision rects, {QUERIES} queries")
+
+    for rect in queries:
+        assert linear_scan(m, rect) == m.check_collision(rect)
+
+    start = time.perf_counter()
+    for rect in queries:
+        linear_scan(m, rect)
+    linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for rect in queries:
+        m.check_collision(rect)
+    grid = time.perf_counter() - start
+
+    print(f"linear scan : {linear / QUERIES * 1e6:10.2f} us/query")
+    print(f"tile grid   : {grid / QUERIES * 1e6:10.2f} us/query")
+    print(f"speedup     : {linear / grid:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+How smooth a remote player looks when drawn at 60 FPS, through the real
+OnlineManager code path: the remote player sends its position every
+SEND_INTERVAL, our client polls every POLL_INTERVAL and hands each answer
+to _refresh_list_players, and every frame reads get_list_players (raw) or
+get_interpolated_players. Packets get random network jitter, some position
+updates are lost, and the player stops for a second every few seconds.
+
+The stutter column is the spread of (drawn step - true step) per frame, 0
+for perfectly even motion; the error column is the distance from where the
+player really was INTERPOLATION_DELAY ago (0 delay for the raw row).
+
+Run from the project root:
+    python -m benchmarks.interpolation
+"""
+import heapq
+import math
+import random
+from types import SimpleNamespace
+from unittest import mock
+
+from src.core.managers.online_manager import INTERPOLATION_DELAY, POLL_INTERVAL, SEND_INTERVAL, OnlineManager
+
+SPEED = 200.0       # pixels per second, a walking player
+WALK, STAND = 3.0, 1.0  # seconds walking, then standing, repeated
+DURATION = 20.0
+FPS = 60
+LATENCY = 0.02      # seconds one way
+JITTER = 0.03       # seconds of random extra latency per packet
+DROP_RATE = 0.05    # position updates lost on the way to the server
+RUNS = 5            # random seeds averaged
+PID = 1
+UPDATE, READ, ANSWER = 0, 1, 2
+
+
+def true_position(t: float) -> tuple[float, float]:
+    # Walk around a large circle so direction keeps changing
+    cycles, into = divmod(max(t, 0.0), WALK + STAND)
+    distance = SPEED * (cycles * WALK + min(into, WALK))
+    radius = 400.0
+    angle = distance / radius
+    return radius * math.cos(angle), radius * math.sin(angle)
+
+
+def events(rng: random.Random) -> list[tuple[float, int, object]]:
+    '''
+    Heap of (time, kind, payload): UPDATE when a position update reaches the
+    server, READ when a poll reaches it (payload: when the answer arrives).
+    '''
+    out = []
+    t = rng.uniform(0, SEND_INTERVAL)
+    while t < DURATION:
+        if rng.random() >= DROP_RATE:
+            out.append((t + LATENCY + rng.uniform(0, JITTER), UPDATE, true_position(t)))
+        t += SEND_INTERVAL
+    t = rng.uniform(0, POLL_INTERVAL)
+    while t < DURATION:
+        at_server = t + LATENCY + rng.uniform(0, JITTER)
+        out.append((at_server, READ, at_server + LATENCY + rng.uniform(0, JITTER)))
+        t += POLL_INTERVAL
+    heapq.heapify(out)
+    return out
+
+
+def run(interpolate: bool, seed: int) -> tuple[float, float]:
+    clock = SimpleNamespace(now=0.0)
+    manager = OnlineManager()
+    manager.player_id = 0
+    server_position = true_position(0.0)
+    pending = events(random.Random(seed))
+
+    deltas = []
+    errors = []
+    last = None
+    with mock.patch("src.core.managers.online_manager.time", SimpleNamespace(monotonic=lambda: clock.now)):
+        for frame in range(int(DURATION * FPS)):
+            now = frame / FPS
+            # Everything that happened up to this frame, in order
+            while pending and pending[0][0] <= now:
+                at, kind, payload = heapq.heappop(pending)
+                if kind == UPDATE:
+                    server_position = payload
+                elif kind == READ:
+                    heapq.heappush(pending, (payload, ANSWER, server_position))
+                else:
+                    x, y = payload
+                    clock.now = at
+                    manager._remote = {PID: {"id": PID, "x": x, "y": y, "map": "map.tmx"}}
+                    manager._refresh_list_players()
+
+            clock.now = now
+            players = manager.get_interpolated_players() if interpolate else manager.get_list_players()
+            if not players or now < 1.0:
+                continue
+            x, y = players[0]["x"], players[0]["y"]
+            shown_time = now - INTERPOLATION_DELAY if interpolate else now
+            tx, ty = true_position(shown_time)
+            errors.append(math.hypot(x - tx, y - ty))
+            if last is not None:
+                step = math.hypot(x - last[0], y - last[1])
+                px, py = true_position(shown_time - 1 / FPS)
+                deltas.append(step - math.hypot(tx - px, ty - py))
+            last = (x, y)
+
+    mean = sum(deltas) / len(deltas)
+    spread = math.sqrt(sum((d - mean) ** 2 for d in deltas) / len(deltas))
+    return spread, sum(errors) / len(errors)
+
+
+def main() -> None:
+    print(f"walking step {SPEED / FPS:.2f} px/frame, "
+          f"updates every {SEND_INTERVAL * 1000:.0f} ms, polls every {POLL_INTERVAL * 1000:.0f} ms")
+    for label, interpolate in (("raw", False), ("interpolated", True)):
+        results = [run(interpolate, seed) for seed in range(RUNS)]
+        spread = sum(r[0] for r in results) / RUNS
+        error = sum(r[1] for r in results) / RUNS
+        print(f"{label:14} stutter {spread:5.2f} px   mean error {error:6.2f} px")
+
+
+if __name__ == "__main__":
+    main()
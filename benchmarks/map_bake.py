@@ -0,0 +1,74 @@
+"""
+Time the full-map tile bake with per-placement scaling (the old
+_render_tile_layer) against the shared per-tile cache in ResourceManager.
+
+Run from the project root:
+    python -m benchmarks.map_bake
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+import pytmx
+
+from src.core.services import resource_manager
+from src.maps.map import Map
+from src.utils import GameSettings
+
+MAPS = ["map.tmx", "happyhappy.tmx"]
+REPEAT = 5
+
+
+def bake_uncached(m: Map, target: pg.Surface) -> None:
+    ts = GameSettings.TILE_SIZE
+    for layer in m.tmxdata.visible_layers:
+        if isinstance(layer, pytmx.TiledTileLayer):
+            for x, y, gid in layer:
+                if gid == 0:
+                    continue
+                image = m.tmxdata.get_tile_image_by_gid(gid)
+                if image is None:
+                    continue
+                target.blit(pg.transform.scale(image, (ts, ts)), (x * ts, y * ts))
+
+
+def best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    pg.init()
+    pg.display.set_mode((1, 1))
+    for name in MAPS:
+        m = Map(name, [], None)
+        target = pg.Surface((m.pixel_w, m.pixel_h), pg.SRCALPHA)
+        placements = sum(
+            1 for layer in m.tmxdata.visible_layers
+            if isinstance(layer, pytmx.TiledTileLayer)
+            for _, _, gid in layer if gid
+        )
+
+        before = best_of(lambda: bake_uncached(m, target))
+
+        def cold() -> None:
+            resource_manager._tiles.clear()
+            m._render_all_layers(target)
+
+        after_cold = best_of(cold)
+        after_warm = best_of(lambda: m._render_all_layers(target))
+
+        print(f"{name:16} {placements:6} placements {len(m._tile_keys):4} unique tiles   "
+              f"before {before * 1000:7.1f} ms   after (cold cache) {after_cold * 1000:7.1f} ms   "
+              f"after (warm cache) {after_warm * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
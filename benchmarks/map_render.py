@@ -0,0 +1,109 @@
+"""
+Compare the old whole-map prebake against the chunked renderer: load time
+(Map construction, including the minimap, plus the full bake for prebake),
+frame time of a camera sweep and resident memory of the loaded map, on the
+shipped maps and on a synthetic large map (map.tmx tiled to 200x200).
+
+Each (map, mode) pair runs in its own process so RSS numbers do not mix.
+
+Run from the project root:
+    python -m benchmarks.map_render
+"""
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+MAPS = ["map.tmx", "gym.tmx", "mountain.tmx", "happyhappy.tmx", "synthetic:200"]
+FRAMES = 300
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def load_map(name: str):
+    import src.maps.map as map_module
+    from src.maps.map import Map
+
+    if not name.startswith("synthetic:"):
+        return Map(name, [], None)
+
+    size = int(name.split(":")[1])
+    base_load = map_module.load_tmx
+
+    def load_large(path: str):
+        tmx = base_load("map.tmx")
+        for layer in tmx.layers:
+            layer.data = [
+                [layer.data[y % layer.height][x % layer.width] for x in range(size)]
+                for y in range(size)
+            ]
+            layer.width = layer.height = size
+        tmx.width = tmx.height = size
+        return tmx
+
+    map_module.load_tmx = load_large
+    try:
+        return Map(name, [], None)
+    finally:
+        map_module.load_tmx = base_load
+
+
+def run_one(name: str, mode: str) -> None:
+    import pygame as pg
+    from src.utils import GameSettings, PositionCamera
+
+    pg.init()
+    pg.display.set_mode((1, 1))
+    GameSettings.DRAW_HITBOXES = False
+    screen = pg.Surface((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+
+    base_rss = rss_mb()
+    start = time.perf_counter()
+    m = load_map(name)
+    if mode == "prebake":
+        full = pg.Surface((m.pixel_w, m.pixel_h), pg.SRCALPHA)
+        m._render_all_layers(full)
+        draw = lambda cam: screen.blit(full, (-cam.x, -cam.y))
+    else:
+        draw = lambda cam: m.draw(screen, cam)
+    load = time.perf_counter() - start
+
+    max_x = max(0, m.pixel_w - GameSettings.SCREEN_WIDTH)
+    max_y = max(0, m.pixel_h - GameSettings.SCREEN_HEIGHT)
+    frames = []
+    # First sweep includes lazy chunk baking, the second one is steady state
+    for _ in range(2):
+        start = time.perf_counter()
+        for i in range(FRAMES):
+            t = i / FRAMES
+            draw(PositionCamera(int(max_x * t), int(max_y * t)))
+        frames.append((time.perf_counter() - start) / FRAMES)
+
+    print(f"{name:16} {mode:8} load {load * 1000:8.1f} ms   "
+          f"frame cold {frames[0] * 1000:6.3f} ms  warm {frames[1] * 1000:6.3f} ms   "
+          f"map memory {rss_mb() - base_rss:7.1f} MB")
+
+
+def main() -> None:
+    if len(sys.argv) == 3:
+        run_one(sys.argv[1], sys.argv[2])
+        return
+    for name in MAPS:
+        for mode in ("prebake", "chunked"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.map_render", name, mode],
+                capture_output=True, text=True,
+            )
+            lines = [l for l in out.stdout.splitlines() if l.startswith(name)]
+            print(lines[-1] if lines else f"{name:16} {mode:8} failed: {out.stderr.strip()[-200:]}")
+
+
+if __name__ == "__main__":
+    main()
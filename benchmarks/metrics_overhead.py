@@ -0,0 +1,93 @@
+"""
+Cost of the /metrics instrumentation. Times Metrics.observe() on its own,
+then runs server.py with and without --no-metrics while keep-alive clients
+send POST/GET /players back to back as fast as the server answers, and
+reports throughput and server CPU per request for both.
+
+Run from the project root:
+    python -m benchmarks.metrics_overhead --clients 8 --duration 5
+"""
+import argparse
+import http.client
+import json
+import subprocess
+import sys
+import threading
+import time
+import timeit
+
+from benchmarks.push_vs_poll import cpu_seconds
+from benchmarks.server_load import free_port, wait_for_server
+from server.metrics import Metrics
+
+
+def time_observe() -> None:
+    for enabled in (True, False):
+        metrics = Metrics(enabled)
+        number = 200000
+        seconds = min(timeit.repeat(
+            lambda: metrics.observe("GET", "/players?map=map.tmx", 200, 0.0004, 0, 1500),
+            number=number, repeat=3,
+        ))
+        print(f"observe() {'on ' if enabled else 'off'}: {seconds / number * 1e6:.2f} us/call")
+
+
+def client(port: int, index: int, stop: threading.Event, counts: list[int]) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.request("GET", "/register")
+    pid = json.loads(conn.getresponse().read())["id"]
+    x = 0.0
+    while not stop.is_set():
+        x += 1.0
+        body = json.dumps({"id": pid, "x": x, "y": 0.0, "map": "map.tmx"}).encode()
+        conn.request("POST", "/players", body=body, headers={"Content-Type": "application/json"})
+        conn.getresponse().read()
+        conn.request("GET", "/players?map=map.tmx")
+        conn.getresponse().read()
+        counts[index] += 2
+    conn.close()
+
+
+def run(mode: str, metrics: bool, clients: int, duration: float) -> None:
+    port = free_port()
+    command = [sys.executable, "server.py", "--mode", mode, "--port", str(port), "--push-port", "0"]
+    if not metrics:
+        command.append("--no-metrics")
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server("127.0.0.1", port)
+        stop = threading.Event()
+        counts = [0] * clients
+        threads = [threading.Thread(target=client, args=(port, i, stop, counts)) for i in range(clients)]
+        cpu_start, start = cpu_seconds(server.pid), time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        cpu = cpu_seconds(server.pid) - cpu_start
+    finally:
+        server.terminate()
+        server.wait()
+
+    requests = sum(counts)
+    print(f"{mode:8} metrics {'on ' if metrics else 'off'}: {requests / elapsed:7.0f} req/s   "
+          f"server CPU {cpu / requests * 1e6:6.1f} us/req")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    time_observe()
+    for mode in ("threaded", "asyncio"):
+        for metrics in (False, True):
+            run(mode, metrics, args.clients, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Throughput of server.py --mode multiprocess as worker processes are added.
+Load comes from separate client processes (so the load generator is not
+limited by one interpreter either), each sending POST/GET /players back
+to back on a keep-alive connection. Compare against --mode threaded, which
+is one process. Scaling needs free cores: on an N-core Linux box expect
+throughput to grow up to about N workers, minus the cores the clients use.
+
+Run from the project root:
+    python -m benchmarks.multiprocess_load --clients 16 --workers 1 2 4 8
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.server_load import free_port, wait_for_server
+
+MAPS = ["map.tmx", "gym.tmx", "mountain.tmx", "happyhappy.tmx"]
+
+
+def client(port: int, index: int, start_at: float, stop_at: float, counts) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.request("GET", "/register")
+    pid = json.loads(conn.getresponse().read())["id"]
+    map_name = MAPS[index % len(MAPS)]
+    x = 0.0
+    done = 0
+    while time.time() < start_at:
+        time.sleep(0.01)
+    while time.time() < stop_at:
+        x += 1.0
+        body = json.dumps({"id": pid, "x": x, "y": 0.0, "map": map_name}).encode()
+        conn.request("POST", "/players", body=body, headers={"Content-Type": "application/json"})
+        conn.getresponse().read()
+        conn.request("GET", f"/players?map={map_name}")
+        conn.getresponse().read()
+        done += 2
+    counts[index] = done
+    conn.close()
+
+
+def run(label: str, server_args: list[str], clients: int, duration: float) -> None:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "server.py", "--port", str(port), "--push-port", "0", *server_args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server("127.0.0.1", port)
+        ctx = multiprocessing.get_context("fork")
+        counts = ctx.Array("q", clients)
+        start_at = time.time() + 1.0
+        procs = [
+            ctx.Process(target=client, args=(port, i, start_at, start_at + duration, counts))
+            for i in range(clients)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"{label:16} {sum(counts) / duration:8.0f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} client processes")
+    run("threaded", ["--mode", "threaded"], args.clients, args.duration)
+    for workers in args.workers:
+        run(f"{workers} worker(s)", ["--mode", "multiprocess", "--workers", str(workers)], args.clients, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Requests per second and p50/p99 latency of the client's /players calls
+against the local server.py, with a fresh connection per request (plain
+requests.get/post, the old OnlineManager) and with a pooled keep-alive
+requests.Session (the current one).
+
+Run from the project root:
+    python -m benchmarks.online_http
+"""
+import importlib.util
+import statistics
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import requests
+
+REQUESTS = 2000
+
+
+def start_server() -> str:
+    # server.py shares its name with the server/ package, so load it by path
+    spec = importlib.util.spec_from_file_location("server_main", "server.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.Handler.log_message = lambda *args: None
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), module.Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def run(label: str, client, base: str, pid: int) -> None:
+    latencies = []
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        t = time.perf_counter()
+        if i % 2:
+            client.post(f"{base}/players", json={"id": pid, "x": i, "y": 0, "map": "map.tmx"}, timeout=5)
+        else:
+            client.get(f"{base}/players", timeout=5)
+        latencies.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:22} {REQUESTS / total:8.0f} req/s   p50 {p50 * 1000:6.3f} ms   p99 {p99 * 1000:6.3f} ms")
+
+
+def main() -> None:
+    base = start_server()
+    pid = requests.get(f"{base}/register", timeout=5).json()["id"]
+    run("new connection (before)", requests, base, pid)
+    with requests.Session() as session:
+        run("keep-alive session", session, base, pid)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Run OnlineManager against a deliberately slow local stand-in server and
+report how long the game loop's OnlineManager.update() call takes (the
+pass/fail version is tests/test_online_manager.py).
+
+Run from the project root:
+    python -m benchmarks.online_slow_server
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.core.managers.online_manager import OnlineManager
+
+SERVER_DELAY = 1.0      # seconds every /players request takes
+FRAMES = 180            # 3 seconds at 60 FPS
+FRAME_TIME = 1 / 60
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    posts = 0
+
+    def log_message(self, fmt, *args):
+        return
+
+    def do_GET(self):
+        if self.path == "/register":
+            self._json({"message": "registration successful", "id": 0})
+            return
+        time.sleep(SERVER_DELAY)
+        self._json({"players": {}})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        SlowHandler.posts += 1
+        time.sleep(SERVER_DELAY)
+        self._json({"success": True})
+
+    def _json(self, obj: object) -> None:
+        data = json.dumps(obj).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    manager = OnlineManager()
+    manager.base = f"http://127.0.0.1:{server.server_address[1]}"
+    manager.enter()
+
+    worst = 0.0
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        manager.update(float(frame), 0.0, "map.tmx")
+        manager.get_list_players()
+        worst = max(worst, time.perf_counter() - start)
+        time.sleep(FRAME_TIME)
+
+    manager.exit()
+    server.shutdown()
+    print(f"server delay {SERVER_DELAY * 1000:.0f} ms per request, {FRAMES} frames")
+    print(f"worst update() + get_list_players() call: {worst * 1000:.3f} ms")
+    print(f"position POSTs that reached the server: {SlowHandler.posts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Lock contention in server/playerHandler.py: writer threads post positions
+for random players while reader threads list a map and ask for deltas,
+the way the threaded server's handler threads do. Compares a single
+shard (one lock for all writers) with the default SHARD_COUNT and reports
+throughput and writer latency percentiles.
+
+Run from the project root:
+    python -m benchmarks.player_contention --writers 8 --readers 8
+"""
+import argparse
+import random
+import threading
+import time
+
+from server import playerHandler
+
+MAPS = ["map.tmx", "gym.tmx", "mountain.tmx", "happyhappy.tmx"]
+
+
+def run(shards: int, players: int, writers: int, readers: int, duration: float) -> None:
+    playerHandler.SHARD_COUNT = shards
+    handler = playerHandler.PlayerHandler()
+    pids = [handler.register() for _ in range(players)]
+    for pid in pids:
+        handler.update(pid, 0.0, 0.0, MAPS[pid % len(MAPS)])
+
+    stop = threading.Event()
+    write_latencies: list[list[float]] = [[] for _ in range(writers)]
+    read_counts = [0] * readers
+
+    def writer(index: int) -> None:
+        rng = random.Random(index)
+        latencies = write_latencies[index]
+        while not stop.is_set():
+            pid = rng.choice(pids)
+            start = time.perf_counter()
+            handler.update(pid, rng.uniform(0, 3000), rng.uniform(0, 3000), MAPS[pid % len(MAPS)])
+            latencies.append(time.perf_counter() - start)
+
+    def reader(index: int) -> None:
+        map_name = MAPS[index % len(MAPS)]
+        seq = None
+        while not stop.is_set():
+            seq = handler.players_since(seq, map_name)["seq"]
+            handler.list_players(map_name)
+            read_counts[index] += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    latencies = sorted(l for per_thread in write_latencies for l in per_thread)
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1e6
+    print(f"{shards:3} shard(s): {len(latencies) / duration:9.0f} writes/s  {sum(read_counts) / duration:7.0f} reads/s  "
+          f"write p50 {pct(0.5):6.1f} us  p99 {pct(0.99):8.1f} us  max {latencies[-1] * 1e6:9.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    default_shards = playerHandler.SHARD_COUNT
+    for shards in (1, default_shards):
+        run(shards, args.players, args.writers, args.readers, args.duration)
+    playerHandler.SHARD_COUNT = default_shards
+
+
+if __name__ == "__main__":
+    main()
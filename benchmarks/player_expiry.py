@@ -0,0 +1,54 @@
+"""
+Player expiry in server/playerHandler.py: times one cleaner sweep when
+nobody is due, against the old scan over every player. The expiry rules
+themselves are covered by tests/test_player_expiry.py.
+
+Run from the project root:
+    python -m benchmarks.player_expiry
+"""
+import time
+
+from server.playerHandler import PlayerHandler
+
+TIMEOUT = 60.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def time_sweeps(players: int) -> None:
+    clock = FakeClock()
+    handler = PlayerHandler(timeout_seconds=TIMEOUT, clock=clock)
+    for _ in range(players):
+        handler.update(handler.register(), 1.0, 1.0, "map.tmx")
+    clock.now += TIMEOUT / 2
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        handler.expire()
+    heap_us = (time.perf_counter() - start) / rounds * 1e6
+
+    # What the cleaner used to do every interval
+    start = time.perf_counter()
+    for _ in range(rounds):
+        now = clock()
+        for shard in handler._shards:
+            with shard.lock:
+                _ = [pid for pid, p in shard.players.items() if now - p.last_update >= TIMEOUT]
+    scan_us = (time.perf_counter() - start) / rounds * 1e6
+    print(f"{players:6} players, none due: heap sweep {heap_us:8.1f} us   full scan {scan_us:8.1f} us")
+
+
+def main() -> None:
+    for players in (100, 1000, 10000):
+        time_sweeps(players)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Server CPU for GET /players with 50 clients polling the same map, with
+the encoded-response cache off (--no-cache), on, and on with clients
+sending the ETag back in If-None-Match (as OnlineManager does). Clients
+poll full snapshots, or since=<seq> deltas with --delta; a few of them
+keep moving so the state changes every SEND_INTERVAL.
+
+Run from the project root:
+    python -m benchmarks.players_cache --clients 50 --interval 0.02
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks.push_vs_poll import cpu_seconds
+from benchmarks.server_load import free_port, wait_for_server
+from src.core.managers.online_manager import SEND_INTERVAL
+
+
+class Stats:
+    def __init__(self):
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_in = 0
+
+
+async def request(reader, writer, method: str, path: str, body: bytes = b"", etag: str | None = None):
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+    if body:
+        head += "Content-Type: application/json\r\n"
+    if etag:
+        head += f"If-None-Match: {etag}\r\n"
+    writer.write((head + "\r\n").encode("latin-1") + body)
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers.get("content-length", "0")))
+    return status, headers, data
+
+
+async def client(port: int, moving: bool, use_etag: bool, delta: bool, interval: float,
+                 stats: Stats, deadline: float) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, _, data = await request(reader, writer, "GET", "/register")
+    pid = json.loads(data)["id"]
+    x, last_send, first = 0.0, 0.0, True
+    seq, etag = None, None
+    while time.monotonic() < deadline:
+        tick = time.monotonic()
+        if first or (moving and tick - last_send >= SEND_INTERVAL):
+            x += 4.0
+            body = json.dumps({"id": pid, "x": x, "y": 0.0, "map": "map.tmx"}).encode()
+            await request(reader, writer, "POST", "/players", body)
+            last_send, first = tick, False
+        path = "/players?map=map.tmx"
+        if delta and seq is not None:
+            path += f"&since={seq}"
+        status, headers, data = await request(reader, writer, "GET", path, etag=etag if use_etag else None)
+        stats.requests += 1
+        stats.bytes_in += len(data)
+        if status == 304:
+            stats.not_modified += 1
+        else:
+            seq = json.loads(data)["seq"]
+            etag = headers.get("etag")
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - tick)))
+    writer.close()
+
+
+async def run(label: str, cache: bool, use_etag: bool, args: argparse.Namespace) -> None:
+    port = free_port()
+    command = [sys.executable, "server.py", "--port", str(port), "--push-port", "0", "--mode", args.mode]
+    if not cache:
+        command.append("--no-cache")
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server("127.0.0.1", port)
+        stats = Stats()
+        deadline = time.monotonic() + args.duration
+        cpu_start, start = cpu_seconds(server.pid), time.monotonic()
+        moving = max(1, args.clients // 10)
+        await asyncio.gather(*(
+            client(port, i < moving, use_etag, args.delta, args.interval, stats, deadline)
+            for i in range(args.clients)
+        ))
+        elapsed = time.monotonic() - start
+        cpu = cpu_seconds(server.pid) - cpu_start
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"{label:16} {stats.requests / elapsed:6.0f} polls/s   server CPU {cpu / elapsed * 100:5.1f} %   "
+          f"{cpu / stats.requests * 1e6:6.1f} us/poll   {stats.not_modified / stats.requests * 100:5.1f} % 304   "
+          f"{stats.bytes_in / stats.requests:6.0f} body bytes/poll")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between polls per client")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--delta", action="store_true", help="poll with since=<seq>")
+    parser.add_argument("--mode", choices=["threaded", "asyncio"], default="asyncio")
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, one poll each per {args.interval * 1000:.0f} ms, "
+          f"{'delta' if args.delta else 'full'} answers, {args.mode} server")
+    asyncio.run(run("no cache", False, False, args))
+    asyncio.run(run("cache", True, False, args))
+    asyncio.run(run("cache + ETag", True, True, args))
+
+
+if __name__ == "__main__":
+    main()
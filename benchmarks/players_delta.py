@@ -0,0 +1,67 @@
+"""
+Payload size and server CPU per GET /players poll with full snapshots
+versus since=<seq> deltas, for 50 idle and for 50 moving clients, all on
+the same map. Runs server.py's routing in-process (no sockets) so only
+the handler and JSON encoding are measured.
+
+Run from the project root:
+    python -m benchmarks.players_delta
+"""
+import importlib.util
+import json
+import time
+
+CLIENTS = 50
+ROUNDS = 200    # every round each client polls once
+
+
+def load_server():
+    # server.py shares its name with the server/ package, so load it by path
+    spec = importlib.util.spec_from_file_location("server_main", "server.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # Measure building and encoding every answer, not the response cache
+    module.RESPONSE_CACHE.enabled = False
+    return module
+
+
+def run(server, moving: bool, delta: bool) -> tuple[float, float]:
+    handler = server.PLAYER_HANDLER
+    ids = [handler.register() for _ in range(CLIENTS)]
+    for pid in ids:
+        handler.update(pid, float(pid), 0.0, "map.tmx")
+    seqs = {pid: None for pid in ids}
+
+    total_bytes = 0
+    cpu = 0.0
+    for r in range(ROUNDS):
+        if moving:
+            for pid in ids:
+                handler.update(pid, float(pid + r + 1), 0.0, "map.tmx")
+        for pid in ids:
+            path = "/players?map=map.tmx"
+            if delta and seqs[pid] is not None:
+                path += f"&since={seqs[pid]}"
+            start = time.process_time()
+            _, obj = server.handle_get(path)
+            data = json.dumps(obj).encode("utf-8")
+            cpu += time.process_time() - start
+            total_bytes += len(data)
+            seqs[pid] = obj["seq"]
+
+    polls = ROUNDS * CLIENTS
+    return total_bytes / polls, cpu / polls
+
+
+def main() -> None:
+    for moving in (False, True):
+        for delta in (False, True):
+            server = load_server()
+            size, cpu = run(server, moving, delta)
+            server.PLAYER_HANDLER.stop()
+            print(f"{CLIENTS} {'moving' if moving else 'idle':6} clients, {'delta' if delta else 'full':5} polls: "
+                  f"{size:8.0f} bytes/poll   {cpu * 1e6:7.1f} us CPU/poll")
+
+
+if __name__ == "__main__":
+    main()
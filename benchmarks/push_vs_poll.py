@@ -0,0 +1,155 @@
+"""
+Compare the HTTP polling model against the raw-TCP push channel with many
+simulated clients spread over the four maps. Reports network bytes per
+second (both directions, as seen by the clients) and server CPU usage.
+
+Run from the project root:
+    python -m benchmarks.push_vs_poll --clients 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from src.core.managers.online_manager import POLL_INTERVAL, SEND_INTERVAL
+
+MAPS = ["map.tmx", "gym.tmx", "mountain.tmx", "happyhappy.tmx"]
+
+
+class Stats:
+    def __init__(self):
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.messages = 0
+
+
+async def http_request(reader, writer, stats: Stats, method: str, path: str, body: bytes = b"") -> bytes:
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+    if body:
+        head += "Content-Type: application/json\r\n"
+    request = (head + "\r\n").encode("latin-1") + body
+    writer.write(request)
+    stats.bytes_out += len(request)
+
+    length = 0
+    header_bytes = 0
+    while True:
+        line = await reader.readline()
+        header_bytes += len(line)
+        if line in (b"\r\n", b""):
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    data = await reader.readexactly(length)
+    stats.bytes_in += header_bytes + length
+    stats.messages += 1
+    return data
+
+
+async def register(port: int, stats: Stats) -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    pid = json.loads(await http_request(reader, writer, stats, "GET", "/register"))["id"]
+    writer.close()
+    return pid
+
+
+async def poll_client(index: int, port: int, moving: bool, stats: Stats, deadline: float) -> None:
+    pid = await register(port, stats)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    map_name = MAPS[index % len(MAPS)]
+    x, last_send, first = 0.0, 0.0, True
+    while time.monotonic() < deadline:
+        tick = time.monotonic()
+        if first or (moving and tick - last_send >= SEND_INTERVAL):
+            x += 4.0
+            body = json.dumps({"id": pid, "x": x, "y": 0.0, "map": map_name}).encode()
+            await http_request(reader, writer, stats, "POST", "/players", body)
+            last_send, first = tick, False
+        await http_request(reader, writer, stats, "GET", "/players")
+        await asyncio.sleep(max(0.0, POLL_INTERVAL - (time.monotonic() - tick)))
+    writer.close()
+
+
+async def push_client(index: int, port: int, push_port: int, moving: bool, stats: Stats, deadline: float) -> None:
+    pid = await register(port, stats)
+    reader, writer = await asyncio.open_connection("127.0.0.1", push_port)
+
+    async def receive() -> None:
+        async for line in reader:
+            stats.bytes_in += len(line)
+            stats.messages += 1
+
+    receiver = asyncio.create_task(receive())
+    map_name = MAPS[index % len(MAPS)]
+    x, first = 0.0, True
+    hello = json.dumps({"type": "hello", "id": pid}).encode() + b"\n"
+    writer.write(hello)
+    stats.bytes_out += len(hello)
+    while time.monotonic() < deadline:
+        if first or moving:
+            x += 4.0
+            line = json.dumps({"type": "pos", "x": x, "y": 0.0, "map": map_name}, separators=(",", ":")).encode() + b"\n"
+            writer.write(line)
+            stats.bytes_out += len(line)
+            first = False
+        await asyncio.sleep(SEND_INTERVAL)
+    receiver.cancel()
+    writer.close()
+
+
+def cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run_model(model: str, clients: int, moving_ratio: float, duration: float) -> None:
+    port, push_port = free_port(), free_port()
+    server = subprocess.Popen(
+        [sys.executable, "server.py", "--port", str(port), "--push-port", str(push_port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        await asyncio.sleep(1.0)
+        stats = Stats()
+        deadline = time.monotonic() + duration
+        cpu_start, start = cpu_seconds(server.pid), time.monotonic()
+        moving = int(clients * moving_ratio)
+        if model == "poll":
+            tasks = [poll_client(i, port, i < moving, stats, deadline) for i in range(clients)]
+        else:
+            tasks = [push_client(i, port, push_port, i < moving, stats, deadline) for i in range(clients)]
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - start
+        cpu = cpu_seconds(server.pid) - cpu_start
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{model:5}: {clients} clients ({moving} moving) for {elapsed:.1f} s")
+    print(f"       in  {stats.bytes_in / elapsed / 1024:9.1f} KiB/s   out {stats.bytes_out / elapsed / 1024:8.1f} KiB/s   "
+          f"{stats.messages / elapsed:7.0f} msgs/s   server CPU {cpu / elapsed * 100:5.1f} %")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--moving", type=float, default=0.25, help="fraction of clients that keep moving")
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+    for model in ("poll", "push"):
+        asyncio.run(run_model(model, args.clients, args.moving, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Headless per-frame draw time of the battle scene and the bag overlay:
+
+    uncached      scaled images dropped from ResourceManager.get_scaled and
+                  (battle) the static layer rebuilt before every frame, as
+                  the scenes drew before either cache existed
+    static redraw (battle) scaled images cached, static layer rebuilt
+                  every frame
+    cached        both caches warm; the battle static layer is only rebuilt
+                  when names, levels or HP change
+
+Run from the project root:
+    python -m benchmarks.scene_draw --frames 300
+"""
+import argparse
+import json
+import os
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+from src.core.services import resource_manager
+from src.utils import GameSettings
+
+SAVE = "saves/game0.json"
+
+
+def frame_time(draw, frames: int, before_frame=None) -> float:
+    draw()  # warm up loads and caches
+    start = time.perf_counter()
+    for _ in range(frames):
+        if before_frame is not None:
+            before_frame()
+        draw()
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+
+    from src.scenes.bag_scene import BagScene
+    from src.scenes.battle_scene import BattleScene
+
+    with open(SAVE) as f:
+        bag = json.load(f)["bag"]
+    battle = BattleScene()
+    battle.enemy_sprite = bag["monsters"][0]["sprite_path"].replace("menu_sprites/menusprite", "sprites/sprite")
+    battle.player_sprite = bag["monsters"][1]["sprite_path"].replace("menu_sprites/menusprite", "sprites/sprite")
+    bag_scene = BagScene()
+    bag_scene.game_manager = SimpleNamespace(
+        bag=SimpleNamespace(_monsters_data=bag["monsters"], _items_data=bag["items"])
+    )
+
+    def drop_static_layer() -> None:
+        battle._static_key = None
+
+    def drop_all() -> None:
+        resource_manager._scaled.clear()
+        drop_static_layer()
+
+    runs = [
+        ("battle", "uncached", lambda: battle.draw(screen), drop_all),
+        ("battle", "static redraw", lambda: battle.draw(screen), drop_static_layer),
+        ("battle", "cached", lambda: battle.draw(screen), None),
+        ("bag", "uncached", lambda: bag_scene._draw_bag_content(screen), resource_manager._scaled.clear),
+        ("bag", "cached", lambda: bag_scene._draw_bag_content(screen), None),
+    ]
+    for scene, label, draw, before_frame in runs:
+        ms = frame_time(draw, args.frames, before_frame) * 1000
+        print(f"{scene:7} {label:14} {ms:6.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Load generator for server.py. Simulates N game clients with the real
+client's request pattern: each keeps one keep-alive connection, polls
+GET /players every POLL_INTERVAL and POSTs a moving position at most
+every SEND_INTERVAL. Reports sustained throughput and latency percentiles.
+
+Run from the project root, either against a server it starts itself:
+    python -m benchmarks.server_load --mode threaded --clients 12
+    python -m benchmarks.server_load --mode asyncio --clients 12
+or against one that is already running:
+    python -m benchmarks.server_load --url http://localhost:8989
+"""
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+from src.core.managers.online_manager import POLL_INTERVAL, SEND_INTERVAL
+
+MAPS = ["map.tmx", "gym.tmx", "mountain.tmx", "happyhappy.tmx"]
+
+
+class Client(threading.Thread):
+    def __init__(self, host: str, port: int, index: int, stop: threading.Event):
+        super().__init__(daemon=True)
+        self.conn = http.client.HTTPConnection(host, port, timeout=10)
+        self.index = index
+        self.stop = stop
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.bytes_in = 0
+
+    def request(self, method: str, path: str, body: bytes | None = None) -> bytes:
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        start = time.perf_counter()
+        self.conn.request(method, path, body=body, headers=headers)
+        data = self.conn.getresponse().read()
+        self.latencies.append(time.perf_counter() - start)
+        self.bytes_in += len(data)
+        return data
+
+    def run(self) -> None:
+        pid = json.loads(self.request("GET", "/register"))["id"]
+        map_name = MAPS[self.index % len(MAPS)]
+        x = 0.0
+        last_send = 0.0
+        while not self.stop.is_set():
+            tick = time.perf_counter()
+            try:
+                if tick - last_send >= SEND_INTERVAL:
+                    x += 4.0
+                    body = json.dumps({"id": pid, "x": x, "y": 0.0, "map": map_name}).encode()
+                    self.request("POST", "/players", body)
+                    last_send = tick
+                self.request("GET", "/players")
+            except (OSError, http.client.HTTPException):
+                self.errors += 1
+                self.conn.close()
+            self.stop.wait(max(0.0, POLL_INTERVAL - (time.perf_counter() - tick)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_server(host: str, port: int) -> None:
+    for _ in range(100):
+        try:
+            socket.create_connection((host, port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=12)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--mode", choices=["threaded", "asyncio"], default="threaded")
+    parser.add_argument("--url", help="use an already running server instead of starting one")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = subprocess.Popen(
+            [sys.executable, "server.py", "--mode", args.mode, "--port", str(port)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    try:
+        wait_for_server(host, port)
+        stop = threading.Event()
+        clients = [Client(host, port, i, stop) for i in range(args.clients)]
+        start = time.perf_counter()
+        for c in clients:
+            c.start()
+        time.sleep(args.duration)
+        stop.set()
+        for c in clients:
+            c.join(timeout=10)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    latencies = sorted(l for c in clients for l in c.latencies)
+    errors = sum(c.errors for c in clients)
+    wanted = args.clients * (1 / POLL_INTERVAL + 1 / SEND_INTERVAL)
+    label = args.url or args.mode
+    print(f"{label}: {args.clients} clients for {elapsed:.1f} s")
+    print(f"  throughput {len(latencies) / elapsed:8.0f} req/s (clients want ~{wanted:.0f} req/s), {errors} errors")
+    print(f"  bytes in   {sum(c.bytes_in for c in clients) / elapsed / 1024:8.1f} KiB/s")
+    if latencies:
+        print(f"  latency    p50 {percentile(latencies, 0.50) * 1000:.2f} ms   p95 {percentile(latencies, 0.95) * 1000:.2f} ms   "
+              f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms   max {latencies[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
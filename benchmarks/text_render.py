@@ -0,0 +1,134 @@
+"""
+Per-frame text work in the bag and shop overlays: fonts created, text
+surfaces rendered and Python-level allocations (tracemalloc; SDL pixel
+buffers are not counted) for each drawn frame. "before" draws the labels
+the way the overlays did before ResourceManager.render_text: the bag made
+its two fonts anew every frame and rendered every label, the shop rendered
+every label with the one font it made when the Seller was created.
+"after" is the current code with warm caches.
+
+Run from the project root:
+    python -m benchmarks.text_render --frames 300
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+from src.core.services import resource_manager
+from src.utils import GameSettings, PositionCamera
+
+SAVE = "saves/game0.json"
+
+counts = {"fonts": 0, "renders": 0}
+
+
+class CountingFont(pg.font.Font):
+    def render(self, *args, **kwargs):
+        counts["renders"] += 1
+        return super().render(*args, **kwargs)
+
+
+def counting_sys_font(name, size, bold=False, italic=False):
+    counts["fonts"] += 1
+    path = pg.font.match_font(name, bold, italic) if name else None
+    font = CountingFont(path, size)
+    if bold and path is None:
+        font.set_bold(True)
+    return font
+
+
+class BeforeText:
+    '''
+    Stand-in for resource_manager.render_text that does what the overlays
+    did before it: render every label, with fonts from make_font that are
+    kept until new_frame() if per_frame, for good otherwise.
+    '''
+    def __init__(self, make_font, per_frame: bool):
+        self.make_font = make_font
+        self.per_frame = per_frame
+        self.fonts = {}
+
+    def new_frame(self) -> None:
+        if self.per_frame:
+            self.fonts.clear()
+
+    def render_text(self, text, size, color, name=None, bold=False):
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = self.make_font(name, size)
+        return font.render(text, True, color)
+
+
+def bag_font(name, size):
+    # BagScene called pg.font.Font(None, size) in every draw
+    counts["fonts"] += 1
+    return CountingFont(None, size)
+
+
+def measure(draw, frames: int, before_frame=None) -> tuple[float, float, float, float]:
+    draw()  # warm up loads and caches
+    counts.update(fonts=0, renders=0)
+    tracemalloc.start()
+    allocated = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        if before_frame is not None:
+            before_frame()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        draw()
+        allocated += tracemalloc.get_traced_memory()[1] - base
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    return (elapsed / frames * 1000, counts["fonts"] / frames, counts["renders"] / frames,
+            allocated / frames / 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+    pg.font.SysFont = counting_sys_font
+
+    from src.entities.seller import Seller
+    from src.scenes.bag_scene import BagScene
+
+    with open(SAVE) as f:
+        bag = json.load(f)["bag"]
+    game_manager = SimpleNamespace(bag=SimpleNamespace(
+        _monsters_data=bag["monsters"], _items_data=bag["items"], get_coins=lambda: 99,
+    ))
+    bag_scene = BagScene()
+    bag_scene.game_manager = game_manager
+    seller = Seller(0, 0, game_manager)
+    seller.shop_open = True
+    camera = PositionCamera(0, 0)
+
+    overlays = {
+        "bag": (lambda: bag_scene._draw_bag_content(screen), BeforeText(bag_font, per_frame=True)),
+        # The Seller made its SysFont("Arial", 24) once, in __init__
+        "shop": (lambda: seller.draw(screen, camera), BeforeText(pg.font.SysFont, per_frame=False)),
+    }
+    print(f"{'':11} {'ms/frame':>8} {'fonts':>6} {'renders':>8} {'KiB alloc':>10}  (per frame)")
+    for name, (draw, before) in overlays.items():
+        with mock.patch.object(resource_manager, "render_text", before.render_text):
+            ms, fonts, renders, kib = measure(draw, args.frames, before.new_frame)
+        print(f"{name:4} before {ms:8.2f} {fonts:6.1f} {renders:8.1f} {kib:10.2f}")
+        ms, fonts, renders, kib = measure(draw, args.frames)
+        print(f"{name:4} after  {ms:8.2f} {fonts:6.1f} {renders:8.1f} {kib:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
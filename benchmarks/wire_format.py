@@ -0,0 +1,69 @@
+"""
+JSON versus the binary wire format (shared/wireFormat.py): encode/decode
+time for one position update and one full /players snapshot, and the
+bytes one client sends and receives per tick (one position POST plus one
+full GET /players) with 10, 50 and 200 players on its map. Body bytes
+only; HTTP headers are the same size either way.
+
+Run from the project root:
+    python -m benchmarks.wire_format
+"""
+import json
+import random
+import timeit
+
+from shared.wireFormat import MapTable, decode_players, decode_position, encode_players, encode_position
+
+REPEAT = 20000
+
+
+def snapshot(players: int) -> dict:
+    rng = random.Random(players)
+    return {
+        "seq": 123456,
+        "full": True,
+        "players": {
+            pid: {"id": pid, "x": rng.uniform(0, 3000), "y": rng.uniform(0, 3000), "map": "map.tmx"}
+            for pid in range(players)
+        },
+        "removed": [],
+    }
+
+
+def time_us(fn) -> float:
+    return min(timeit.repeat(fn, number=REPEAT // 10, repeat=5)) / (REPEAT // 10) * 1e6
+
+
+def main() -> None:
+    maps = MapTable()
+    names = maps.names()
+    map_id = maps.id_of("map.tmx")
+
+    position = {"id": 42, "x": 1234.5, "y": 678.25, "map": "map.tmx"}
+    position_json = json.dumps(position).encode("utf-8")
+    position_bin = encode_position(42, 1234.5, 678.25, map_id)
+    print("position update:")
+    print(f"  json    encode {time_us(lambda: json.dumps(position).encode('utf-8')):6.2f} us   "
+          f"decode {time_us(lambda: json.loads(position_json)):6.2f} us   {len(position_json):4} bytes")
+    print(f"  binary  encode {time_us(lambda: encode_position(42, 1234.5, 678.25, map_id)):6.2f} us   "
+          f"decode {time_us(lambda: decode_position(position_bin)):6.2f} us   {len(position_bin):4} bytes")
+
+    answer = snapshot(50)
+    answer_json = json.dumps(answer).encode("utf-8")
+    answer_bin = encode_players(answer, maps)
+    print("/players snapshot, 50 players:")
+    print(f"  json    encode {time_us(lambda: json.dumps(answer).encode('utf-8')):6.2f} us   "
+          f"decode {time_us(lambda: json.loads(answer_json)):6.2f} us   {len(answer_json):4} bytes")
+    print(f"  binary  encode {time_us(lambda: encode_players(answer, maps)):6.2f} us   "
+          f"decode {time_us(lambda: decode_players(answer_bin, names)):6.2f} us   {len(answer_bin):4} bytes")
+
+    print("bytes per client per tick (POST + full GET):")
+    for players in (10, 50, 200):
+        answer = snapshot(players)
+        json_bytes = len(position_json) + len(json.dumps(answer).encode("utf-8"))
+        bin_bytes = len(position_bin) + len(encode_players(answer, maps))
+        print(f"  {players:3} players: json {json_bytes:6}   binary {bin_bytes:6}   ({json_bytes / bin_bytes:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
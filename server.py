@@ -1,75 +1,282 @@
 from server.playerHandler import PlayerHandler
+from server.pushServer import PushServer, PUSH_PORT
+from server.wireFormat import EncodedBody, encode_body
+from shared.wireFormat import BINARY_CONTENT_TYPE, POSITION, MapTable, decode_position, encode_players
+from server.metrics import Metrics
+from server.responseCache import ResponseCache
 
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+import argparse
 import json
+import multiprocessing
+import signal
+import socket
+import sys
+import time
 PORT = 8989
+MAX_BATCH = 1024    # updates per POST /players/batch
 
 PLAYER_HANDLER = PlayerHandler()
 PLAYER_HANDLER.start()
-    
-class Handler(BaseHTTPRequestHandler):
-    # def log_message(self, fmt, *args):
-    #     return
+MAP_TABLE = MapTable()
+METRICS = Metrics()
+RESPONSE_CACHE = ResponseCache()
 
-    def do_GET(self):
-        if self.path == "/":
-            self._json(200, {"status": "ok"})
-            return
-            
-        if self.path == "/register":
+# Routing shared by every server mode: each returns (status code, JSON object),
+# raw bytes for the binary wire format or text (see encode_body in server/wireFormat.py)
+def handle_get(path: str, accept: str = "", if_none_match: str = "") -> tuple[int, object]:
+    url = urlsplit(path)
+    path = url.path
+    if path == "/":
+        return 200, {"status": "ok"}
+
+    if path == "/register":
+        try:
             pid = PLAYER_HANDLER.register()
-            self._json(200, {"message": "registration successful", "id": pid})
-            return
+        except RuntimeError:
+            # Shared player table of the multi-process server is full
+            return 503, {"error": "server_full"}
+        return 200, {"message": "registration successful", "id": pid, "maps": MAP_TABLE.names()}
 
-        if self.path == "/players":
-            self._json(200, {"players": PLAYER_HANDLER.list_players()})
-            return
+    if path == "/players":
+        return list_players(parse_qs(url.query), binary=BINARY_CONTENT_TYPE in accept, if_none_match=if_none_match)
 
-        self._json(404, {"error": "not_found"})
+    if path == "/metrics":
+        return 200, METRICS.render(PLAYER_HANDLER)
 
-    def do_POST(self):
-        if self.path != "/players":
-            self._json(404, {"error": "not_found"})
-            return
+    return 404, {"error": "not_found"}
 
-        length = int(self.headers.get("Content-Length", "0"))
+def list_players(query: dict[str, list[str]], binary: bool = False, if_none_match: str = "") -> tuple[int, object]:
+    # /players?map=<map>[&x=<px>&y=<px>&radius=<px>] narrows the answer to what the client can see.
+    # Every answer carries "seq"; sending it back as since=<seq> returns only what changed
+    # since then ("full": false), with players that left the filter listed in "removed".
+    # Radius queries always answer in full: players can come into range without moving.
+    # Answers are cached encoded until the state changes, and carry an ETag: sending it
+    # back in If-None-Match gets a 304 while nothing changed.
+    map_name = query.get("map", [None])[0]
+    near = None
+    since = None
+    try:
+        if "radius" in query:
+            near = (float(query["x"][0]), float(query["y"][0]), float(query["radius"][0]))
+        if "since" in query:
+            since = int(query["since"][0])
+    except (KeyError, ValueError):
+        return 400, {"error": "bad_query"}
+
+    if not RESPONSE_CACHE.enabled:
+        answer = PLAYER_HANDLER.players_since(since, map_name, near)
+        if binary:
+            return 200, encode_players(answer, MAP_TABLE)
+        return 200, answer
+
+    seq = PLAYER_HANDLER.current_seq()
+    view = (map_name, near, binary)
+    if if_none_match and if_none_match == RESPONSE_CACHE.etag(seq, view):
+        return 304, EncodedBody(b"", BINARY_CONTENT_TYPE if binary else "application/json", if_none_match)
+    key = (view, since)
+    body = RESPONSE_CACHE.get(key, seq)
+    if body is None:
+        answer = PLAYER_HANDLER.players_since(since, map_name, near)
+        body = encode_body(encode_players(answer, MAP_TABLE) if binary else answer)
+        body = body._replace(etag=RESPONSE_CACHE.etag(answer["seq"], view))
+        RESPONSE_CACHE.put(key, answer["seq"], body)
+    return 200, body
+
+def handle_post(path: str, body: bytes, content_type: str = "application/json") -> tuple[int, object]:
+    if path == "/players/batch":
+        return update_players_batch(body, content_type)
+    if path != "/players":
+        return 404, {"error": "not_found"}
+
+    if BINARY_CONTENT_TYPE in content_type:
+        return update_player_binary(body)
+
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except Exception:
+        return 400, {"error": "invalid_json"}
+
+    missing = [k for k in ("id", "x", "y", "map") if k not in data]
+    if missing:
+        return 400, {"error": "bad_fields", "missing": missing}
+
+    try:
+        pid = int(data["id"])
+        x = float(data["x"])
+        y = float(data["y"])
+        map_name = str(data["map"])
+    except (ValueError, TypeError):
+        return 400, {"error": "bad_fields"}
+
+    try:
+        ok = PLAYER_HANDLER.update(pid, x, y, map_name)
+    except ValueError:
+        # Map name that does not fit the multi-process server's shared map table
+        return 400, {"error": "bad_map"}
+    if not ok:
+        return 404, {"error": "player_not_found"}
+
+    return 200, {"success": True}
+
+def update_player_binary(body: bytes) -> tuple[int, object]:
+    if len(body) != POSITION.size:
+        return 400, {"error": "bad_fields"}
+    pid, x, y, map_id = decode_position(body)
+    map_name = MAP_TABLE.name_of(map_id)
+    if map_name is None:
+        return 400, {"error": "unknown_map"}
+
+    ok = PLAYER_HANDLER.update(pid, x, y, map_name)
+    if not ok:
+        return 404, {"error": "player_not_found"}
+
+    return 200, {"success": True}
+
+def update_players_batch(body: bytes, content_type: str) -> tuple[int, object]:
+    # Many updates in one request: a JSON array of {"id", "x", "y", "map"} objects,
+    # or back to back binary position records. Answers one status per item, in order.
+    items: list[tuple[int, float, float, str | None] | None] = []
+    if BINARY_CONTENT_TYPE in content_type:
+        if len(body) % POSITION.size:
+            return 400, {"error": "bad_fields"}
+        if len(body) // POSITION.size > MAX_BATCH:
+            return 400, {"error": "batch_too_large", "max": MAX_BATCH}
+        for pid, x, y, map_id in POSITION.iter_unpack(body):
+            # An id past the table gets a None map, answered as bad_map below
+            items.append((pid, x, y, MAP_TABLE.name_of(map_id)))
+    else:
         try:
-            body = self.rfile.read(length)
             data = json.loads(body.decode("utf-8"))
         except Exception:
-            self._json(400, {"error": "invalid_json"})
-            return
+            return 400, {"error": "invalid_json"}
+        if not isinstance(data, list):
+            return 400, {"error": "expected_array"}
+        if len(data) > MAX_BATCH:
+            return 400, {"error": "batch_too_large", "max": MAX_BATCH}
+        for entry in data:
+            try:
+                items.append((int(entry["id"]), float(entry["x"]), float(entry["y"]), str(entry["map"])))
+            except (KeyError, ValueError, TypeError):
+                items.append(None)
 
-        missing = [k for k in ("id", "x", "y", "map") if k not in data]
-        if missing:
-            self._json(400, {"error": "bad_fields", "missing": missing})
-            return
+    valid = [item for item in items if item is not None and item[3] is not None]
+    applied = iter(PLAYER_HANDLER.update_many(valid))
+    results = []
+    for item in items:
+        if item is None:
+            results.append({"status": 400, "error": "bad_fields"})
+            continue
+        # A map id past the table, or a name the shared map table has no room for
+        ok = next(applied) if item[3] is not None else None
+        if ok is None:
+            results.append({"id": item[0], "status": 400, "error": "bad_map"})
+        elif ok:
+            results.append({"id": item[0], "status": 200})
+        else:
+            results.append({"id": item[0], "status": 404, "error": "player_not_found"})
+    return 200, {"results": results}
 
-        try:
-            pid = int(data["id"])
-            x = float(data["x"])
-            y = float(data["y"])
-            map_name = str(data["map"])
-        except (ValueError, TypeError):
-            self._json(400, {"error": "bad_fields"})
-            return
+class Server(ThreadingHTTPServer):
+    # socketserver's default backlog of 5 resets connections when many clients join at once
+    request_queue_size = 128
 
-        ok = PLAYER_HANDLER.update(pid, x, y, map_name)
-        if not ok:
-            self._json(404, {"error": "player_not_found"})
-            return
+class Handler(BaseHTTPRequestHandler):
+    # Keep-alive: clients reuse one connection instead of reconnecting per request
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this Nagle + delayed ACK
+    # stall every keep-alive response by ~40 ms
+    disable_nagle_algorithm = True
 
-        self._json(200, {"success": True})
+    # def log_message(self, fmt, *args):
+    #     return
 
-    # Utility for JSON responses
-    def _json(self, code: int, obj: object) -> None:
-        data = json.dumps(obj).encode("utf-8")
+    def do_GET(self):
+        start = time.perf_counter()
+        code, obj = handle_get(self.path, self.headers.get("Accept", ""), self.headers.get("If-None-Match", ""))
+        sent = self._reply(code, obj)
+        METRICS.observe("GET", self.path, code, time.perf_counter() - start, 0, sent)
+
+    def do_POST(self):
+        # Always drain the body, the connection is reused for the next request
+        length = int(self.headers.get("Content-Length", "0"))
+        body = self.rfile.read(length)
+        start = time.perf_counter()
+        content_type = self.headers.get("Content-Type", "application/json")
+        code, obj = handle_post(self.path, body, content_type)
+        sent = self._reply(code, obj)
+        METRICS.observe("POST", self.path, code, time.perf_counter() - start, length, sent)
+
+    # Utility for JSON (or binary, or text) responses, returns the body size
+    def _reply(self, code: int, obj: object) -> int:
+        body = encode_body(obj)
         self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Type", body.content_type)
+        self.send_header("Content-Length", str(len(body.data)))
+        if body.etag:
+            self.send_header("ETag", body.etag)
         self.end_headers()
-        self.wfile.write(data)
+        self.wfile.write(body.data)
+        return len(body.data)
+
+def serve_worker(sock: socket.socket) -> None:
+    # Accept on the listening socket inherited from the parent
+    server = Server(sock.getsockname(), Handler, bind_and_activate=False)
+    server.socket.close()
+    server.socket = sock
+    server.serve_forever()
+
+def start_workers(port: int, workers: int) -> list[multiprocessing.Process]:
+    '''
+    Fork worker processes that all accept on one shared listening socket,
+    the kernel hands each new connection to one of them. Fork before
+    starting any threads in this process.
+    '''
+    sock = socket.create_server(("0.0.0.0", port), backlog=Server.request_queue_size)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=serve_worker, args=(sock,), name=f"Worker-{i}", daemon=True) for i in range(workers)]
+    for p in procs:
+        p.start()
+    return procs
 
 if __name__ == "__main__":
-    print(f"[Server] Running on localhost with port {PORT}")
-    HTTPServer(("0.0.0.0", PORT), Handler).serve_forever()
+    parser = argparse.ArgumentParser(description="Monster Go online server")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--push-port", type=int, default=PUSH_PORT, help="raw-TCP push channel, 0 to disable")
+    parser.add_argument(
+        "--mode", choices=["threaded", "asyncio", "multiprocess"], default="threaded",
+        help="threaded: one thread per connection, asyncio: single event loop, "
+             "multiprocess: --workers threaded processes sharing one player table",
+    )
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="processes in multiprocess mode")
+    parser.add_argument("--no-metrics", action="store_true", help="skip request instrumentation for /metrics")
+    parser.add_argument("--no-cache", action="store_true", help="encode every /players answer anew, no ETags")
+    args = parser.parse_args()
+    METRICS.enabled = not args.no_metrics
+    RESPONSE_CACHE.enabled = not args.no_cache
+
+    print(f"[Server] Running on localhost with port {args.port} ({args.mode})")
+    workers = []
+    if args.mode == "multiprocess":
+        from server.sharedPlayerTable import SharedPlayerTable
+        # Workers read and write the players through shared memory instead
+        PLAYER_HANDLER.stop()
+        PLAYER_HANDLER = SharedPlayerTable()
+        workers = start_workers(args.port, args.workers)
+        print(f"[Server] {args.workers} worker processes")
+        PLAYER_HANDLER.start()
+        # Exit through sys.exit so the daemon workers get terminated too
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    if args.push_port:
+        print(f"[Server] Push channel on port {args.push_port}")
+        PushServer(PLAYER_HANDLER).start("0.0.0.0", args.push_port)
+    if args.mode == "asyncio":
+        from server.asyncServer import serve_asyncio
+        serve_asyncio("0.0.0.0", args.port, handle_get, handle_post, METRICS.observe)
+    elif workers:
+        for p in workers:
+            p.join()
+    else:
+        # Persistent connections hold a handler per client, so serve each one on its own thread
+        Server(("0.0.0.0", args.port), Handler).serve_forever()
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+from server.wireFormat import EncodedBody, encode_body
+
+# (path, Accept, If-None-Match) and (path, body, Content-Type)
+GetRoute = Callable[[str, str, str], tuple[int, object]]
+PostRoute = Callable[[str, bytes, str], tuple[int, object]]
+# (method, path, code, seconds, bytes in, bytes out) after each response
+Observer = Callable[[str, str, int, float, int, int], None]
+
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 503: "Service Unavailable",
+}
+
+class AsyncServer:
+    """
+    Minimal HTTP/1.1 keep-alive server on one asyncio event loop. It only
+    understands what the game client sends (GET and POST with a
+    Content-Length body) and answers with JSON, or the binary wire format,
+    from the given routes.
+    """
+    def __init__(self, handle_get: GetRoute, handle_post: PostRoute, observe: Optional[Observer] = None):
+        self._handle_get = handle_get
+        self._handle_post = handle_post
+        self._observe = observe
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self._client, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_head(reader)
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Malformed request line or Content-Length, or a line over the
+                    # reader's limit: answer like the threaded mode, then hang up
+                    writer.write(self._response(400, encode_body({"error": "bad_request"}), False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, version, headers, length = request
+                body = await reader.readexactly(length) if length else b""
+
+                start = time.perf_counter()
+                if method == "GET":
+                    code, obj = self._handle_get(path, headers.get("accept", ""), headers.get("if-none-match", ""))
+                elif method == "POST":
+                    code, obj = self._handle_post(path, body, headers.get("content-type", "application/json"))
+                else:
+                    code, obj = 405, {"error": "method_not_allowed"}
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                body = encode_body(obj)
+                writer.write(self._response(code, body, keep_alive))
+                await writer.drain()
+                if self._observe is not None:
+                    self._observe(method, path, code, time.perf_counter() - start, length, len(body.data))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Optional[tuple[str, str, str, dict[str, str], int]]:
+        '''
+        Request line, headers and Content-Length of the next request, None
+        once the client closed the connection. Raises ValueError if they
+        are malformed or a line is over the reader's limit.
+        '''
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, path, version = request_line.decode("latin-1").split()
+
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", "0") or 0)
+        if length < 0:
+            raise ValueError("negative Content-Length")
+        return method, path, version, headers, length
+
+    @staticmethod
+    def _response(code: int, body: EncodedBody, keep_alive: bool) -> bytes:
+        etag = f"ETag: {body.etag}\r\n" if body.etag else ""
+        head = (
+            f"HTTP/1.1 {code} {REASONS.get(code, '')}\r\n"
+            f"Content-Type: {body.content_type}\r\n"
+            f"Content-Length: {len(body.data)}\r\n"
+            f"{etag}"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        return head.encode("latin-1") + body.data
+
+
+def serve_asyncio(
+    host: str, port: int, handle_get: GetRoute, handle_post: PostRoute, observe: Optional[Observer] = None
+) -> None:
+    asyncio.run(AsyncServer(handle_get, handle_post, observe).serve(host, port))
@@ -0,0 +1,113 @@
+import threading
+from bisect import bisect_left
+
+from server.playerHandler import PlayerHandler
+
+# Upper bounds in seconds; a request lands in the first bucket it fits
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# Anything else is counted as "other" so random paths cannot grow the label set
+ROUTES = ("/", "/register", "/players", "/players/batch", "/metrics")
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class RouteStats:
+    __slots__ = ("codes", "buckets", "seconds", "bytes_in", "bytes_out")
+
+    def __init__(self):
+        self.codes: dict[int, int] = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.seconds = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+class Metrics:
+    """
+    Request counters and latency histograms for both server modes, plus
+    PlayerHandler state read at scrape time. GET /metrics renders them in
+    the Prometheus text format. observe() only bumps a few numbers under
+    a short lock, cheap enough to leave on; enabled=False skips even that.
+    """
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+
+    def observe(self, method: str, path: str, code: int, seconds: float, bytes_in: int, bytes_out: int) -> None:
+        if not self.enabled:
+            return
+        route = path.split("?", 1)[0]
+        if route not in ROUTES:
+            route = "other"
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            stats = self._routes.get((method, route))
+            if stats is None:
+                stats = self._routes[(method, route)] = RouteStats()
+            stats.codes[code] = stats.codes.get(code, 0) + 1
+            stats.buckets[bucket] += 1
+            stats.seconds += seconds
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+
+    def render(self, handler: PlayerHandler) -> str:
+        with self._lock:
+            routes = sorted(
+                ((method, route, dict(s.codes), list(s.buckets), s.seconds, s.bytes_in, s.bytes_out)
+                 for (method, route), s in self._routes.items())
+            )
+        lines: list[str] = []
+
+        lines.append("# HELP monstergo_http_requests_total HTTP requests handled.")
+        lines.append("# TYPE monstergo_http_requests_total counter")
+        for method, route, codes, *_ in routes:
+            for code, count in sorted(codes.items()):
+                lines.append(f'monstergo_http_requests_total{{method="{method}",route="{route}",code="{code}"}} {count}')
+
+        lines.append("# HELP monstergo_http_request_duration_seconds Time from parsed request to written response.")
+        lines.append("# TYPE monstergo_http_request_duration_seconds histogram")
+        for method, route, codes, buckets, seconds, _, _ in routes:
+            labels = f'method="{method}",route="{route}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, buckets):
+                cumulative += count
+                lines.append(f'monstergo_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += buckets[-1]
+            lines.append(f'monstergo_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"monstergo_http_request_duration_seconds_sum{{{labels}}} {seconds}")
+            lines.append(f"monstergo_http_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+        lines.append("# HELP monstergo_http_request_bytes_total Request body bytes received.")
+        lines.append("# TYPE monstergo_http_request_bytes_total counter")
+        for method, route, _, _, _, bytes_in, _ in routes:
+            lines.append(f'monstergo_http_request_bytes_total{{method="{method}",route="{route}"}} {bytes_in}')
+        lines.append("# HELP monstergo_http_response_bytes_total Response body bytes sent.")
+        lines.append("# TYPE monstergo_http_response_bytes_total counter")
+        for method, route, _, _, _, _, bytes_out in routes:
+            lines.append(f'monstergo_http_response_bytes_total{{method="{method}",route="{route}"}} {bytes_out}')
+
+        waits, wait_seconds = handler.lock_wait_stats()
+        lines.append("# HELP monstergo_player_lock_waits_total Shard lock acquisitions that had to wait.")
+        lines.append("# TYPE monstergo_player_lock_waits_total counter")
+        lines.append(f"monstergo_player_lock_waits_total {waits}")
+        lines.append("# HELP monstergo_player_lock_wait_seconds_total Time spent waiting for shard locks.")
+        lines.append("# TYPE monstergo_player_lock_wait_seconds_total counter")
+        lines.append(f"monstergo_player_lock_wait_seconds_total {wait_seconds}")
+
+        lines.append("# HELP monstergo_players Active players per map.")
+        lines.append("# TYPE monstergo_players gauge")
+        for map_name, count in sorted(handler.players_per_map().items()):
+            lines.append(f'monstergo_players{{map="{_label(map_name)}"}} {count}')
+
+        lines.append("# HELP monstergo_cleaner_sweep_seconds Duration of expiry sweeps.")
+        lines.append("# TYPE monstergo_cleaner_sweep_seconds summary")
+        lines.append(f"monstergo_cleaner_sweep_seconds_sum {handler.sweep_seconds}")
+        lines.append(f"monstergo_cleaner_sweep_seconds_count {handler.sweeps}")
+        lines.append("# HELP monstergo_cleaner_expired_total Players removed for inactivity.")
+        lines.append("# TYPE monstergo_cleaner_expired_total counter")
+        lines.append(f"monstergo_cleaner_expired_total {handler.expired_total}")
+
+        return "\n".join(lines) + "\n"
@@ -1,11 +1,13 @@
+import heapq
 import threading
 import time
-import copy
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
 
 TIMEOUT_TIME = 60.0
 CHECK_INTERVAL_TIME = 10.0
+SHARD_COUNT = 16
+MAX_TOMBSTONES = 1024   # players that left a map, remembered for delta queries (over all shards)
 
 @dataclass
 class Player:
@@ -15,33 +17,148 @@ class Player:
     map: str
     last_update: float
 
-    def update(self, x: float, y: float, map: str) -> None:
+    def update(self, x: float, y: float, map: str, now: float) -> None:
         if x != self.x or y != self.y or map != self.map:
-            self.last_update = time.monotonic()
+            self.last_update = now
         self.x = x
         self.y = y
         self.map = map
 
-    def is_inactive(self) -> bool:
-        now = time.monotonic()
-        return (now - self.last_update) >= TIMEOUT_TIME
+    def is_inactive(self, now: float, timeout: float = TIMEOUT_TIME) -> bool:
+        return (now - self.last_update) >= timeout
+
+
+class PlayerRecord(NamedTuple):
+    '''A player as readers see it, with the seq of its last change.'''
+    id: int
+    x: float
+    y: float
+    map: str
+    seq: int
+
+
+@dataclass(frozen=True)
+class ShardView:
+    '''
+    Read snapshot of one shard. Never changed once published: writers build
+    a new view and swap it in (copy-on-write), so readers take no lock.
+    '''
+    by_map: Dict[str, Dict[int, PlayerRecord]]
+    # (map, pid) -> seq at which the player left that map, oldest first
+    left: Dict[tuple[str, int], int]
+    # Tombstones at or below this seq were dropped; older deltas need a full snapshot
+    floor: int
+
+
+class Shard:
+    '''Players whose id hashes here, guarded by the shard's own lock.'''
+    lock: threading.Lock
+    players: Dict[int, Player]
+    view: ShardView
+    # (deadline, pid), one entry per player. A deadline can be stale (the
+    # player moved since), never late: it is checked and re-pushed when due.
+    expiry: list[tuple[float, int]]
+    # Contended acquisitions of self.lock and the time spent waiting, updated under the lock
+    lock_waits: int
+    lock_wait_seconds: float
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.players = {}
+        self.view = ShardView({}, {}, 0)
+        self.expiry = []
+        self.lock_waits = 0
+        self.lock_wait_seconds = 0.0
+
+    def acquire(self) -> None:
+        # An uncontended acquire costs no clock reads
+        if self.lock.acquire(blocking=False):
+            return
+        start = time.perf_counter()
+        self.lock.acquire()
+        self.lock_waits += 1
+        self.lock_wait_seconds += time.perf_counter() - start
+
+    # Caller holds self.lock
+    def publish(self, pid: int, old_map: Optional[str], record: Optional[PlayerRecord], seq: int) -> None:
+        '''
+        Swap in a view where pid has moved from old_map (None: new player)
+        to record (None: removed).
+        '''
+        view = self.view
+        by_map = dict(view.by_map)
+        left = dict(view.left)
+        floor = view.floor
+
+        if old_map is not None and (record is None or record.map != old_map):
+            players = dict(by_map[old_map])
+            del players[pid]
+            if players:
+                by_map[old_map] = players
+            else:
+                del by_map[old_map]
+            left.pop((old_map, pid), None)
+            left[(old_map, pid)] = seq
+            while len(left) > MAX_TOMBSTONES // SHARD_COUNT:
+                oldest = next(iter(left))
+                floor = max(floor, left.pop(oldest))
+
+        if record is not None:
+            players = dict(by_map.get(record.map, {}))
+            players[pid] = record
+            by_map[record.map] = players
+            # Back on a map it left earlier: the old tombstone must not hide it
+            left.pop((record.map, pid), None)
+
+        self.view = ShardView(by_map, left, floor)
 
 
 class PlayerHandler:
-    _lock: threading.Lock
+    '''
+    Players are split over SHARD_COUNT shards by id, each with its own lock,
+    so writers for different players rarely wait on each other. Readers
+    never lock a shard: they use the shards' published copy-on-write views.
+
+    Every change takes a global sequence number. A change is "in flight"
+    between taking its seq and publishing its view; answers carry the
+    highest seq below every in-flight one, so a client resuming from it
+    can never skip a change that was not visible yet.
+    '''
+    timeout_seconds: float
+    check_interval_seconds: float
+    _clock: Callable[[], float]
+    # Cleaner statistics, for /metrics
+    sweeps: int
+    sweep_seconds: float
+    expired_total: int
     _stop_event: threading.Event
     _thread: threading.Thread | None
-    
-    players: Dict[int, Player]
+
+    _shards: list[Shard]
+    # Guards _next_id, _seq and _in_flight; held only for a few instructions
+    _seq_lock: threading.Lock
     _next_id: int
+    _seq: int
+    _in_flight: set[int]
 
-    def __init__(self, *, timeout_seconds: float = 120.0, check_interval_seconds: float = 5.0):
-        self._lock = threading.Lock()
+    def __init__(
+        self, *, timeout_seconds: float = TIMEOUT_TIME, check_interval_seconds: float = CHECK_INTERVAL_TIME,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._clock = clock
+        self.sweeps = 0
+        self.sweep_seconds = 0.0
+        self.expired_total = 0
         self._stop_event = threading.Event()
         self._thread = None
-        
-        self.players = {}
+
+        self._shards = [Shard() for _ in range(SHARD_COUNT)]
+        self._seq_lock = threading.Lock()
         self._next_id = 0
+        self._seq = 0
+        self._in_flight = set()
         
     # Threading
     def start(self) -> None:
@@ -57,41 +174,217 @@ class PlayerHandler:
             self._thread.join(timeout=2.0)
 
     def _cleaner(self) -> None:
-        while not self._stop_event.wait(CHECK_INTERVAL_TIME):
-            now = time.monotonic()
-            to_remove: list[int] = []
-            with self._lock:
-                for pid, p in list(self.players.items()):
-                    if now - p.last_update >= TIMEOUT_TIME:
-                        to_remove.append(pid)
-                for pid in to_remove:
-                    _ = self.players.pop(pid, None)
+        while not self._stop_event.wait(self.check_interval_seconds):
+            self.expire()
+
+    def expire(self) -> list[int]:
+        '''
+        Remove players idle for timeout_seconds and return their ids. Only
+        players whose expiry entry is due are looked at, not every player.
+        '''
+        start = time.perf_counter()
+        now = self._clock()
+        expired = []
+        # One shard at a time, the others stay writable meanwhile
+        for shard in self._shards:
+            shard.acquire()
+            try:
+                heap = shard.expiry
+                while heap and heap[0][0] <= now:
+                    _, pid = heapq.heappop(heap)
+                    p = shard.players[pid]
+                    deadline = p.last_update + self.timeout_seconds
+                    if deadline > now:
+                        # Moved since the entry was pushed, check again later
+                        heapq.heappush(heap, (deadline, pid))
+                        continue
+                    del shard.players[pid]
+                    self._publish(shard, pid, p.map, None)
+                    expired.append(pid)
+            finally:
+                shard.lock.release()
+        self.sweeps += 1
+        self.sweep_seconds += time.perf_counter() - start
+        self.expired_total += len(expired)
+        return expired
                     
     # API
     def register(self) -> int:
-        with self._lock:
+        with self._seq_lock:
             pid = self._next_id
             self._next_id += 1
-            self.players[pid] = Player(pid, 0.0, 0.0, "", time.monotonic())
-            return pid
+        shard = self._shard(pid)
+        shard.acquire()
+        try:
+            now = self._clock()
+            shard.players[pid] = Player(pid, 0.0, 0.0, "", now)
+            heapq.heappush(shard.expiry, (now + self.timeout_seconds, pid))
+            self._publish(shard, pid, None, (0.0, 0.0, ""))
+        finally:
+            shard.lock.release()
+        return pid
 
     def update(self, pid: int, x: float, y: float, map_name: str) -> bool:
-        with self._lock:
-            p = self.players.get(pid)
-            if not p:
-                return False
-            else:
-                p.update(float(x), float(y), str(map_name))
-                return True
-
-    def list_players(self) -> dict:
-        with self._lock:
-            player_list = {}
-            for p in self.players.values():
-                player_list[p.id] = {
-                    "id": p.id,
-                    "x": p.x,
-                    "y": p.y,
-                    "map": p.map
-                }
-            return player_list
+        shard = self._shard(pid)
+        shard.acquire()
+        try:
+            return self._update_locked(shard, pid, x, y, map_name)
+        finally:
+            shard.lock.release()
+
+    def update_many(self, updates: list[tuple[int, float, float, str]]) -> list[bool]:
+        '''
+        update() for many (id, x, y, map) at once, taking each shard's lock
+        only once. Returns update()'s result for every item, in order.
+        '''
+        results = [False] * len(updates)
+        by_shard: Dict[int, list[int]] = {}
+        for i, update in enumerate(updates):
+            by_shard.setdefault(update[0] % SHARD_COUNT, []).append(i)
+        for index, items in by_shard.items():
+            shard = self._shards[index]
+            shard.acquire()
+            try:
+                for i in items:
+                    results[i] = self._update_locked(shard, *updates[i])
+            finally:
+                shard.lock.release()
+        return results
+
+    # Caller holds shard.lock
+    def _update_locked(self, shard: Shard, pid: int, x: float, y: float, map_name: str) -> bool:
+        p = shard.players.get(pid)
+        if not p:
+            return False
+        x, y, map_name = float(x), float(y), str(map_name)
+        if x != p.x or y != p.y or map_name != p.map:
+            self._publish(shard, pid, p.map, (x, y, map_name))
+        p.update(x, y, map_name, self._clock())
+        return True
+
+    def current_seq(self) -> int:
+        '''Seq of the latest change visible to readers; any change bumps it.'''
+        return self._stable_seq()
+
+    def players_per_map(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for shard in self._shards:
+            for map_name, records in shard.view.by_map.items():
+                counts[map_name] = counts.get(map_name, 0) + len(records)
+        return counts
+
+    def lock_wait_stats(self) -> tuple[int, float]:
+        '''Contended shard lock acquisitions so far and the total time spent waiting.'''
+        return (
+            sum(shard.lock_waits for shard in self._shards),
+            sum(shard.lock_wait_seconds for shard in self._shards),
+        )
+
+    def list_players(
+        self, map_name: Optional[str] = None,
+        near: Optional[tuple[float, float, float]] = None
+    ) -> dict:
+        '''
+        All players, or only those on map_name (looked up through the per-map
+        index), optionally only those within near = (x, y, radius) of a point.
+        '''
+        views = [shard.view for shard in self._shards]
+        return self._list_views(views, map_name, near)
+
+    def players_since(
+        self, since: Optional[int] = None, map_name: Optional[str] = None,
+        near: Optional[tuple[float, float, float]] = None
+    ) -> dict:
+        '''
+        Players added, moved or removed after sequence number `since`, with
+        the same filters as list_players. Players that left map_name are
+        reported as removed. Falls back to a full snapshot ("full": True)
+        when since is None or too old to answer, and always with near: a
+        requester that moved can have players in range that did not change.
+        '''
+        # Take the seq before the views: anything newer in them is just sent again next time
+        seq = self._stable_seq()
+        views = [shard.view for shard in self._shards]
+        if since is None or near is not None or since > seq or any(since < view.floor for view in views):
+            return {
+                "seq": seq,
+                "full": True,
+                "players": self._list_views(views, map_name, near),
+                "removed": [],
+            }
+
+        players = {}
+        removed = {}
+        for view in views:
+            for records in self._records(view, map_name):
+                for r in records.values():
+                    if r.seq > since:
+                        players[r.id] = self._player_dict(r)
+            for (left_map, pid), left_seq in reversed(view.left.items()):
+                if left_seq <= since:
+                    break
+                if map_name is None:
+                    # Only gone for good if it is on no map of this shard any more
+                    if not any(pid in records for records in view.by_map.values()):
+                        removed[pid] = None
+                elif left_map == map_name:
+                    removed[pid] = None
+        return {"seq": seq, "full": False, "players": players, "removed": list(removed)}
+
+    def _list_views(
+        self, views: list[ShardView], map_name: Optional[str],
+        near: Optional[tuple[float, float, float]]
+    ) -> dict:
+        return {
+            r.id: self._player_dict(r)
+            for view in views
+            for records in self._records(view, map_name)
+            for r in records.values()
+            if near is None or self._is_near(r, near)
+        }
+
+    @staticmethod
+    def _records(view: ShardView, map_name: Optional[str]) -> Iterable[Dict[int, PlayerRecord]]:
+        if map_name is None:
+            return view.by_map.values()
+        records = view.by_map.get(map_name)
+        return (records,) if records else ()
+
+    @staticmethod
+    def _is_near(p: PlayerRecord, near: tuple[float, float, float]) -> bool:
+        nx, ny, radius = near
+        return (p.x - nx) ** 2 + (p.y - ny) ** 2 <= radius * radius
+
+    @staticmethod
+    def _player_dict(p: PlayerRecord) -> dict:
+        return {
+            "id": p.id,
+            "x": p.x,
+            "y": p.y,
+            "map": p.map
+        }
+
+    def _shard(self, pid: int) -> Shard:
+        return self._shards[pid % SHARD_COUNT]
+
+    # Caller holds shard.lock
+    def _publish(
+        self, shard: Shard, pid: int, old_map: Optional[str],
+        position: Optional[tuple[float, float, str]]
+    ) -> None:
+        '''Take the next seq, keeping it in flight until the shard has published the change.'''
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+            self._in_flight.add(seq)
+        try:
+            record = PlayerRecord(pid, *position, seq) if position is not None else None
+            shard.publish(pid, old_map, record, seq)
+        finally:
+            with self._seq_lock:
+                self._in_flight.discard(seq)
+
+    def _stable_seq(self) -> int:
+        # Every change up to this seq is visible in the shard views
+        with self._seq_lock:
+            return min(self._in_flight) - 1 if self._in_flight else self._seq
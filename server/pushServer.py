@@ -0,0 +1,198 @@
+import asyncio
+import json
+import threading
+
+from .playerHandler import PlayerHandler
+
+PUSH_PORT = 8990
+PUSH_TICK_RATE = 20             # broadcasts per second
+MAX_WRITE_BUFFER = 256 * 1024   # clients that fall this far behind are dropped
+RELAY_READ_SIZE = 64 * 1024     # bytes of relayed updates applied per batch
+MAX_LINE = 4 * 1024             # longest line in either mode; a client sending more without a newline is dropped
+
+class _PushClient:
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.pid: int | None = None
+        self.map: str | None = None     # map the client last got a snapshot of
+
+
+class PushServer:
+    """
+    Persistent raw-TCP channel for player positions, one JSON object per line.
+
+    client -> server
+        {"type": "hello", "id": <id from /register>}
+        {"type": "pos", "x": .., "y": .., "map": ..}
+        {"type": "relay"}                                  switches to relay mode, see below
+    server -> client, at PUSH_TICK_RATE
+        {"type": "snapshot", "map": m, "players": [...]}   when the client enters map m
+        {"type": "delta", "map": m, "changed": [...], "removed": [ids]}
+                                                           only if something on m changed
+
+    Positions received here go through the same PlayerHandler as the HTTP
+    endpoints, so HTTP clients and push clients see each other.
+
+    Relay mode is for bots and relays that move many players over one
+    connection. After the relay line every line is a bare update
+    {"id": .., "x": .., "y": .., "map": ..}; all complete lines that arrived
+    together are applied with one PlayerHandler.update_many call. Nothing is
+    broadcast to a relay connection; the server only answers failed updates,
+    with {"type": "error", "id": .., "error": "player_not_found" | "bad_fields" | "bad_map"}.
+    In either mode, a line longer than MAX_LINE gets {"type": "error",
+    "id": null, "error": "line_too_long"} and the connection is closed.
+    """
+    _clients: dict[asyncio.StreamWriter, _PushClient]
+    _last: dict[int, dict]
+
+    def __init__(self, handler: PlayerHandler, tick_rate: float = PUSH_TICK_RATE):
+        self._handler = handler
+        self._interval = 1.0 / tick_rate
+        self._clients = {}
+        self._last = {}
+
+    def start(self, host: str, port: int = PUSH_PORT) -> threading.Thread:
+        thread = threading.Thread(
+            target=lambda: asyncio.run(self.serve(host, port)),
+            name="PushServer",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self._client, host, port, limit=MAX_LINE)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self._broadcast_loop())
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = _PushClient(writer)
+        self._clients[writer] = client
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Longer than MAX_LINE, the reader's limit
+                    await self._line_too_long(writer)
+                    break
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                    kind = msg.get("type")
+                    if kind == "hello":
+                        client.pid = int(msg["id"])
+                    elif kind == "relay":
+                        client.pid = None
+                        await self._relay(reader, writer)
+                        break
+                    elif kind == "pos" and client.pid is not None:
+                        self._handler.update(client.pid, float(msg["x"]), float(msg["y"]), str(msg["map"]))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    async def _relay(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending = b""
+        while True:
+            data = await reader.read(RELAY_READ_SIZE)
+            if not data:
+                return
+            *lines, pending = (pending + data).split(b"\n")
+            if len(pending) > MAX_LINE or any(len(line) > MAX_LINE for line in lines):
+                await self._line_too_long(writer)
+                return
+            updates = []
+            errors = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    msg = json.loads(line)
+                    updates.append((int(msg["id"]), float(msg["x"]), float(msg["y"]), str(msg["map"])))
+                except (ValueError, KeyError, TypeError):
+                    errors.append({"type": "error", "id": None, "error": "bad_fields"})
+            # None: a map the shared map table has no room for, only that line fails
+            applied = self._handler.update_many(updates)
+            for update, ok in zip(updates, applied):
+                if ok is None:
+                    errors.append({"type": "error", "id": update[0], "error": "bad_map"})
+                elif not ok:
+                    errors.append({"type": "error", "id": update[0], "error": "player_not_found"})
+            if errors:
+                writer.write(b"".join(self._encode(msg) for msg in errors))
+                await writer.drain()
+
+    async def _line_too_long(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(self._encode({"type": "error", "id": None, "error": "line_too_long"}))
+        await writer.drain()
+
+    async def _broadcast_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            self._tick()
+
+    def _tick(self) -> None:
+        players = self._handler.list_players()
+
+        # Diff against the previous tick, grouped by map
+        changed: dict[str, list[dict]] = {}
+        removed: dict[str, list[int]] = {}
+        for pid, p in players.items():
+            old = self._last.get(pid)
+            if old == p:
+                continue
+            changed.setdefault(p["map"], []).append(p)
+            if old is not None and old["map"] != p["map"]:
+                removed.setdefault(old["map"], []).append(pid)
+        for pid, old in self._last.items():
+            if pid not in players:
+                removed.setdefault(old["map"], []).append(pid)
+        self._last = players
+
+        # Every message is encoded once per map, not once per client
+        deltas: dict[str, bytes] = {}
+        snapshots: dict[str, bytes] = {}
+        for client in list(self._clients.values()):
+            me = players.get(client.pid) if client.pid is not None else None
+            if me is None:
+                continue
+            map_name = me["map"]
+            if map_name != client.map:
+                client.map = map_name
+                data = snapshots.get(map_name)
+                if data is None:
+                    on_map = [p for p in players.values() if p["map"] == map_name]
+                    data = self._encode({"type": "snapshot", "map": map_name, "players": on_map})
+                    snapshots[map_name] = data
+            else:
+                if map_name not in changed and map_name not in removed:
+                    continue
+                data = deltas.get(map_name)
+                if data is None:
+                    data = self._encode({
+                        "type": "delta",
+                        "map": map_name,
+                        "changed": changed.get(map_name, []),
+                        "removed": removed.get(map_name, []),
+                    })
+                    deltas[map_name] = data
+            self._send(client, data)
+
+    def _send(self, client: _PushClient, data: bytes) -> None:
+        transport = client.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            transport.abort()
+            return
+        client.writer.write(data)
+
+    @staticmethod
+    def _encode(msg: dict) -> bytes:
+        return json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n"
@@ -0,0 +1,45 @@
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from server.wireFormat import EncodedBody
+
+MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """
+    Encoded GET /players answers, keyed by query. An entry is only served
+    while the player state is still at the seq it was built at; any
+    register, update or expiry bumps the seq, which marks every entry
+    dirty without touching the cache. Clients polling the same query in
+    the same window then share one encoding.
+
+    ETags name the state (seq) and the filter, not the since= value, so a
+    client that already holds the latest state can be answered with 304.
+    """
+    def __init__(self, max_entries: int = MAX_ENTRIES, enabled: bool = True):
+        self.enabled = enabled
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[int, EncodedBody]] = OrderedDict()
+
+    @staticmethod
+    def etag(seq: int, view: Hashable) -> str:
+        return f'"{seq}-{zlib.crc32(repr(view).encode("utf-8")):08x}"'
+
+    def get(self, key: Hashable, seq: int) -> Optional[EncodedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != seq:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, seq: int, body: EncodedBody) -> None:
+        with self._lock:
+            self._entries[key] = (seq, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,404 @@
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from server.playerHandler import CHECK_INTERVAL_TIME, TIMEOUT_TIME
+from shared.wireFormat import KNOWN_MAPS
+
+MAX_PLAYERS = 4096
+MAX_MAPS = 256
+MAP_NAME_BYTES = 64
+
+# Header and records start with a version that is odd while they are being
+# written (a seqlock); readers retry until they read the same even version
+# before and after the copy.
+VERSION = struct.Struct("<I")
+HEADER = struct.Struct("<IQQIIQdQdQ")
+HEADER_FIELDS = (
+    "seq", "floor", "used", "maps", "lock_waits", "lock_wait_seconds", "sweeps", "sweep_seconds", "expired"
+)
+# version, id, x, y, map id, last_update, seq of last change, state, then
+# the map history delta queries need: seq at which the player entered its
+# map, the map before it and the seq at which it entered that one
+RECORD = struct.Struct("<IIddHdQBQHQ")
+FREE, LIVE, REMOVED = 0, 1, 2
+
+MAPS_OFFSET = HEADER.size
+RECORDS_OFFSET = MAPS_OFFSET + MAX_MAPS * MAP_NAME_BYTES
+
+
+class SharedMapTable:
+    """
+    Map names stored in the shared table, so every worker process gives
+    them the same ids. The known maps (shared/wireFormat.py) come first,
+    so their ids match the wire format's and they always fit; other names
+    are appended once under the table's write lock, never change, and are
+    refused once MAX_MAPS are taken. Each process caches what it has read
+    so far.
+    """
+    def __init__(self, table: "SharedPlayerTable"):
+        self._table = table
+        self._lock = threading.Lock()
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def names(self) -> list[str]:
+        self._sync()
+        return list(self._names)
+
+    def id_of(self, name: str) -> int:
+        '''Id of name, added to the table if new. Raises ValueError if it does not fit.'''
+        map_id = self.find(name)
+        if map_id is not None:
+            return map_id
+        encoded = name.encode("utf-8")
+        if len(encoded) > MAP_NAME_BYTES:
+            raise ValueError(f"map name longer than {MAP_NAME_BYTES} bytes")
+        with self._table.write() as header:
+            self._sync()
+            map_id = self._ids.get(name)
+            if map_id is None:
+                map_id = header["maps"]
+                if map_id >= MAX_MAPS:
+                    raise ValueError("map table full")
+                offset = MAPS_OFFSET + map_id * MAP_NAME_BYTES
+                self._table.buf[offset:offset + MAP_NAME_BYTES] = encoded.ljust(MAP_NAME_BYTES, b"\0")
+                header["maps"] = map_id + 1
+        return self.find(name)
+
+    def find(self, name: str) -> Optional[int]:
+        '''Id of name, or None if no process has added it yet.'''
+        map_id = self._ids.get(name)
+        if map_id is None:
+            self._sync()
+            map_id = self._ids.get(name)
+        return map_id
+
+    def name_of(self, map_id: int) -> Optional[str]:
+        if map_id >= len(self._names):
+            self._sync()
+        names = self._names
+        return names[map_id] if map_id < len(names) else None
+
+    def _sync(self) -> None:
+        count = self._table.header()["maps"]
+        if count == len(self._names):
+            return
+        with self._lock:
+            buf = self._table.buf
+            for map_id in range(len(self._names), count):
+                offset = MAPS_OFFSET + map_id * MAP_NAME_BYTES
+                name = bytes(buf[offset:offset + MAP_NAME_BYTES]).rstrip(b"\0").decode("utf-8")
+                self._ids[name] = map_id
+                self._names.append(name)
+
+
+class SharedPlayerTable:
+    """
+    Player table for the multi-process server, with the same API as
+    PlayerHandler. It lives in anonymous shared memory created before the
+    workers are forked, as fixed-size records (id, x, y, map id,
+    last_update), so every worker reads it directly without IPC.
+
+    Writers serialize on one cross-process lock, which they hold only to
+    rewrite a record and the header. Readers take no lock (see VERSION).
+    A player id encodes its slot (id % capacity); a slot freed by expiry
+    stays a tombstone for delta queries until a new player reuses it.
+    """
+    timeout_seconds: float
+    check_interval_seconds: float
+    maps: SharedMapTable
+    buf: mmap.mmap
+
+    def __init__(
+        self, *, capacity: int = MAX_PLAYERS,
+        timeout_seconds: float = TIMEOUT_TIME, check_interval_seconds: float = CHECK_INTERVAL_TIME,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.capacity = capacity
+        self.timeout_seconds = timeout_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._clock = clock
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        # Anonymous mmaps are MAP_SHARED, forked workers see the same pages
+        self.buf = mmap.mmap(-1, RECORDS_OFFSET + capacity * RECORD.size)
+        self._write_lock = multiprocessing.get_context("fork").Lock()
+        self.maps = SharedMapTable(self)
+        for name in KNOWN_MAPS:
+            self.maps.id_of(name)
+
+    # Threading, run by the parent process only
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._cleaner, name="PlayerCleaner", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _cleaner(self) -> None:
+        while not self._stop_event.wait(self.check_interval_seconds):
+            self.expire()
+
+    def expire(self) -> list[int]:
+        '''
+        Remove players idle for timeout_seconds and return their ids. Other
+        processes update last_update, so this scans the used records.
+        '''
+        start = time.perf_counter()
+        now = self._clock()
+        expired = []
+        with self.write() as header:
+            for slot in range(header["used"]):
+                pid, x, y, map_id, last_update, _, state, *history = self._record(slot)
+                if state == LIVE and now - last_update >= self.timeout_seconds:
+                    header["seq"] += 1
+                    self._write(
+                        RECORD, self._record_offset(slot),
+                        pid, x, y, map_id, last_update, header["seq"], REMOVED, *history
+                    )
+                    expired.append(pid)
+            header["sweeps"] += 1
+            header["sweep_seconds"] += time.perf_counter() - start
+            header["expired"] += len(expired)
+        return expired
+
+    # API
+    def register(self) -> int:
+        '''Raises RuntimeError when every slot holds a live player.'''
+        now = self._clock()
+        with self.write() as header:
+            # Reuse the oldest tombstone so the used slots, and every scan, stay as
+            # short as the peak player count. Deltas from before its removal now
+            # need a full snapshot.
+            oldest = None
+            for slot in range(header["used"]):
+                rec_id, _, _, _, _, rec_seq, state, *_ = self._record(slot)
+                if state == REMOVED and (oldest is None or rec_seq < oldest[0]):
+                    oldest = (rec_seq, slot, rec_id)
+            if oldest is not None:
+                removed_seq, slot, old_id = oldest
+                pid = old_id + self.capacity
+                header["floor"] = max(header["floor"], removed_seq)
+            elif header["used"] < self.capacity:
+                slot = pid = header["used"]
+                header["used"] += 1
+            else:
+                raise RuntimeError("player table full")
+            header["seq"] += 1
+            # A new player counts as on map 0 all along: at worst a delta for
+            # that map reports it as removed without the client having it
+            self._write(RECORD, self._record_offset(slot), pid, 0.0, 0.0, 0, now, header["seq"], LIVE, 0, 0, 0)
+        return pid
+
+    def update(self, pid: int, x: float, y: float, map_name: str) -> bool:
+        '''Raises ValueError if map_name does not fit in the map table.'''
+        ok = self.update_many([(pid, x, y, map_name)])[0]
+        if ok is None:
+            raise ValueError("map table full")
+        return ok
+
+    def update_many(self, updates: list[tuple[int, float, float, str]]) -> list[bool | None]:
+        '''
+        update() for many (id, x, y, map) under one acquisition of the write
+        lock. Returns update()'s result for every item, in order, or None
+        for an item whose map does not fit in the map table.
+        '''
+        # Resolve map ids first, adding a map takes the write lock itself
+        resolved = []
+        for pid, x, y, map_name in updates:
+            try:
+                map_id = self.maps.id_of(str(map_name))
+            except ValueError:
+                map_id = None
+            resolved.append((int(pid), float(x), float(y), map_id))
+        results = []
+        with self.write() as header:
+            now = self._clock()
+            for pid, x, y, map_id in resolved:
+                if map_id is None:
+                    results.append(None)
+                    continue
+                slot = pid % self.capacity
+                if slot >= header["used"]:
+                    results.append(False)
+                    continue
+                offset = self._record_offset(slot)
+                rec_id, old_x, old_y, old_map, _, _, state, *history = self._read(RECORD, offset)
+                if state != LIVE or rec_id != pid:
+                    results.append(False)
+                    continue
+                if x != old_x or y != old_y or map_id != old_map:
+                    header["seq"] += 1
+                    if map_id != old_map:
+                        history = (header["seq"], old_map, history[0])
+                    self._write(RECORD, offset, pid, x, y, map_id, now, header["seq"], LIVE, *history)
+                results.append(True)
+        return results
+
+    def list_players(
+        self, map_name: Optional[str] = None,
+        near: Optional[tuple[float, float, float]] = None
+    ) -> dict:
+        '''All players, or only those on map_name, optionally only those within near = (x, y, radius).'''
+        header = self.header()
+        map_id = None
+        if map_name is not None:
+            map_id = self.maps.find(map_name)
+            if map_id is None:
+                return {}
+        players = {}
+        for slot in range(header["used"]):
+            pid, x, y, rec_map, _, _, state, *_ = self._record(slot)
+            if state == LIVE and (map_id is None or rec_map == map_id) and (near is None or self._is_near(x, y, near)):
+                players[pid] = self._player_dict(pid, x, y, rec_map)
+        return players
+
+    def players_since(
+        self, since: Optional[int] = None, map_name: Optional[str] = None,
+        near: Optional[tuple[float, float, float]] = None
+    ) -> dict:
+        '''
+        Same answer as PlayerHandler.players_since: a player is reported as
+        removed only if it was on map_name at `since` and no longer is.
+        '''
+        # Records are written before the header seq, so everything up to it is visible
+        header = self.header()
+        seq = header["seq"]
+        # Full answer with near, see PlayerHandler.players_since
+        if since is None or near is not None or since > seq or since < header["floor"]:
+            return {"seq": seq, "full": True, "players": self.list_players(map_name, near), "removed": []}
+
+        map_id = self.maps.find(map_name) if map_name is not None else None
+        players = {}
+        removed = []
+        for slot in range(header["used"]):
+            pid, x, y, rec_map, _, rec_seq, state, map_seq, prev_map, prev_map_seq = self._record(slot)
+            if rec_seq <= since:
+                continue
+            if state == LIVE and (map_name is None or rec_map == map_id):
+                players[pid] = self._player_dict(pid, x, y, rec_map)
+            elif map_name is None:
+                removed.append(pid)
+            elif map_id is not None and self._map_at(since, rec_map, map_seq, prev_map, prev_map_seq) in (map_id, None):
+                removed.append(pid)
+        return {"seq": seq, "full": False, "players": players, "removed": removed}
+
+    @staticmethod
+    def _map_at(since: int, rec_map: int, map_seq: int, prev_map: int, prev_map_seq: int) -> Optional[int]:
+        '''
+        Map id a record was on at seq `since`, or None if it changed map
+        more than once since then.
+        '''
+        if map_seq <= since:
+            return rec_map
+        if prev_map_seq <= since:
+            return prev_map
+        return None
+
+    def current_seq(self) -> int:
+        return self.header()["seq"]
+
+    def players_per_map(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for slot in range(self.header()["used"]):
+            _, _, _, map_id, _, _, state, *_ = self._record(slot)
+            if state == LIVE:
+                name = self.maps.name_of(map_id)
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def lock_wait_stats(self) -> tuple[int, float]:
+        '''Contended write lock acquisitions so far and the total time spent waiting.'''
+        header = self.header()
+        return header["lock_waits"], header["lock_wait_seconds"]
+
+    # Cleaner statistics, for /metrics
+    @property
+    def sweeps(self) -> int:
+        return self.header()["sweeps"]
+
+    @property
+    def sweep_seconds(self) -> float:
+        return self.header()["sweep_seconds"]
+
+    @property
+    def expired_total(self) -> int:
+        return self.header()["expired"]
+
+    # Shared memory access
+    def header(self) -> dict:
+        return dict(zip(HEADER_FIELDS, self._read(HEADER, 0)))
+
+    @contextmanager
+    def write(self) -> Iterator[dict]:
+        '''
+        Hold the cross-process write lock and yield the header as a dict;
+        changes to it are written back when the block ends.
+        '''
+        waited = 0.0
+        # An uncontended acquire costs no clock reads
+        if not self._write_lock.acquire(block=False):
+            start = time.perf_counter()
+            self._write_lock.acquire()
+            waited = time.perf_counter() - start
+        try:
+            original = self.header()
+            header = dict(original)
+            if waited:
+                header["lock_waits"] += 1
+                header["lock_wait_seconds"] += waited
+            yield header
+            if header != original:
+                self._write(HEADER, 0, *(header[field] for field in HEADER_FIELDS))
+        finally:
+            self._write_lock.release()
+
+    def _record_offset(self, slot: int) -> int:
+        return RECORDS_OFFSET + slot * RECORD.size
+
+    def _record(self, slot: int) -> tuple:
+        return self._read(RECORD, self._record_offset(slot))
+
+    def _read(self, layout: struct.Struct, offset: int) -> tuple:
+        buf = self.buf
+        while True:
+            (before,) = VERSION.unpack_from(buf, offset)
+            if not before & 1:
+                values = layout.unpack_from(buf, offset)
+                (after,) = VERSION.unpack_from(buf, offset)
+                if before == after:
+                    return values[1:]
+            # A writer is in the middle of it, let it finish
+            time.sleep(0)
+
+    # Caller holds the write lock
+    def _write(self, layout: struct.Struct, offset: int, *values) -> None:
+        buf = self.buf
+        (version,) = VERSION.unpack_from(buf, offset)
+        VERSION.pack_into(buf, offset, (version + 1) & 0xFFFFFFFF)
+        layout.pack_into(buf, offset, (version + 1) & 0xFFFFFFFF, *values)
+        VERSION.pack_into(buf, offset, (version + 2) & 0xFFFFFFFF)
+
+    @staticmethod
+    def _is_near(x: float, y: float, near: tuple[float, float, float]) -> bool:
+        nx, ny, radius = near
+        return (x - nx) ** 2 + (y - ny) ** 2 <= radius * radius
+
+    def _player_dict(self, pid: int, x: float, y: float, map_id: int) -> dict:
+        return {
+            "id": pid,
+            "x": x,
+            "y": y,
+            "map": self.maps.name_of(map_id)
+        }
@@ -0,0 +1,25 @@
+import json
+from typing import NamedTuple, Optional
+
+from shared.wireFormat import BINARY_CONTENT_TYPE
+
+# The binary codec itself is in shared/wireFormat.py, the game client uses it too.
+# Plain text answers (GET /metrics), in the Prometheus exposition format
+TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class EncodedBody(NamedTuple):
+    '''A response body that is already encoded, as routes may return it.'''
+    data: bytes
+    content_type: str
+    etag: Optional[str] = None
+
+def encode_body(obj: object) -> EncodedBody:
+    '''Response body and content type for what a route returned.'''
+    if isinstance(obj, EncodedBody):
+        return obj
+    if isinstance(obj, bytes):
+        return EncodedBody(obj, BINARY_CONTENT_TYPE)
+    if isinstance(obj, str):
+        return EncodedBody(obj.encode("utf-8"), TEXT_CONTENT_TYPE)
+    return EncodedBody(json.dumps(obj).encode("utf-8"), "application/json")
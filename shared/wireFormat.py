@@ -0,0 +1,88 @@
+import struct
+from typing import Optional
+
+# Compact binary alternative to the JSON bodies of POST/GET /players, used
+# by both the server and the game client. A client opts in per request with
+# Content-Type (POST) or Accept (GET) set to BINARY_CONTENT_TYPE; everything
+# else keeps talking JSON.
+BINARY_CONTENT_TYPE = "application/x-monstergo"
+
+# Maps with a binary id, its index here. "" is where a player is between
+# registering and its first update. Positions on any other map still go
+# over JSON, and binary answers carry UNKNOWN_MAP for them.
+KNOWN_MAPS = ("", "map.tmx", "gym.tmx", "mountain.tmx", "happyhappy.tmx")
+UNKNOWN_MAP = 0xFFFF
+
+# id uint32, x/y float32 (pixels), map id uint16
+POSITION = struct.Struct("<IffH")
+# seq uint64, full uint8, player count uint32, removed count uint32
+PLAYERS_HEADER = struct.Struct("<QBII")
+REMOVED_ID = struct.Struct("<I")
+
+
+class MapTable:
+    """
+    Small-integer ids for the binary format. The server hands its names to
+    each client at registration; the table is fixed, so map names from
+    clients never grow it.
+    """
+    def __init__(self, names: tuple[str, ...] = KNOWN_MAPS):
+        self._names = tuple(names)
+        self._ids = {name: i for i, name in enumerate(self._names)}
+
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def id_of(self, name: str) -> int:
+        '''Raises ValueError for a map that is not in the table.'''
+        map_id = self._ids.get(name)
+        if map_id is None:
+            raise ValueError(f"unknown map {name!r}")
+        return map_id
+
+    def find(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def name_of(self, map_id: int) -> str | None:
+        names = self._names
+        return names[map_id] if map_id < len(names) else None
+
+
+def encode_position(pid: int, x: float, y: float, map_id: int) -> bytes:
+    return POSITION.pack(pid, x, y, map_id)
+
+def decode_position(data: bytes) -> tuple[int, float, float, int]:
+    return POSITION.unpack(data)
+
+def encode_players(answer: dict, maps: MapTable) -> bytes:
+    '''Binary form of a PlayerHandler.players_since answer.'''
+    players = answer["players"]
+    removed = answer["removed"]
+    parts = [PLAYERS_HEADER.pack(answer["seq"], answer["full"], len(players), len(removed))]
+    pack = POSITION.pack
+    find = maps.find
+    for p in players.values():
+        map_id = find(p["map"])
+        parts.append(pack(p["id"], p["x"], p["y"], UNKNOWN_MAP if map_id is None else map_id))
+    for pid in removed:
+        parts.append(REMOVED_ID.pack(pid))
+    return b"".join(parts)
+
+def decode_players(data: bytes, map_names: list[str]) -> dict:
+    '''
+    Inverse of encode_players, giving the same shape as the JSON answer.
+    Map ids past the end of map_names (UNKNOWN_MAP) decode to None.
+    '''
+    seq, full, n_players, n_removed = PLAYERS_HEADER.unpack_from(data, 0)
+    offset = PLAYERS_HEADER.size
+    players = {}
+    for pid, x, y, map_id in POSITION.iter_unpack(data[offset:offset + n_players * POSITION.size]):
+        players[pid] = {
+            "id": pid,
+            "x": x,
+            "y": y,
+            "map": map_names[map_id] if map_id < len(map_names) else None,
+        }
+    offset += n_players * POSITION.size
+    removed = [pid for (pid,) in REMOVED_ID.iter_unpack(data[offset:offset + n_removed * REMOVED_ID.size])]
+    return {"seq": seq, "full": bool(full), "players": players, "removed": removed}
@@ -1,7 +1,7 @@
 import pygame as pg
 
 from src.utils import GameSettings, Logger
-from .services import scene_manager, input_manager
+from .services import scene_manager, input_manager, sound_manager
 
 from src.scenes.menu_scene import MenuScene
 from src.scenes.game_scene import GameScene
@@ -51,6 +51,7 @@ class Engine:
 
     def update(self, dt: float):
         scene_manager.update(dt)
+        sound_manager.update()
 
     def render(self):
         self.screen.fill((0, 0, 0))     # Make sure the display is cleared
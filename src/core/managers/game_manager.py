@@ -4,8 +4,11 @@ import json, os
 import pygame as pg
 from typing import TYPE_CHECKING
 
+TRANSITION_WATCH_TIME = 0.5     # seconds of frames checked for spikes after a map switch
+
 if TYPE_CHECKING:
     from src.maps.map import Map
+    from src.maps.map_store import MapStore
     from src.entities.player import Player
     from src.entities.enemy_trainer import EnemyTrainer
     from src.entities.seller import Seller
@@ -21,7 +24,7 @@ class GameManager:
 
     # Map properties
     current_map_key: str
-    maps: dict[str, Map]
+    maps: MapStore
 
     # Changing Scene properties
     should_change_scene: bool
@@ -29,7 +32,7 @@ class GameManager:
 
     def __init__(
         self,
-        maps: dict[str, Map],
+        maps: MapStore,
         start_map: str,
         player: Player | None,
         enemy_trainers: dict[str, list[EnemyTrainer]],
@@ -54,6 +57,11 @@ class GameManager:
         self.gscene=False
         self.gsceneinfo={}
         self.run=False
+
+        # Frame-time tracking around map transitions
+        self._transition_timer = 0.0
+        self._transition_spike = 0.0
+        self.max_transition_spike = 0.0
         
 
     @property
@@ -87,6 +95,31 @@ class GameManager:
             self.should_change_scene = False
             if self.player:
                 self.player.position = self.maps[self.current_map_key].spawn
+            self._transition_timer = TRANSITION_WATCH_TIME
+            self._transition_spike = 0.0
+
+    def update(self, dt: float) -> None:
+        # dt is the duration of the previous frame, so the switch frame shows up here
+        if self._transition_timer > 0:
+            self._transition_spike = max(self._transition_spike, dt)
+            self._transition_timer -= dt
+            if self._transition_timer <= 0:
+                self.max_transition_spike = max(self.max_transition_spike, self._transition_spike)
+                Logger.info(
+                    f"Map transition to '{self.current_map_key}': largest frame "
+                    f"{self._transition_spike * 1000:.1f} ms (worst so far {self.max_transition_spike * 1000:.1f} ms)"
+                )
+
+        self.prefetch_nearby_maps()
+        self.maps.update()
+
+    def prefetch_nearby_maps(self) -> None:
+        if self.player is None:
+            return
+        reach = GameSettings.PREFETCH_DISTANCE_TILES * GameSettings.TILE_SIZE
+        for tp in self.current_teleporter:
+            if self.player.position.distance_to(Position(tp.rect.x, tp.rect.y)) <= reach:
+                self.maps.prefetch(tp.destination)
 
     def check_collision(self, rect: pg.Rect) -> bool:
         if self.maps[self.current_map_key].check_collision(rect):
@@ -117,8 +150,8 @@ class GameManager:
 
     def to_dict(self) -> dict[str, object]:
         map_blocks: list[dict[str, object]] = []
-        for key, m in self.maps.items():
-            block = m.to_dict()
+        for key in self.maps:
+            block = self.maps.map_block(key)
             block["enemy_trainers"] = [
                 t.to_dict() for t in self.enemy_trainers.get(key, [])
             ]
@@ -133,7 +166,7 @@ class GameManager:
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "GameManager":
-        from src.maps.map import Map
+        from src.maps.map_store import MapStore
         from src.entities.player import Player
         from src.entities.enemy_trainer import EnemyTrainer
         from src.data.bag import Bag
@@ -141,13 +174,13 @@ class GameManager:
 
         Logger.info("Loading maps")
         maps_data = data["map"]
-        maps: dict[str, Map] = {}
         player_spawns: dict[str, Position] = {}
         trainers: dict[str, list[EnemyTrainer]] = {}
 
+        # Maps are only built when first accessed (see MapStore)
+        maps = MapStore({entry["path"]: entry for entry in maps_data})
         for entry in maps_data:
             path = entry["path"]
-            maps[path] = Map.from_dict(entry)
             sp = entry.get("player")
             if sp:
                 player_spawns[path] = Position(
@@ -1,9 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
+import json
+import socket
 import threading
 import time
+from collections import deque
+from urllib.parse import urlparse
 from src.utils import Logger, GameSettings
+from shared.wireFormat import BINARY_CONTENT_TYPE, decode_players, encode_position
 
-POLL_INTERVAL = 0.02
+# Remote players are drawn INTERPOLATION_DELAY in the past, between the
+# positions received around that time, so ~10 Hz of updates is enough to
+# look smooth. Two update intervals: one late or lost update is bridged.
+POLL_INTERVAL = 0.1
+SEND_INTERVAL = 0.1     # at most 10 position updates per second
+INTERPOLATION_DELAY = 0.2
+MAX_EXTRAPOLATION = 0.25    # keep moving a late player at its last velocity at most this long
+HISTORY_SIZE = 8            # snapshots kept per remote player
+PUSH_RETRY_MIN = 1.0        # seconds before retrying a failed push channel, doubled per failure
+PUSH_RETRY_MAX = 30.0
 
 class OnlineManager:
     list_players: list[dict]
@@ -12,6 +27,22 @@ class OnlineManager:
     _stop_event: threading.Event
     _thread: threading.Thread | None
     _lock: threading.Lock
+    _session: requests.Session
+    # Latest position handed over by the game loop, sent by the poller thread
+    _pending: tuple[float, float, str] | None
+    _last_sent: tuple[float, float, str] | None
+    _last_send_time: float
+    # Local replica of the other players (pushed, or polled as deltas), keyed by id
+    _remote: dict[int, dict]
+    _remote_seq: int | None
+    _remote_map: str | None
+    # ETag of the last /players answer, sent back so the server can answer 304
+    _remote_etag: str | None
+    # Timestamped (time, x, y) snapshots per remote player, for interpolation
+    _history: dict[int, deque[tuple[float, float, float]]]
+    # Map table from registration, None when the binary wire format is off
+    _map_names: list[str] | None
+    _map_ids: dict[str, int]
     
     def __init__(self):
         self.base: str = GameSettings.ONLINE_SERVER_URL
@@ -21,6 +52,22 @@ class OnlineManager:
         self._thread = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
+
+        # One keep-alive connection pool shared by register, update and fetch
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+        self._pending = None
+        self._last_sent = None
+        self._last_send_time = 0.0
+        self._remote = {}
+        self._remote_seq = None
+        self._remote_map = None
+        self._remote_etag = None
+        self._history = {}
+        self._map_names = None
+        self._map_ids = {}
         
         Logger.info("OnlineManager initialized")
         
@@ -30,22 +77,62 @@ class OnlineManager:
             
     def exit(self):
         self.stop()
+        self._session.close()
         
     def get_list_players(self) -> list[dict]:
         with self._lock:
             return list(self.list_players)
 
+    def get_interpolated_players(self) -> list[dict]:
+        '''
+        Like get_list_players, with each position interpolated to
+        INTERPOLATION_DELAY ago from the received snapshots (extrapolated
+        for a short while if snapshots are late). Use this for drawing.
+        '''
+        render_time = time.monotonic() - INTERPOLATION_DELAY
+        result = []
+        with self._lock:
+            for p in self.list_players:
+                samples = self._history.get(p["id"])
+                if samples:
+                    x, y = self._sample_at(samples, render_time)
+                    p = {**p, "x": x, "y": y}
+                result.append(p)
+        return result
+
+    @staticmethod
+    def _sample_at(samples: deque[tuple[float, float, float]], t: float) -> tuple[float, float]:
+        t1, x1, y1 = samples[-1]
+        if t >= t1:
+            if len(samples) < 2:
+                return x1, y1
+            t0, x0, y0 = samples[-2]
+            if t1 <= t0:
+                return x1, y1
+            dt = min(t - t1, MAX_EXTRAPOLATION) / (t1 - t0)
+            return x1 + (x1 - x0) * dt, y1 + (y1 - y0) * dt
+        for i in range(len(samples) - 2, -1, -1):
+            t0, x0, y0 = samples[i]
+            if t0 <= t:
+                a = (t - t0) / (t1 - t0)
+                return x0 + (x1 - x0) * a, y0 + (y1 - y0) * a
+            t1, x1, y1 = t0, x0, y0
+        return x1, y1
+
     # ------------------------------------------------------------------
     # Threading and API Calling Below
     # ------------------------------------------------------------------
     def register(self):
         try:
             url = f"{self.base}/register"
-            resp = requests.get(url, timeout=5)
+            resp = self._session.get(url, timeout=5)
             resp.raise_for_status()
             data = resp.json()
             if resp.status_code == 200:
                 self.player_id = data["id"]
+                if GameSettings.ONLINE_BINARY and "maps" in data:
+                    self._map_names = data["maps"]
+                    self._map_ids = {name: i for i, name in enumerate(self._map_names)}
                 Logger.info(f"OnlineManager registered with id={self.player_id}")
             else:
                 Logger.error("Registration failed:", data)
@@ -54,25 +141,54 @@ class OnlineManager:
         return
 
     def update(self, x: float, y: float, map_name: str) -> bool:
+        '''
+        Hand the latest position to the poller thread; never blocks the game loop.
+        Only the most recent position is kept, older unsent ones are dropped.
+        '''
         if self.player_id == -1:
             # Try to register again
             return False
-        
+
+        with self._lock:
+            self._pending = (x, y, map_name)
+        return True
+
+    def _next_position(self) -> tuple[float, float, str] | None:
+        # Latest position if it changed and the send rate allows it
+        now = time.monotonic()
+        if now - self._last_send_time < SEND_INTERVAL:
+            return None
+        with self._lock:
+            pending = self._pending
+        if pending is None or pending == self._last_sent:
+            return None
+        self._last_send_time = now
+        return pending
+
+    def _publish_position(self) -> None:
+        pending = self._next_position()
+        if pending is None:
+            return
+
+        x, y, map_name = pending
         url = f"{self.base}/players"
-        body = {"id": self.player_id, "x": x, "y": y, "map": map_name}
         try:
-            resp = requests.post(url, json=body, timeout=5)
+            map_id = self._map_ids.get(map_name)
+            if map_id is not None:
+                resp = self._session.post(
+                    url, data=encode_position(self.player_id, x, y, map_id),
+                    headers={"Content-Type": BINARY_CONTENT_TYPE}, timeout=5
+                )
+            else:
+                # Map unknown to our table (or binary disabled): plain JSON
+                body = {"id": self.player_id, "x": x, "y": y, "map": map_name}
+                resp = self._session.post(url, json=body, timeout=5)
             if resp.status_code == 200:
-                return True
+                self._last_sent = pending
+                return
             Logger.warning(f"Update failed: {resp.status_code} {resp.text}")
         except Exception as e:
-            if self._on_error:
-                try:
-                    self._on_error(e)
-                except Exception:
-                    pass
             Logger.warning(f"Online update error: {e}")
-        return False
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -91,20 +207,166 @@ class OnlineManager:
             self._thread.join(timeout=2)
 
     def _loop(self) -> None:
-        while not self._stop_event.wait(POLL_INTERVAL):
+        # Push channel when available. While it is down, poll over HTTP and
+        # try the channel again with exponential backoff.
+        backoff = PUSH_RETRY_MIN
+        retry_at = 0.0
+        while not self._stop_event.is_set():
+            if GameSettings.ONLINE_PUSH and time.monotonic() >= retry_at:
+                if self._push_loop():
+                    # The channel was up, so a drop is worth retrying soon
+                    backoff = PUSH_RETRY_MIN
+                if self._stop_event.is_set():
+                    return
+                Logger.info(f"OnlineManager polling, push channel retry in {backoff:.0f}s")
+                retry_at = time.monotonic() + backoff
+                backoff = min(backoff * 2, PUSH_RETRY_MAX)
+                # The replica may be ahead of the last polled seq, start polling from a snapshot
+                self._remote_seq = None
+                self._remote_etag = None
+                continue
+            if self._stop_event.wait(POLL_INTERVAL):
+                return
+            self._publish_position()
             self._fetch_players()
+
+    def _push_loop(self) -> bool:
+        '''
+        Exchange positions over the server's raw-TCP push channel (see
+        server/pushServer.py) until it fails or the manager stops.
+        Returns whether the channel was established at all.
+        '''
+        if self.player_id == -1:
+            return False
+        host = urlparse(self.base).hostname or "localhost"
+        connected = False
+        try:
+            with socket.create_connection((host, GameSettings.ONLINE_PUSH_PORT), timeout=2) as sock:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.sendall(self._encode_line({"type": "hello", "id": self.player_id}))
+                sock.settimeout(POLL_INTERVAL)
+                connected = True
+                Logger.info("OnlineManager using push channel")
+
+                buffer = b""
+                while not self._stop_event.is_set():
+                    pending = self._next_position()
+                    if pending is not None:
+                        x, y, map_name = pending
+                        sock.sendall(self._encode_line({"type": "pos", "x": x, "y": y, "map": map_name}))
+                        self._last_sent = pending
+                    try:
+                        data = sock.recv(65536)
+                    except socket.timeout:
+                        # Nothing changed: still a snapshot for interpolation
+                        self._refresh_list_players()
+                        continue
+                    if not data:
+                        raise ConnectionError("push channel closed by server")
+                    buffer += data
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        self._apply_push(json.loads(line))
+        except Exception as e:
+            if not self._stop_event.is_set():
+                Logger.warning(f"OnlineManager push channel error: {e}")
+        return connected
+
+    def _apply_push(self, msg: dict) -> None:
+        if msg["type"] == "snapshot":
+            self._remote = {p["id"]: p for p in msg["players"]}
+        elif msg["type"] == "delta":
+            for p in msg["changed"]:
+                self._remote[p["id"]] = p
+            for pid in msg["removed"]:
+                self._remote.pop(pid, None)
+        self._refresh_list_players()
+
+    def _refresh_list_players(self) -> None:
+        pid = self.player_id
+        filtered = [p for key, p in self._remote.items() if key != pid]
+        now = time.monotonic()
+        with self._lock:
+            self.list_players = filtered
+            # A sample per position change, stamped when it arrived. Refreshes
+            # come at their own pace, so an unchanged position usually means the
+            # next update is not here yet; only one unchanged for
+            # INTERPOLATION_DELAY is a player that stopped. A stop gets a sample
+            # so the player is not extrapolated past where it stands, and so
+            # does the start after it, or the first step would be spread over
+            # the whole time it stood.
+            history = {}
+            for p in filtered:
+                samples = self._history.get(p["id"])
+                if samples is None:
+                    samples = deque(maxlen=HISTORY_SIZE)
+                position = (p["x"], p["y"])
+                if not samples:
+                    samples.append((now, *position))
+                    history[p["id"]] = samples
+                    continue
+                t1, x1, y1 = samples[-1]
+                standing = now - t1 >= INTERPOLATION_DELAY
+                if position != (x1, y1):
+                    if t1 >= now:
+                        # Moved again within one clock tick (several pushed lines
+                        # in one read, a coarse clock): keep only the latest
+                        samples[-1] = (t1, *position)
+                    else:
+                        if standing:
+                            samples.append((now - SEND_INTERVAL, x1, y1))
+                        samples.append((now, *position))
+                elif standing and len(samples) > 1 and samples[-2][1:] != (x1, y1):
+                    samples.append((now, x1, y1))
+                history[p["id"]] = samples
+            self._history = history
+
+    @staticmethod
+    def _encode_line(msg: dict) -> bytes:
+        return json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n"
             
     def _fetch_players(self) -> None:
         try:
             url = f"{self.base}/players"
-            resp = requests.get(url, timeout=5)
+            # Only players on our map are ever drawn, let the server filter the rest out
+            with self._lock:
+                pending = self._pending
+            map_name = pending[2] if pending is not None else None
+            if map_name != self._remote_map:
+                # Different filter, the replica has to be rebuilt from a full snapshot
+                self._remote_map = map_name
+                self._remote_seq = None
+                self._remote_etag = None
+            params = {}
+            if map_name is not None:
+                params["map"] = map_name
+            if self._remote_seq is not None:
+                params["since"] = self._remote_seq
+            # Binary answers name maps by id, so only when our map has one in the table
+            headers = {"Accept": BINARY_CONTENT_TYPE} if map_name in self._map_ids else {}
+            if self._remote_etag is not None:
+                headers["If-None-Match"] = self._remote_etag
+            resp = self._session.get(url, params=params, headers=headers, timeout=5)
             resp.raise_for_status()
-            all_players = resp.json().get("players", [])
+            if resp.status_code == 304:
+                # Nothing changed, the replica is current
+                self._refresh_list_players()
+                return
+            self._remote_etag = resp.headers.get("ETag")
+            if resp.headers.get("Content-Type") == BINARY_CONTENT_TYPE:
+                data = decode_players(resp.content, self._map_names)
+            else:
+                data = resp.json()
 
-            pid = self.player_id
-            filtered = [p for key, p in all_players.items() if int(key) != pid]
-            with self._lock:
-                self.list_players = filtered
+            # Apply the delta (or full snapshot) to the local replica
+            if data.get("full", True):
+                self._remote = {}
+            for p in data.get("players", {}).values():
+                self._remote[p["id"]] = p
+            for removed in data.get("removed", []):
+                self._remote.pop(removed, None)
+            self._remote_seq = data.get("seq")
+            self._refresh_list_players()
             
         except Exception as e:
-            Logger.warning(f"OnlineManager fetch error: {e}")
\ No newline at end of file
+            Logger.warning(f"OnlineManager fetch error: {e}")
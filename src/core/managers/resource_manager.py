@@ -1,6 +1,11 @@
 import pygame as pg
+from collections import OrderedDict
+from typing import Hashable
 from src.utils import load_img, load_font, load_sound
 
+MAX_SCALED = 256    # scaled image variants kept, least recently used go first
+MAX_TEXTS = 512     # rendered text surfaces kept, least recently used go first
+
 class ResourceManager:
     """
     Make sure you are not loading the resource twice
@@ -10,12 +15,36 @@ class ResourceManager:
         self._images: dict[str, pg.Surface] = {}
         self._sounds: dict[str, pg.mixer.Sound] = {}
         self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self._sys_fonts: dict[tuple[str | None, int, bool], pg.font.Font] = {}
+        self._texts: OrderedDict[tuple[str, str | None, int, bool, tuple[int, ...]], pg.Surface] = OrderedDict()
+        self._tiles: dict[tuple[Hashable, tuple[int, int]], pg.Surface] = {}
+        self._scaled: OrderedDict[tuple[str, tuple[int, int], bool], pg.Surface] = OrderedDict()
+        self._frames: dict[tuple[str, tuple[str, ...], int, tuple[int, int]], dict[str, tuple[pg.Surface, ...]]] = {}
 
     def get_image(self, path: str) -> pg.Surface:
         if path not in self._images:
             self._images[path] = load_img(path)
         return self._images[path]
 
+    def get_scaled(self, path: str, size: tuple[int, int], flip: bool = False) -> pg.Surface:
+        """
+        Image scaled to size, mirrored horizontally first if flip. For images
+        drawn at a fixed size every frame; keeps the last MAX_SCALED variants.
+        """
+        key = (path, (int(size[0]), int(size[1])), flip)
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            image = self.get_image(path)
+            if flip:
+                image = pg.transform.flip(image, True, False)
+            scaled = pg.transform.scale(image, key[1])
+            self._scaled[key] = scaled
+            if len(self._scaled) > MAX_SCALED:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+        return scaled
+
     def get_sound(self, path: str) -> pg.mixer.Sound:
         if path not in self._sounds:
             self._sounds[path] = load_sound(path)
@@ -27,8 +56,80 @@ class ResourceManager:
             self._fonts[key] = load_font(path, size)
         return self._fonts[key]
 
+    def get_sys_font(self, name: str | None, size: int, bold: bool = False) -> pg.font.Font:
+        """System font by name, None for pygame's default font."""
+        key = (name, size, bold)
+        if key not in self._sys_fonts:
+            self._sys_fonts[key] = pg.font.SysFont(name, size, bold=bold)
+        return self._sys_fonts[key]
+
+    def render_text(
+        self, text: str, size: int, color: tuple[int, ...],
+        name: str | None = None, bold: bool = False
+    ) -> pg.Surface:
+        """
+        Antialiased text in the get_sys_font(name, size, bold) font. Labels that
+        stay the same between frames are rendered once; keeps the last
+        MAX_TEXTS surfaces. Treat the result as read-only.
+        """
+        key = (text, name, size, bold, tuple(color))
+        surface = self._texts.get(key)
+        if surface is None:
+            surface = self.get_sys_font(name, size, bold).render(text, True, color)
+            self._texts[key] = surface
+            if len(self._texts) > MAX_TEXTS:
+                self._texts.popitem(last=False)
+        else:
+            self._texts.move_to_end(key)
+        return surface
+
+    def get_tile(self, key: Hashable, image: pg.Surface, size: tuple[int, int]) -> pg.Surface:
+        """
+        Scaled map tile shared by every map. key must identify the tile image
+        across maps (e.g. tileset source + local id), not just the map's gid.
+        """
+        cache_key = (key, size)
+        if cache_key not in self._tiles:
+            scaled = pg.transform.scale(image, size)
+            # Only keep per-pixel alpha for tiles that have it, opaque blits are much cheaper
+            if image.get_flags() & pg.SRCALPHA:
+                self._tiles[cache_key] = scaled.convert_alpha()
+            else:
+                self._tiles[cache_key] = scaled.convert()
+        return self._tiles[cache_key]
+
+    def get_frames(
+        self, path: str, rows: tuple[str, ...], n_keyframes: int, size: tuple[int, int]
+    ) -> dict[str, tuple[pg.Surface, ...]]:
+        """
+        Scaled frames of a spritesheet (one row per name in rows, n_keyframes
+        columns), shared by every Animation of the same sheet. Treat the result
+        as read-only.
+        """
+        key = (path, rows, n_keyframes, size)
+        if key not in self._frames:
+            sheet = self.get_image(path)
+            sheet_w, sheet_h = sheet.get_size()
+            frame_w = sheet_w // n_keyframes
+            frame_h = sheet_h // len(rows)
+            self._frames[key] = {
+                name: tuple(
+                    pg.transform.smoothscale(
+                        sheet.subsurface(pg.Rect(c * frame_w, r * frame_h, frame_w, frame_h)), size
+                    )
+                    for c in range(n_keyframes)
+                )
+                for r, name in enumerate(rows)
+            }
+        return self._frames[key]
+
     def clear(self) -> None:
         """Clear all cached assets (useful when switching levels)."""
         self._images.clear()
         self._sounds.clear()
         self._fonts.clear()
+        self._sys_fonts.clear()
+        self._texts.clear()
+        self._tiles.clear()
+        self._scaled.clear()
+        self._frames.clear()
@@ -1,26 +1,55 @@
 import pygame as pg
-from src.utils import load_sound, GameSettings
+from src.utils import load_sound, load_music, GameSettings
+
+BGM_FADE_MS = 600   # fade out of the old track, then fade in of the new one
 
 class SoundManager:
+    """
+    Background music is streamed through pygame.mixer.music, so switching
+    tracks does not decode a whole file up front or keep it in memory.
+    Short effects (play_sound) are still played as Sounds on the mixer channels.
+    """
     def __init__(self):
         pg.mixer.init()
         pg.mixer.set_num_channels(GameSettings.MAX_CHANNELS)
-        self.current_bgm = None
+        self.current_bgm: str | None = None     # path of the track playing or fading in
         self.volume = 0.7
-        
-    def play_bgm(self, filepath: str):
-        if self.current_bgm:
-            self.current_bgm.stop()
-        audio = load_sound(filepath)
-        audio.set_volume(GameSettings.AUDIO_VOLUME)
-        audio.play(-1)
-        self.current_bgm = audio
+        self._pending_bgm: tuple[str, int] | None = None
+
+    def play_bgm(self, filepath: str, fade_ms: int = BGM_FADE_MS):
+        if filepath == self.current_bgm and self._pending_bgm is None and pg.mixer.music.get_busy():
+            return
+        self.current_bgm = filepath
+        if pg.mixer.music.get_busy() and fade_ms > 0:
+            # The new track starts from update() once the old one has faded out
+            if self._pending_bgm is None:
+                pg.mixer.music.fadeout(fade_ms)
+            self._pending_bgm = (filepath, fade_ms)
+        else:
+            self._pending_bgm = None
+            self._start_bgm(filepath, fade_ms)
+
+    def update(self):
+        if self._pending_bgm is not None and not pg.mixer.music.get_busy():
+            filepath, fade_ms = self._pending_bgm
+            self._pending_bgm = None
+            self._start_bgm(filepath, fade_ms)
+
+    def _start_bgm(self, filepath: str, fade_ms: int):
+        load_music(filepath)
+        pg.mixer.music.set_volume(GameSettings.AUDIO_VOLUME)
+        pg.mixer.music.play(-1, fade_ms=fade_ms)
+
+    def set_bgm_volume(self, volume: float):
+        pg.mixer.music.set_volume(volume)
         
     def pause_all(self):
         pg.mixer.pause()
+        pg.mixer.music.pause()
 
     def resume_all(self):
         pg.mixer.unpause()
+        pg.mixer.music.unpause()
         
     def play_sound(self, filepath):
         sound = load_sound(filepath)
@@ -29,5 +58,7 @@ class SoundManager:
 
     def stop_all_sounds(self):
         pg.mixer.stop()
+        pg.mixer.music.stop()
         self.current_bgm = None
+        self._pending_bgm = None
     
\ No newline at end of file
@@ -14,6 +14,8 @@ from src.core.services import input_manager, scene_manager, resource_manager
 from src.utils import GameSettings, Direction, Position, PositionCamera, Logger
 from src.interface.components import Button
 
+SHOP_FONT = "Arial"
+SHOP_FONT_SIZE = 24
 
 class SellerClassification(Enum):
     STATIONARY = "stationary"
@@ -38,7 +40,6 @@ class Seller(Entity):
     shop_items: list[dict[str, object]]
     shop_buttons: list[Button]
     shop_info: str
-    font: pygame.font.Font
 
     @override
     def __init__(
@@ -105,9 +106,6 @@ class Seller(Entity):
             self._close_shop,
         )
 
-        # Font
-        self.font = pygame.font.SysFont("Arial", 24)
-
     @override
     def update(self, dt: float) -> None:
         """Update seller movement, detection, and shop UI."""
@@ -211,28 +209,27 @@ class Seller(Entity):
             self.panel_sprite.draw(screen)
 
             # Title & info
-            screen.blit(self.font.render("Shop", True, (255, 255, 0)), (330, 150))
-            screen.blit(self.font.render(self.shop_info, True, (255, 255, 255)), (260, 400))
+            screen.blit(resource_manager.render_text("Shop", SHOP_FONT_SIZE, (255, 255, 0), SHOP_FONT), (330, 150))
+            screen.blit(
+                resource_manager.render_text(self.shop_info, SHOP_FONT_SIZE, (255, 255, 255), SHOP_FONT), (260, 400)
+            )
 
             for btn in self.shop_buttons: btn.draw(screen)
 
             for data in self.shop_items:
                 sprite_path=data["sprite_path"]
-                text=self.font.render(
-                data["text"], True, (255, 255, 255)
-                )
+                text = resource_manager.render_text(data["text"], SHOP_FONT_SIZE, (255, 255, 255), SHOP_FONT)
                 y=data["y"]
 
-                img = resource_manager.get_image(sprite_path)
-                img = pygame.transform.scale(img, (50,50))
+                img = resource_manager.get_scaled(sprite_path, (50, 50))
                 screen.blit(img, (260, y ))
                 screen.blit(text, (350, y+15))
 
 
 
             # Coins
-            coins_text = self.font.render(
-                f"coins: ${self.game_manager.bag.get_coins()}", True, (255, 255, 255)
+            coins_text = resource_manager.render_text(
+                f"coins: ${self.game_manager.bag.get_coins()}", SHOP_FONT_SIZE, (255, 255, 255), SHOP_FONT
             )
             screen.blit(coins_text, (260, 440))
 
@@ -1 +1,2 @@
-from .map import Map
\ No newline at end of file
+from .map import Map
+from .map_store import MapStore
\ No newline at end of file
@@ -0,0 +1,97 @@
+import pygame as pg
+from collections import OrderedDict
+from typing import Callable
+
+from src.utils import GameSettings, PositionCamera
+
+# bake(target, tile_x, tile_y, tiles_w, tiles_h) renders that tile region
+# of the map into target, with the region's top-left at (0, 0)
+BakeFn = Callable[[pg.Surface, int, int, int, int], None]
+
+class ChunkRenderer:
+    """
+    Renders a tile map as fixed-size chunks that are baked on first use and
+    kept in an LRU cache bounded by a memory budget, so memory no longer
+    grows with map area and only the chunks under the camera are blitted.
+    """
+    chunk_tiles: int
+    budget_bytes: int
+    _chunks: OrderedDict[tuple[int, int], pg.Surface]
+    _used_bytes: int
+
+    def __init__(
+        self, bake: BakeFn, width: int, height: int,
+        chunk_tiles: int = GameSettings.MAP_CHUNK_TILES,
+        budget_bytes: int = GameSettings.MAP_CHUNK_CACHE_MB * 1024 * 1024,
+    ):
+        self._bake = bake
+        self.width = width            # in tiles
+        self.height = height          # in tiles
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = chunk_tiles * GameSettings.TILE_SIZE
+        self.cols = (width + chunk_tiles - 1) // chunk_tiles
+        self.rows = (height + chunk_tiles - 1) // chunk_tiles
+        self.budget_bytes = budget_bytes
+
+        self._chunks = OrderedDict()
+        self._used_bytes = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    def chunk_rect(self, cx: int, cy: int) -> pg.Rect:
+        """Pixel rect of chunk (cx, cy) in map space; edge chunks are clipped to the map."""
+        ts = GameSettings.TILE_SIZE
+        tx, ty = cx * self.chunk_tiles, cy * self.chunk_tiles
+        tw = min(self.chunk_tiles, self.width - tx)
+        th = min(self.chunk_tiles, self.height - ty)
+        return pg.Rect(tx * ts, ty * ts, tw * ts, th * ts)
+
+    def get_chunk(self, cx: int, cy: int) -> pg.Surface:
+        key = (cx, cy)
+        surf = self._chunks.get(key)
+        if surf is not None:
+            self._chunks.move_to_end(key)
+            return surf
+
+        rect = self.chunk_rect(cx, cy)
+        # The map is drawn first onto a black screen, so chunks can be opaque
+        # (black where no tile is); opaque blits are much cheaper than per-pixel alpha
+        surf = pg.Surface(rect.size)
+        self._bake(surf, cx * self.chunk_tiles, cy * self.chunk_tiles,
+                   rect.w // GameSettings.TILE_SIZE, rect.h // GameSettings.TILE_SIZE)
+        self._chunks[key] = surf
+        self._used_bytes += self._surface_bytes(surf)
+        return surf
+
+    def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
+        view_w, view_h = screen.get_size()
+        cx0 = max(camera.x // self.chunk_px, 0)
+        cy0 = max(camera.y // self.chunk_px, 0)
+        cx1 = min((camera.x + view_w - 1) // self.chunk_px, self.cols - 1)
+        cy1 = min((camera.y + view_h - 1) // self.chunk_px, self.rows - 1)
+
+        visible = 0
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                surf = self.get_chunk(cx, cy)
+                screen.blit(surf, (cx * self.chunk_px - camera.x, cy * self.chunk_px - camera.y))
+                visible += 1
+
+        # Chunks drawn this frame are the most recent ones, never evict them
+        self.trim(keep=visible)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._used_bytes = 0
+
+    def trim(self, keep: int = 0) -> None:
+        """Evict least recently used chunks until the cache fits the budget."""
+        while self._used_bytes > self.budget_bytes and len(self._chunks) > keep:
+            _, surf = self._chunks.popitem(last=False)
+            self._used_bytes -= self._surface_bytes(surf)
+
+    @staticmethod
+    def _surface_bytes(surf: pg.Surface) -> int:
+        return surf.get_pitch() * surf.get_height()
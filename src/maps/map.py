@@ -1,7 +1,11 @@
+import os
 import pygame as pg
 import pytmx
+from typing import Iterator
 
-from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport
+from src.utils import load_tmx, load_tmx_data, attach_tmx_images, Position, GameSettings, PositionCamera, Teleport
+from src.core.services import resource_manager
+from .chunk_renderer import ChunkRenderer
 
 class Map:
     # Map Properties
@@ -11,12 +15,22 @@ class Map:
     spawn: Position
     teleporters: list[Teleport]
     # Rendering Properties
-    _surface: pg.Surface
+    _chunks: ChunkRenderer
+    _minimap: pg.Surface
     _collision_map: list[pg.Rect]
+    _collision_grid: bytearray
+    _layer_grids: dict[str, bytearray]
+    _tile_keys: dict[int, tuple]
 
-    def __init__(self, path: str, tp: list[Teleport], spawn: Position):
+    def __init__(self, path: str, tp: list[Teleport], spawn: Position, defer_surfaces: bool = False):
+        '''
+        With defer_surfaces the constructor only does work that does not touch
+        pygame surfaces, so it can run on a background thread; bake_surfaces()
+        must then be run to completion on the main thread before the map is used.
+        '''
         self.path_name = path
-        self.tmxdata = load_tmx(path)
+        self.tmxdata = load_tmx_data(path) if defer_surfaces else load_tmx(path)
+        self._images_attached = not defer_surfaces
         self.spawn = spawn
         self.teleporters = tp
 
@@ -25,26 +39,41 @@ class Map:
         self.pixel_w=pixel_w
         self.pixel_h=pixel_h
 
-        # Prebake the map
-        self._surface = pg.Surface((pixel_w, pixel_h), pg.SRCALPHA)
-        
-        self._render_all_layers(self._surface)
+        # Scaled tiles are shared between maps through the resource manager
+        self._tile_keys = self._create_tile_keys()
+
+        # Map chunks are baked lazily and drawn only when under the camera
+        self._chunks = ChunkRenderer(self._render_region, self.tmxdata.width, self.tmxdata.height)
 
         self.minimap_scale = 0.15  # 小地圖縮放比例（可調）
-        self._minimap = pg.transform.smoothscale(
-            self._surface,
-            (int(pixel_w * self.minimap_scale), int(pixel_h * self.minimap_scale))
-        )
         # Prebake the collision map
         self._collision_map = self._create_collision_map()
-        
+        self._collision_grid = self._create_collision_grid(self._collision_map)
+        # Prebake the tile lookup for wild-encounter bushes
+        self._layer_grids = {}
+        self._layer_grid("bush")
+
+        if not defer_surfaces:
+            for _ in self.bake_surfaces():
+                pass
+
+    def bake_surfaces(self) -> Iterator[None]:
+        '''
+        Main-thread part of loading: tile images and the minimap.
+        Yields between steps so the work can be spread over several frames.
+        '''
+        if not self._images_attached:
+            attach_tmx_images(self.tmxdata)
+            self._images_attached = True
+            yield
+        yield from self._create_minimap()
 
     def update(self, dt: float):
         return
 
     def draw(self, screen: pg.Surface, camera: PositionCamera):
-        # Draw full map by camera
-        screen.blit(self._surface, camera.transform_position(Position(0, 0)))
+        # Draw the visible chunks of the map by camera
+        self._chunks.draw(screen, camera)
         
         if GameSettings.DRAW_HITBOXES:
             for rect in self._collision_map:
@@ -105,9 +134,22 @@ class Map:
         Return True if collide if rect param collide with self._collision_map
         Hint: use API colliderect and iterate each rectangle to check
         '''
-        for coll_rect in self._collision_map:
-            if rect.colliderect(coll_rect):
-                return True
+        # Collision rects are whole tiles, so only the tiles the rect overlaps
+        # need to be looked up in the occupancy grid.
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        ts = GameSettings.TILE_SIZE
+        w = self.tmxdata.width
+        left = max(rect.left // ts, 0)
+        right = min((rect.right - 1) // ts, w - 1)
+        top = max(rect.top // ts, 0)
+        bottom = min((rect.bottom - 1) // ts, self.tmxdata.height - 1)
+        grid = self._collision_grid
+        for ty in range(top, bottom + 1):
+            row = ty * w
+            for tx in range(left, right + 1):
+                if grid[row + tx]:
+                    return True
         return False
         
     def check_teleport(self, pos: Position) -> Teleport | None:
@@ -122,22 +164,89 @@ class Map:
         return None
 
     def _render_all_layers(self, target: pg.Surface) -> None:
+        self._render_region(target, 0, 0, self.tmxdata.width, self.tmxdata.height)
+
+    def _render_region(self, target: pg.Surface, tx: int, ty: int, tw: int, th: int) -> None:
         for layer in self.tmxdata.visible_layers:
             if isinstance(layer, pytmx.TiledTileLayer):
-                self._render_tile_layer(target, layer)
+                self._render_tile_layer(target, layer, tx, ty, tw, th)
             # elif isinstance(layer, pytmx.TiledImageLayer) and layer.image:
             #     target.blit(layer.image, (layer.x or 0, layer.y or 0))
  
-    def _render_tile_layer(self, target: pg.Surface, layer: pytmx.TiledTileLayer) -> None:
-        for x, y, gid in layer:
-            if gid == 0:
-                continue
-            image = self.tmxdata.get_tile_image_by_gid(gid)
-            if image is None:
-                continue
-
-            image = pg.transform.scale(image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
-            target.blit(image, (x * GameSettings.TILE_SIZE, y * GameSettings.TILE_SIZE))
+    def _render_tile_layer(
+        self, target: pg.Surface, layer: pytmx.TiledTileLayer,
+        tx: int, ty: int, tw: int, th: int
+    ) -> None:
+        # Render tiles [tx, tx + tw) x [ty, ty + th) with (tx, ty) at the target's origin
+        for y in range(ty, min(ty + th, layer.height)):
+            row = layer.data[y]
+            for x in range(tx, min(tx + tw, layer.width)):
+                gid = row[x]
+                if gid == 0:
+                    continue
+                image = self._get_scaled_tile(gid)
+                if image is None:
+                    continue
+
+                target.blit(image, ((x - tx) * GameSettings.TILE_SIZE, (y - ty) * GameSettings.TILE_SIZE))
+
+    def _get_scaled_tile(self, gid: int, size: tuple[int, int] | None = None) -> pg.Surface | None:
+        image = self.tmxdata.get_tile_image_by_gid(gid)
+        if image is None:
+            return None
+        if size is None:
+            size = (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE)
+        key = self._tile_keys.get(gid)
+        if key is None:
+            return pg.transform.scale(image, size)
+        return resource_manager.get_tile(key, image, size)
+
+    def _create_tile_keys(self) -> dict[int, tuple]:
+        # pytmx gids are per map, so key tiles by (tileset, local id, flip flags).
+        # A tileset with one image is that image, wherever it is declared;
+        # image-collection tilesets have no source and only belong to this map.
+        keys: dict[int, tuple] = {}
+        map_dir = os.path.dirname(self.tmxdata.filename)
+        for tiled_gid, entries in self.tmxdata.gidmap.items():
+            for gid, flags in entries:
+                try:
+                    tileset = self.tmxdata.get_tileset_from_gid(gid)
+                except ValueError:
+                    continue
+                if tileset.source:
+                    identity = os.path.normpath(os.path.join(map_dir, tileset.source))
+                else:
+                    identity = (os.path.normpath(self.tmxdata.filename), tileset.firstgid)
+                keys[gid] = (identity, tiled_gid - tileset.firstgid, tuple(flags))
+        return keys
+
+    def _create_minimap(self) -> Iterator[None]:
+        # Low-resolution pass: every tile is scaled straight to its minimap cell
+        # (shared through the resource manager), so no full-size chunk is baked
+        # at load time. Yields after every tile row.
+        scale = self.minimap_scale
+        ts = GameSettings.TILE_SIZE
+        w, h = self.tmxdata.width, self.tmxdata.height
+        minimap = pg.Surface((int(self.pixel_w * scale), int(self.pixel_h * scale)), pg.SRCALPHA)
+        # Minimap pixel edges of tile columns/rows; cells are 1 px apart in size at most
+        edges = [int(i * ts * scale) for i in range(max(w, h) + 1)]
+        layers = [layer for layer in self.tmxdata.visible_layers if isinstance(layer, pytmx.TiledTileLayer)]
+        for y in range(h):
+            cell_h = edges[y + 1] - edges[y]
+            for layer in layers:
+                if y >= layer.height or cell_h <= 0:
+                    continue
+                row = layer.data[y]
+                for x in range(min(w, layer.width)):
+                    gid = row[x]
+                    cell_w = edges[x + 1] - edges[x]
+                    if gid == 0 or cell_w <= 0:
+                        continue
+                    image = self._get_scaled_tile(gid, (cell_w, cell_h))
+                    if image is not None:
+                        minimap.blit(image, (edges[x], edges[y]))
+            yield
+        self._minimap = minimap
     
     def _create_collision_map(self) -> list[pg.Rect]:
         rects = []
@@ -160,11 +269,20 @@ class Map:
                         rects.append(rect)
         return rects
 
+    def _create_collision_grid(self, rects: list[pg.Rect]) -> bytearray:
+        # One byte per tile, row-major; 1 marks a blocked tile
+        ts = GameSettings.TILE_SIZE
+        w = self.tmxdata.width
+        grid = bytearray(w * self.tmxdata.height)
+        for rect in rects:
+            grid[(rect.y // ts) * w + rect.x // ts] = 1
+        return grid
+
     @classmethod
-    def from_dict(cls, data: dict) -> "Map":
+    def from_dict(cls, data: dict, defer_surfaces: bool = False) -> "Map":
         tp = [Teleport.from_dict(t) for t in data["teleport"]]
         pos = Position(data["player"]["x"] * GameSettings.TILE_SIZE, data["player"]["y"] * GameSettings.TILE_SIZE)
-        return cls(data["path"], tp, pos)
+        return cls(data["path"], tp, pos, defer_surfaces)
 
     def to_dict(self):
         return {
@@ -203,18 +321,34 @@ class Map:
         )
 
         # ----- 檢查 TMX 草叢 Layer -----
-        for layer in self.tmxdata.visible_layers:
-            lname = getattr(layer, "name", "")
-            if "bush" not in lname.lower():
-                continue
-
-            for x, y, gid in layer:
-                if gid == 0:
-                    continue
-                if (x, y) in sample_tiles:
-                    return True
+        for tx, ty in sample_tiles:
+            if self.is_tile_in_layer("bush", tx, ty):
+                return True
 
         return False
+
+    def is_tile_in_layer(self, keyword: str, tx: int, ty: int) -> bool:
+        '''
+        Return True if tile (tx, ty) is non-empty in any visible tile layer
+        whose name contains keyword (case-insensitive).
+        '''
+        if not (0 <= tx < self.tmxdata.width and 0 <= ty < self.tmxdata.height):
+            return False
+        return self._layer_grid(keyword)[ty * self.tmxdata.width + tx] != 0
+
+    def _layer_grid(self, keyword: str) -> bytearray:
+        keyword = keyword.lower()
+        grid = self._layer_grids.get(keyword)
+        if grid is None:
+            w = self.tmxdata.width
+            grid = bytearray(w * self.tmxdata.height)
+            for layer in self.tmxdata.visible_layers:
+                if isinstance(layer, pytmx.TiledTileLayer) and keyword in layer.name.lower():
+                    for x, y, gid in layer:
+                        if gid != 0:
+                            grid[y * w + x] = 1
+            self._layer_grids[keyword] = grid
+        return grid
     
 class Teleport:
     def __init__(self, x: int, y: int, destination: str):
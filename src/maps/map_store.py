@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, Mapping
+
+from src.utils import Logger, GameSettings
+from .map import Map
+
+class _Prefetch:
+    """A map being built in the background; its surfaces are baked later on the main thread."""
+    map: Map | None
+    steps: Iterator[None] | None
+
+    def __init__(self, block: dict):
+        self.block = block
+        self.map = None
+        self.steps = None
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        try:
+            self.map = Map.from_dict(self.block, defer_surfaces=True)
+        except Exception as e:
+            Logger.warning(f"Prefetch of map '{self.block['path']}' failed: {e}")
+        finally:
+            self.done.set()
+
+    def finish(self) -> Map | None:
+        """Bake the rest right away; only for a job whose background part is done."""
+        if self.map is None:
+            return None
+        if self.steps is None:
+            self.steps = self.map.bake_surfaces()
+        for _ in self.steps:
+            pass
+        return self.map
+
+
+class MapStore(Mapping[str, Map]):
+    """
+    Lazy container for the maps of a save. A Map is only built from its save
+    block the first time it is accessed, and at most `capacity` maps stay
+    loaded; the least recently used ones are evicted and their state is
+    written back to the save block so to_dict still round-trips.
+
+    prefetch() builds a map ahead of time: parsing happens on a background
+    thread and update() bakes the surfaces on the main thread a few
+    milliseconds per frame, so the first access is instant.
+    """
+    capacity: int
+    _blocks: dict[str, dict]
+    _loaded: OrderedDict[str, Map]
+    _prefetching: dict[str, _Prefetch]
+    _ready: OrderedDict[str, Map]
+
+    def __init__(self, blocks: dict[str, dict], capacity: int = GameSettings.MAX_LOADED_MAPS):
+        self.capacity = max(1, capacity)
+        self._blocks = blocks
+        self._loaded = OrderedDict()
+        self._prefetching = {}
+        self._ready = OrderedDict()
+
+    def __getitem__(self, key: str) -> Map:
+        m = self._loaded.get(key)
+        if m is not None:
+            self._loaded.move_to_end(key)
+            return m
+        if key not in self._blocks:
+            raise KeyError(key)
+
+        m = self._ready.pop(key, None)
+        job = self._prefetching.pop(key, None)
+        # A prefetch still parsing is abandoned rather than waited for; its thread
+        # finishes on its own and the map is loaded here as if never prefetched
+        if m is None and job is not None and job.done.is_set():
+            m = job.finish()
+        if m is None:
+            Logger.info(f"Loading map '{key}'")
+            m = Map.from_dict(self._blocks[key])
+        self._loaded[key] = m
+        self._evict()
+        return m
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._blocks
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._blocks)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._loaded
+
+    def map_block(self, key: str) -> dict:
+        """Map.to_dict() of the map, without loading it if it is not resident."""
+        m = self._loaded.get(key)
+        if m is not None:
+            return m.to_dict()
+        block = self._blocks[key]
+        return {
+            "path": block["path"],
+            "teleport": [dict(t) for t in block["teleport"]],
+            "player": dict(block["player"]) if block.get("player") else block.get("player"),
+        }
+
+    def prefetch(self, key: str) -> None:
+        """Start building a map in the background if it is not loaded or on its way."""
+        if key not in self._blocks or key in self._loaded or key in self._ready or key in self._prefetching:
+            return
+        Logger.info(f"Prefetching map '{key}'")
+        job = _Prefetch(dict(self._blocks[key]))
+        self._prefetching[key] = job
+        threading.Thread(target=job.run, name=f"MapPrefetch-{key}", daemon=True).start()
+
+    def update(self, budget: float = GameSettings.PREFETCH_FRAME_BUDGET_MS / 1000) -> None:
+        """Bake surfaces of background-parsed maps, spending at most `budget` seconds."""
+        deadline = time.perf_counter() + budget
+        for key, job in list(self._prefetching.items()):
+            if not job.done.is_set():
+                continue
+            if job.map is None:
+                del self._prefetching[key]
+                continue
+            if job.steps is None:
+                job.steps = job.map.bake_surfaces()
+            for _ in job.steps:
+                if time.perf_counter() >= deadline:
+                    return
+            del self._prefetching[key]
+            self._ready[key] = job.map
+            # Prefetched maps nobody walked into are dropped first
+            while len(self._ready) > self.capacity:
+                self._ready.popitem(last=False)
+
+    def _evict(self) -> None:
+        while len(self._loaded) > self.capacity:
+            key, m = self._loaded.popitem(last=False)
+            self._blocks[key] = {**self._blocks[key], **m.to_dict()}
+            Logger.info(f"Unloading map '{key}'")
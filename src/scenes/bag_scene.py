@@ -41,14 +41,6 @@ class BagScene(Scene):
         )
         self.del_button = []
 
-        # 字型
-        try:
-            self.title_font = pg.font.Font(None, 28)
-            self.item_font = pg.font.Font(None, 20)
-        except Exception:
-            self.title_font = None
-            self.item_font = None
-
         # 遊戲管理器 (在 enter() 時決定)
         self.game_manager: "GameManager | None" = None
 
@@ -152,9 +144,8 @@ class BagScene(Scene):
         line_height = 22
 
         # Title
-        font_title = pg.font.Font(None, 28)
         screen.blit(
-            font_title.render("Bag", True, (0, 0, 0)),
+            resource_manager.render_text("Bag", 28, (0, 0, 0)),
             (px + padding + 70, py + padding + 18),
         )
 
@@ -165,15 +156,14 @@ class BagScene(Scene):
 
         col_gap = 10
         col_w = (content_w - col_gap) // 2
-        font_item = pg.font.Font(None, 20)
 
         # Section titles
         screen.blit(
-            font_item.render("Monsters", True, (0, 0, 0)),
+            resource_manager.render_text("Monsters", 20, (0, 0, 0)),
             (content_x + 25, content_y + 30),
         )
         screen.blit(
-            font_item.render("Items", True, (0, 0, 0)),
+            resource_manager.render_text("Items", 20, (0, 0, 0)),
             (content_x + col_w + col_gap + 25, content_y + 30),
         )
 
@@ -196,15 +186,14 @@ class BagScene(Scene):
             sprite_path = m.get("sprite_path")
             if sprite_path:
                 try:
-                    img = resource_manager.get_image(sprite_path)
-                    img = pg.transform.scale(img, (thumb_w, thumb_h))
+                    img = resource_manager.get_scaled(sprite_path, (thumb_w, thumb_h))
                     screen.blit(img, (content_x + 18, y - 4))
                 except:
                     pass
 
             # Text
             screen.blit(
-                font_item.render(text, True, (10, 10, 10)),
+                resource_manager.render_text(text, 20, (10, 10, 10)),
                 (content_x + thumb_w + 25, y + 20),
             )
 
@@ -221,14 +210,13 @@ class BagScene(Scene):
             sprite_path = it.get("sprite_path")
             if sprite_path:
                 try:
-                    img = resource_manager.get_image(sprite_path)
-                    img = pg.transform.scale(img, (thumb_w, thumb_h))
+                    img = resource_manager.get_scaled(sprite_path, (thumb_w, thumb_h))
                     screen.blit(img, (content_x + col_w + col_gap + 18, y + 6))
                 except:
                     pass
 
             screen.blit(
-                font_item.render(text, True, (10, 10, 10)),
+                resource_manager.render_text(text, 20, (10, 10, 10)),
                 (content_x + col_w + col_gap + thumb_w + 32, y + 25),
             )
 
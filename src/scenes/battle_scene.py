@@ -40,15 +40,23 @@ class BattleScene(Scene):
         self.enemy_property = "Normal"
 
         self.turn = "player"  # 'player' or 'enemy'
-        self.font = pg.font.SysFont(None, 28)
+        # Everything but the buttons and the info text, redrawn only when _static_state() changes
+        self._static_layer: pg.Surface | None = None
+        self._static_key: tuple | None = None
         # UI assets (loaded in init so we can reuse)
-        self.bg_img = resource_manager.get_image("backgrounds/background1.png")
-        self.ui_frame = resource_manager.get_image("UI/raw/UI_Flat_Frame03a.png")
-        self.button_img = resource_manager.get_image("UI/raw/UI_Flat_Button02a_1.png")
+        # (drawn scaled through resource_manager.get_scaled, which caches each size)
+        self.bg_path = "backgrounds/background1.png"
+        self.ui_frame_path = "UI/raw/UI_Flat_Frame03a.png"
+        self.button_path = "UI/raw/UI_Flat_Button02a_1.png"
+        self.banner_path = "UI/raw/UI_Flat_Banner03a.png"
+        self.name_frame_path = "UI/raw/UI_Flat_Frame01a.png"
+        self.bg_img = resource_manager.get_image(self.bg_path)
+        self.ui_frame = resource_manager.get_image(self.ui_frame_path)
+        self.button_img = resource_manager.get_image(self.button_path)
         # banner image to place behind sprites
-        self.banner_img = resource_manager.get_image("UI/raw/UI_Flat_Banner03a.png")
+        self.banner_img = resource_manager.get_image(self.banner_path)
         # small name frame for labels
-        self.name_frame = resource_manager.get_image("UI/raw/UI_Flat_Frame01a.png")
+        self.name_frame = resource_manager.get_image(self.name_frame_path)
 
         # Buttons area (four actions)
         btn_w, btn_h = 160, 44
@@ -325,13 +333,61 @@ class BattleScene(Scene):
             callback()
         self.message_queue.pop(0)
 
+    def _static_state(self) -> tuple:
+        return (
+            self.enemy_name, self.enemy_level, self.enemy_hp, self.enemy_max, self.enemy_sprite,
+            self.player_name, self.player_level, self.player_hp, self.player_max, self.player_sprite,
+            self.enemy_thumb, self.player_thumb,
+        )
+
     @override
     def draw(self, screen: pg.Surface) -> None:
+        key = self._static_state()
+        if self._static_layer is None or key != self._static_key:
+            if self._static_layer is None or self._static_layer.get_size() != screen.get_size():
+                self._static_layer = pg.Surface(screen.get_size()).convert()
+            self._draw_static(self._static_layer)
+            self._static_key = key
+        screen.blit(self._static_layer, (0, 0))
+
+        panel_h = 120
+        panel_y = GameSettings.SCREEN_HEIGHT - panel_h
+
+        # Draw action buttons (4) using Button components (shows hover/pressed)
+        labels = ["Fight", "Special", "Magic", "Run"]
+        for i, btn in enumerate(self.action_buttons):
+            try:
+                btn.draw(screen)
+            except Exception:
+                # fallback draw
+                r = self.button_rects[i]
+                if self.button_img:
+                    try:
+                        bsurf = resource_manager.get_scaled(self.button_path, (r.w, r.h))
+                        screen.blit(bsurf, (r.x, r.y))
+                    except Exception:
+                        pg.draw.rect(screen, (240, 240, 240), r)
+                else:
+                    pg.draw.rect(screen, (240, 240, 240), r)
+            # draw label centered
+            rect = self.button_rects[i]
+            txt = resource_manager.render_text(labels[i], 28, (20, 20, 20))
+            tx = rect.x + (rect.w - txt.get_width()) // 2
+            ty = rect.y + (rect.h - txt.get_height()) // 2
+            screen.blit(txt, (tx, ty))
+
+        # Info text (left of panel)
+        txt = self.info.get("text", "What will Player do?")
+        info_txt = resource_manager.render_text(txt, 28, (255, 255, 255))
+        screen.blit(info_txt, (20, panel_y + 12))
+
+    def _draw_static(self, screen: pg.Surface) -> None:
+        # Background, sprites, name boxes with HP and the bottom panel
         # Draw background image if available
         if self.bg_img:
             try:
-                bg = pg.transform.scale(
-                    self.bg_img, (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+                bg = resource_manager.get_scaled(
+                    self.bg_path, (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
                 )
                 screen.blit(bg, (0, 0))
             except Exception:
@@ -347,8 +403,7 @@ class BattleScene(Scene):
         if self.enemy_sprite:
             try:
                 # 使用上方的 (sprite_w, sprite_h) 對敵方精靈做縮放，控制顯示大小
-                eimg = resource_manager.get_image(self.enemy_sprite)
-                es = pg.transform.scale(eimg, (sprite_w, sprite_h))
+                es = resource_manager.get_scaled(self.enemy_sprite, (sprite_w, sprite_h))
                 # 將縮放後的敵方精靈繪製到畫面上，位置由 (ex, ey) 決定
                 screen.blit(es, (ex, ey))
             except Exception:
@@ -362,9 +417,9 @@ class BattleScene(Scene):
         if self.player_sprite:
             try:
                 # 使用上方的 (sprite_w, sprite_h) 對我方精靈做縮放，控制顯示大小
-                pimg = resource_manager.get_image(self.player_sprite)
-                pimg_flipped = pg.transform.flip(pimg, True, False)
-                ps = pg.transform.scale(pimg_flipped, (sprite_w + 50, sprite_h + 50))
+                ps = resource_manager.get_scaled(
+                    self.player_sprite, (sprite_w + 50, sprite_h + 50), flip=True
+                )
                 # 將縮放後的我方精靈繪製到畫面上，位置由 (px, py) 決定
                 screen.blit(ps, (px, py))
             except Exception:
@@ -380,7 +435,7 @@ class BattleScene(Scene):
         # use banner image for the name box background
         if self.banner_img:
             try:
-                nb = pg.transform.scale(self.banner_img, (name_box_w, name_box_h))
+                nb = resource_manager.get_scaled(self.banner_path, (name_box_w, name_box_h))
                 screen.blit(nb, (enemy_name_x, enemy_name_y))
             except Exception:
                 pg.draw.rect(
@@ -390,7 +445,7 @@ class BattleScene(Scene):
                 )
         elif self.name_frame:
             try:
-                nf = pg.transform.scale(self.name_frame, (name_box_w, name_box_h))
+                nf = resource_manager.get_scaled(self.name_frame_path, (name_box_w, name_box_h))
                 screen.blit(nf, (enemy_name_x, enemy_name_y))
             except Exception:
                 pg.draw.rect(
@@ -417,13 +472,11 @@ class BattleScene(Scene):
             except Exception:
                 pass
         # 名字
-        name_font = pg.font.SysFont(None, 24, bold=True)
-        name_txt = name_font.render(str(self.enemy_name), True, (10, 10, 10))
+        name_txt = resource_manager.render_text(str(self.enemy_name), 24, (10, 10, 10), bold=True)
         screen.blit(name_txt, (enemy_name_x + text_x_offset, enemy_name_y + 6))
         # 等級直接顯示在右上角
         enemy_lv = getattr(self, "enemy_level", 1)
-        lv_font = pg.font.SysFont(None, 24, bold=True)
-        lv_txt = lv_font.render(f"Lv{int(enemy_lv)}", True, (40, 40, 40))
+        lv_txt = resource_manager.render_text(f"Lv{int(enemy_lv)}", 24, (40, 40, 40), bold=True)
         screen.blit(
             lv_txt,
             (enemy_name_x + name_box_w - lv_txt.get_width() - 10, enemy_name_y + 6),
@@ -441,8 +494,7 @@ class BattleScene(Scene):
             fill = 0
         pg.draw.rect(screen, (40, 200, 40), (hp_x, hp_y, fill, hp_h))
         # HP 數字
-        hp_font = pg.font.SysFont(None, 16)
-        hp_txt = hp_font.render(f"{self.enemy_hp}/{self.enemy_max}", True, (30, 30, 30))
+        hp_txt = resource_manager.render_text(f"{self.enemy_hp}/{self.enemy_max}", 16, (30, 30, 30))
         screen.blit(hp_txt, (hp_x, hp_y + hp_h + 2))
 
         # Player name box (bottom-left, above player sprite)
@@ -450,7 +502,7 @@ class BattleScene(Scene):
         player_name_y = GameSettings.SCREEN_HEIGHT - 220  # 上移40px，避免被底部UI遮住
         if self.banner_img:
             try:
-                nb2 = pg.transform.scale(self.banner_img, (name_box_w, name_box_h))
+                nb2 = resource_manager.get_scaled(self.banner_path, (name_box_w, name_box_h))
                 screen.blit(nb2, (player_name_x, player_name_y))
             except Exception:
                 pg.draw.rect(
@@ -460,7 +512,7 @@ class BattleScene(Scene):
                 )
         elif self.name_frame:
             try:
-                nf2 = pg.transform.scale(self.name_frame, (name_box_w, name_box_h))
+                nf2 = resource_manager.get_scaled(self.name_frame_path, (name_box_w, name_box_h))
                 screen.blit(nf2, (player_name_x, player_name_y))
             except Exception:
                 pg.draw.rect(
@@ -489,13 +541,11 @@ class BattleScene(Scene):
             except Exception:
                 pass
         # 名字
-        p_name_font = pg.font.SysFont(None, 24, bold=True)
-        p_name_txt = p_name_font.render(str(self.player_name), True, (10, 10, 10))
+        p_name_txt = resource_manager.render_text(str(self.player_name), 24, (10, 10, 10), bold=True)
         screen.blit(p_name_txt, (player_name_x + p_text_x_offset, player_name_y + 6))
         # 等級直接顯示在右上角
         player_lv = getattr(self, "player_level", 1)
-        p_lv_font = pg.font.SysFont(None, 24, bold=True)
-        p_lv_txt = p_lv_font.render(f"Lv{int(player_lv)}", True, (40, 40, 40))
+        p_lv_txt = resource_manager.render_text(f"Lv{int(player_lv)}", 24, (40, 40, 40), bold=True)
         screen.blit(
             p_lv_txt,
             (player_name_x + name_box_w - p_lv_txt.get_width() - 10, player_name_y + 6),
@@ -512,9 +562,8 @@ class BattleScene(Scene):
             pfill = 0
         pg.draw.rect(screen, (40, 200, 40), (php_x, php_y, pfill, php_h))
         # HP 數字
-        p_hp_font = pg.font.SysFont(None, 16)
-        p_hp_txt = p_hp_font.render(
-            f"{self.player_hp}/{self.player_max}", True, (30, 30, 30)
+        p_hp_txt = resource_manager.render_text(
+            f"{self.player_hp}/{self.player_max}", 16, (30, 30, 30)
         )
         screen.blit(p_hp_txt, (php_x, php_y + php_h + 2))
 
@@ -523,8 +572,8 @@ class BattleScene(Scene):
         panel_y = GameSettings.SCREEN_HEIGHT - panel_h
         if self.ui_frame:
             try:
-                frame = pg.transform.scale(
-                    self.ui_frame, (GameSettings.SCREEN_WIDTH, panel_h)
+                frame = resource_manager.get_scaled(
+                    self.ui_frame_path, (GameSettings.SCREEN_WIDTH, panel_h)
                 )
                 screen.blit(frame, (0, panel_y))
             except Exception:
@@ -538,34 +587,6 @@ class BattleScene(Scene):
                 screen, (20, 20, 20), (0, panel_y, GameSettings.SCREEN_WIDTH, panel_y)
             )
 
-        # Draw action buttons (4) using Button components (shows hover/pressed)
-        labels = ["Fight", "Special", "Magic", "Run"]
-        for i, btn in enumerate(self.action_buttons):
-            try:
-                btn.draw(screen)
-            except Exception:
-                # fallback draw
-                r = self.button_rects[i]
-                if self.button_img:
-                    try:
-                        bsurf = pg.transform.scale(self.button_img, (r.w, r.h))
-                        screen.blit(bsurf, (r.x, r.y))
-                    except Exception:
-                        pg.draw.rect(screen, (240, 240, 240), r)
-                else:
-                    pg.draw.rect(screen, (240, 240, 240), r)
-            # draw label centered
-            rect = self.button_rects[i]
-            txt = self.font.render(labels[i], True, (20, 20, 20))
-            tx = rect.x + (rect.w - txt.get_width()) // 2
-            ty = rect.y + (rect.h - txt.get_height()) // 2
-            screen.blit(txt, (tx, ty))
-
-        # Info text (left of panel)
-        txt = self.info.get("text", "What will Player do?")
-        info_txt = self.font.render(txt, True, (255, 255, 255))
-        screen.blit(info_txt, (20, panel_y + 12))
-
     def back2game(self):
         print(self.player_hp)
         monster = {"hp": self.player_hp, "exp": self.player_exp + 10,"atk":self.dmg}
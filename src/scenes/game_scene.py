@@ -6,7 +6,7 @@ import os
 from src.scenes.scene import Scene
 from src.core import GameManager, OnlineManager
 from src.utils import Logger, PositionCamera, GameSettings, Position
-from src.core.services import scene_manager, sound_manager, input_manager
+from src.core.services import scene_manager, sound_manager, input_manager, resource_manager
 from src.sprites import Sprite
 from src.interface.components import Button
 
@@ -183,11 +183,7 @@ class GameScene(Scene):
                 vol = max(0.0, min(1.0, rel_x / self.volume_rect.width))
                 sound_manager.volume = vol
                 GameSettings.AUDIO_VOLUME = vol
-                if getattr(sound_manager, "current_bgm", None):
-                    try:
-                        sound_manager.current_bgm.set_volume(vol)
-                    except Exception:
-                        pass
+                sound_manager.set_bgm_volume(vol)
                 self.volume = vol
                 self.update_slider_pos()
             return
@@ -199,6 +195,9 @@ class GameScene(Scene):
         except Exception:
             pass
 
+        # Prefetch nearby maps and track transition frame times
+        self.game_manager.update(dt)
+
         # Check if there is assigned next scene
         self.game_manager.try_switch_map()
 
@@ -277,7 +276,7 @@ class GameScene(Scene):
 
         # 在線玩家
         if self.online_manager and self.game_manager.player:
-            list_online = self.online_manager.get_list_players()
+            list_online = self.online_manager.get_interpolated_players()
             for player in list_online:
                 if player["map"] == self.game_manager.current_map.path_name:
                     cam = self.game_manager.player.camera
@@ -303,8 +302,7 @@ class GameScene(Scene):
         if self.info["remaining"]>0:
             self.Gsetting_UI.draw(screen)
             txt = self.info.get("text", "Oh...h,hello...")
-            font_item = pg.font.Font(None, 35)
-            info_txt = font_item.render(txt, True, (0, 0, 0))
+            info_txt = resource_manager.render_text(txt, 35, (0, 0, 0))
             screen.blit(info_txt ,(465, 345))
 
 
@@ -353,22 +351,14 @@ class GameScene(Scene):
                 new_vol = max(0.0, min(1.0, new_vol))
                 sound_manager.volume = new_vol
                 GameSettings.AUDIO_VOLUME = new_vol
-                if getattr(sound_manager, "current_bgm", None):
-                    try:
-                        sound_manager.current_bgm.set_volume(new_vol)
-                    except Exception:
-                        pass
+                sound_manager.set_bgm_volume(new_vol)
                 self.is_muted = False
                 img = "UI/raw/UI_Flat_ButtonCheck01a.png"
             else:
                 self.prev_volume = getattr(sound_manager, "volume", GameSettings.AUDIO_VOLUME)
                 sound_manager.volume = 0.0
                 GameSettings.AUDIO_VOLUME = 0.0
-                if getattr(sound_manager, "current_bgm", None):
-                    try:
-                        sound_manager.current_bgm.set_volume(0.0)
-                    except Exception:
-                        pass
+                sound_manager.set_bgm_volume(0.0)
                 self.is_muted = True
                 img = "UI/raw/UI_Flat_ButtonCross01a.png"
             # 重建按鈕並保持與初始化相同位置/尺寸
@@ -71,11 +71,7 @@ class SettingScene(Scene):
             vol = max(0.0, min(1.0, rel_x / self.volume_rect.width))
             sound_manager.volume = vol
             GameSettings.AUDIO_VOLUME = vol
-            if getattr(sound_manager, "current_bgm", None):
-                try:
-                    sound_manager.current_bgm.set_volume(vol)
-                except Exception:
-                    pass
+            sound_manager.set_bgm_volume(vol)
             self.volume = vol
             self.update_slider_pos()
 
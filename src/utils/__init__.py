@@ -2,16 +2,19 @@
 
 from .logger import Logger
 from .settings import GameSettings
-from .loader import load_tmx, load_img, load_font, load_sound
+from .loader import load_tmx, load_tmx_data, attach_tmx_images, load_img, load_font, load_sound, load_music
 from .definition import Position, PositionCamera, Direction, MouseBtn, Key, Teleport
 
 __all__ = [
     "Logger",
     "GameSettings",
     "load_tmx",
+    "load_tmx_data",
+    "attach_tmx_images",
     "load_img",
     "load_font",
     "load_sound",
+    "load_music",
     "Position",
     "PositionCamera",
     "Direction",
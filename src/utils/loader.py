@@ -1,5 +1,7 @@
+import os
 import pygame as pg
 from pytmx import load_pygame, TiledMap
+from pytmx.util_pygame import handle_transformation, pygame_image_loader
 from pathlib import Path
 from .logger import Logger
 
@@ -19,6 +21,11 @@ def load_sound(path: str) -> pg.mixer.Sound:
         Logger.error(f"Failed to load sound: {path}")
     return sound
 
+def load_music(path: str) -> None:
+    # Streamed by pygame.mixer.music, decoded a little at a time while it plays
+    Logger.info(f"Loading music: {path}")
+    pg.mixer.music.load(str(ASSETS_DIR / "sounds" / path))
+
 def load_font(path: str, size: int) -> pg.font.Font:
     Logger.info(f"Loading font: {path}")
     font = pg.font.Font(str(ASSETS_DIR / "fonts" / path), size)
@@ -31,3 +38,42 @@ def load_tmx(path: str) -> TiledMap:
     if tmxdata is None:
         Logger.error(f"Failed to load map: {path}")
     return tmxdata
+
+
+def load_tmx_data(path: str) -> TiledMap:
+    # Parse the map and decode its tileset images without converting them,
+    # safe to call off the main thread; attach_tmx_images finishes the job
+    tmxdata = TiledMap(str(ASSETS_DIR / "maps" / path))
+    decoded: dict[str, pg.Surface] = {}
+    for ts in tmxdata.tilesets:
+        if ts.source is not None:
+            filename = os.path.join(os.path.dirname(tmxdata.filename), ts.source)
+            decoded[filename] = pg.image.load(filename)
+    tmxdata.image_loader = _decoded_image_loader(decoded)
+    return tmxdata
+
+def attach_tmx_images(tmxdata: TiledMap) -> None:
+    # Cut the tile images of a map parsed by load_tmx_data (main thread only)
+    tmxdata.reload_images()
+    # Later reloads go to disk; this also lets go of the decoded tileset images
+    tmxdata.image_loader = pygame_image_loader
+
+def _decoded_image_loader(decoded: dict[str, pg.Surface]):
+    # pytmx's pygame_image_loader, taking the tileset images decoded by load_tmx_data.
+    # Tiles are left unconverted: maps only draw them through ResourceManager.get_tile,
+    # which converts every scaled tile anyway.
+    def loader(filename: str, colorkey, **kwargs):
+        image = decoded.get(filename)
+        if image is None:
+            return pygame_image_loader(filename, colorkey, **kwargs)
+        if colorkey:
+            image = image.copy()
+            image.set_colorkey(pg.Color(f"#{colorkey}"))
+
+        def load_image(rect=None, flags=None):
+            tile = image.subsurface(rect) if rect else image.copy()
+            if flags:
+                tile = handle_transformation(tile, flags)
+            return tile
+        return load_image
+    return loader
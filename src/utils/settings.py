@@ -10,12 +10,21 @@ class Settings:
     DEBUG: bool = True          # Debug mode
     TILE_SIZE: int = 64         # Size of each tile in pixels
     DRAW_HITBOXES: bool = True  # Draw hitboxes for debugging
+    # Map rendering
+    MAP_CHUNK_TILES: int = 16       # Width/height of a baked map chunk in tiles
+    MAP_CHUNK_CACHE_MB: int = 64    # Memory budget for baked map chunks per map
+    MAX_LOADED_MAPS: int = 2        # Maps kept in memory, least recently used ones are unloaded
+    PREFETCH_DISTANCE_TILES: int = 4    # Start loading a teleport's destination this close to it
+    PREFETCH_FRAME_BUDGET_MS: float = 4 # Main-thread time per frame for baking prefetched maps
     # Audio
     MAX_CHANNELS: int = 16
     AUDIO_VOLUME: float = 0.5   # Volume of audio
     # Online
     IS_ONLINE: bool = False
     ONLINE_SERVER_URL: str = "http://localhost:8989"
+    ONLINE_PUSH: bool = True        # Use the server's push channel, falls back to HTTP polling
+    ONLINE_PUSH_PORT: int = 8990
+    ONLINE_BINARY: bool = True      # Compact binary bodies for HTTP position updates, JSON otherwise
     DRAW_HITBOXES = False
     
 GameSettings = Settings()
\ No newline at end of file
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from server.asyncServer import AsyncServer
+
+
+class FakeWriter:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+
+def serve(request: bytes, limit: int = 2**16) -> bytes:
+    async def run() -> bytes:
+        reader = asyncio.StreamReader(limit=limit)
+        reader.feed_data(request)
+        reader.feed_eof()
+        writer = FakeWriter()
+        server = AsyncServer(lambda *args: (200, {"ok": True}), lambda *args: (200, {"ok": True}))
+        await server._client(reader, writer)
+        return writer.data
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("request_bytes", [
+    b"POST /players HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+    b"POST /players HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+    b"GET / HTTP/1.1\r\nX-Long: " + b"a" * 2048 + b"\r\n\r\n",
+    b"garbage\r\n\r\n",
+])
+def test_bad_requests_get_400(request_bytes):
+    answer = serve(request_bytes, limit=1024)
+    assert answer.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close" in answer
+
+
+def test_good_request_is_answered():
+    assert serve(b"GET / HTTP/1.1\r\nConnection: close\r\n\r\n").startswith(b"HTTP/1.1 200 OK\r\n")
@@ -0,0 +1,109 @@
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from server.playerHandler import PlayerHandler
+from server.pushServer import MAX_LINE, PushServer
+from server.sharedPlayerTable import MAX_MAPS, SharedPlayerTable
+from shared.wireFormat import BINARY_CONTENT_TYPE, KNOWN_MAPS, POSITION
+
+
+@pytest.fixture(scope="module")
+def server_main():
+    # server.py shares its name with the server package
+    spec = importlib.util.spec_from_file_location("server_main", Path(__file__).parent.parent / "server.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    module.PLAYER_HANDLER.stop()
+
+
+def test_batch_answers_per_item(server_main):
+    pid = server_main.PLAYER_HANDLER.register()
+    other = server_main.PLAYER_HANDLER.register()
+    items = [
+        {"id": pid, "x": 1.0, "y": 2.0, "map": "map.tmx"},
+        {"id": other, "x": 3.0, "y": 4.0, "map": "new_map.tmx"},
+        {"id": pid + 1000, "x": 0.0, "y": 0.0, "map": "gym.tmx"},
+        {"id": pid},
+    ]
+    status, answer = server_main.handle_post("/players/batch", json.dumps(items).encode())
+    assert status == 200
+    assert [r["status"] for r in answer["results"]] == [200, 200, 404, 400]
+    assert server_main.PLAYER_HANDLER.list_players("map.tmx")[pid]["x"] == 1.0
+    assert server_main.PLAYER_HANDLER.list_players("new_map.tmx")[other]["x"] == 3.0
+
+
+def test_binary_batch_answers_a_bad_map_per_item(server_main):
+    pid = server_main.PLAYER_HANDLER.register()
+    body = POSITION.pack(pid, 5.0, 6.0, 2) + POSITION.pack(pid, 0.0, 0.0, 999)
+    status, answer = server_main.handle_post("/players/batch", body, BINARY_CONTENT_TYPE)
+    assert status == 200
+    assert [r["status"] for r in answer["results"]] == [200, 400]
+
+
+class FakeWriter:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+    def messages(self) -> list[dict]:
+        return [json.loads(line) for line in self.data.splitlines()]
+
+
+def relay(handler: PlayerHandler, *chunks: bytes) -> FakeWriter:
+    async def run() -> FakeWriter:
+        reader = asyncio.StreamReader()
+        for chunk in chunks:
+            reader.feed_data(chunk)
+        reader.feed_eof()
+        writer = FakeWriter()
+        await PushServer(handler)._relay(reader, writer)
+        return writer
+    return asyncio.run(run())
+
+
+def test_relay_answers_a_bad_map_per_line():
+    handler = SharedPlayerTable()
+    pid = handler.register()
+    # Fill the shared map table, the next new name has no room
+    handler.update_many([(pid, 0.0, 0.0, f"junk{i}.tmx") for i in range(MAX_MAPS - len(KNOWN_MAPS))])
+    lines = [
+        {"id": pid, "x": 1.0, "y": 1.0, "map": "map.tmx"},
+        {"id": pid, "x": 2.0, "y": 2.0, "map": "nowhere.tmx"},
+    ]
+    writer = relay(handler, b"".join(json.dumps(line).encode() + b"\n" for line in lines))
+    assert writer.messages() == [{"type": "error", "id": pid, "error": "bad_map"}]
+    assert handler.list_players("map.tmx")[pid]["x"] == 1.0
+
+
+@pytest.mark.parametrize("end", [b"", b"\n"])
+def test_relay_drops_an_overlong_line(end):
+    handler = PlayerHandler()
+    writer = relay(handler, b"x" * MAX_LINE, b"x" + end)
+    assert writer.messages() == [{"type": "error", "id": None, "error": "line_too_long"}]
+
+
+@pytest.mark.parametrize("end", [b"", b"\n"])
+def test_push_client_drops_an_overlong_line(end):
+    async def run() -> FakeWriter:
+        reader = asyncio.StreamReader(limit=MAX_LINE)
+        reader.feed_data(b'{"type": "hello", "id": 0}\n' + b"x" * (2 * MAX_LINE) + end)
+        reader.feed_eof()
+        writer = FakeWriter()
+        await PushServer(PlayerHandler())._client(reader, writer)
+        return writer
+
+    writer = asyncio.run(run())
+    assert writer.messages() == [{"type": "error", "id": None, "error": "line_too_long"}]
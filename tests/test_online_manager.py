@@ -0,0 +1,172 @@
+import json
+import socket
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.core.managers.online_manager import INTERPOLATION_DELAY, PUSH_RETRY_MIN, SEND_INTERVAL, OnlineManager
+from src.utils import GameSettings
+
+SERVER_DELAY = 0.5      # seconds every /players request takes
+FRAME_TIME = 1 / 60
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    posts = 0
+
+    def log_message(self, fmt, *args):
+        return
+
+    def do_GET(self):
+        if self.path == "/register":
+            self._json({"message": "registration successful", "id": 0})
+            return
+        time.sleep(SERVER_DELAY)
+        self._json({"players": {}})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        SlowHandler.posts += 1
+        time.sleep(SERVER_DELAY)
+        self._json({"success": True})
+
+    def _json(self, obj: object) -> None:
+        data = json.dumps(obj).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def slow_server():
+    SlowHandler.posts = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_update_does_not_block_on_a_slow_server(slow_server):
+    manager = OnlineManager()
+    manager.base = slow_server
+    manager.enter()
+    try:
+        worst = 0.0
+        for frame in range(90):
+            start = time.perf_counter()
+            manager.update(float(frame), 0.0, "map.tmx")
+            manager.get_list_players()
+            worst = max(worst, time.perf_counter() - start)
+            time.sleep(FRAME_TIME)
+    finally:
+        manager.exit()
+    assert worst < FRAME_TIME
+
+
+def test_positions_reach_a_slow_server(slow_server):
+    manager = OnlineManager()
+    manager.base = slow_server
+    manager.enter()
+    try:
+        deadline = time.monotonic() + 5 * SERVER_DELAY
+        frame = 0
+        while SlowHandler.posts == 0 and time.monotonic() < deadline:
+            manager.update(float(frame), 0.0, "map.tmx")
+            frame += 1
+            time.sleep(FRAME_TIME)
+    finally:
+        manager.exit()
+    assert SlowHandler.posts > 0
+
+
+def test_push_channel_reconnects_after_a_drop(slow_server, monkeypatch):
+    # A push server that hangs up on every connection right after the hello
+    listener = socket.create_server(("127.0.0.1", 0))
+    monkeypatch.setattr(GameSettings, "ONLINE_PUSH", True)
+    monkeypatch.setattr(GameSettings, "ONLINE_PUSH_PORT", listener.getsockname()[1])
+    hellos = []
+
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn:
+                hellos.append(conn.recv(1024))
+
+    threading.Thread(target=serve, daemon=True).start()
+    manager = OnlineManager()
+    manager.base = slow_server
+    manager.enter()
+    try:
+        deadline = time.monotonic() + 3 * PUSH_RETRY_MIN + SERVER_DELAY
+        while len(hellos) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        manager.exit()
+        listener.close()
+    assert len(hellos) >= 2
+
+
+def refresh(manager: OnlineManager, clock: SimpleNamespace, t: float, x: float) -> None:
+    clock.now = t
+    manager._remote = {1: {"id": 1, "x": x, "y": 0.0, "map": "map.tmx"}}
+    manager._refresh_list_players()
+
+
+def test_unchanged_positions_add_no_samples():
+    clock = SimpleNamespace(now=0.0)
+    manager = OnlineManager()
+    with mock.patch("src.core.managers.online_manager.time", SimpleNamespace(monotonic=lambda: clock.now)):
+        # Updates every SEND_INTERVAL, polled twice as often
+        for i in range(6):
+            refresh(manager, clock, i * SEND_INTERVAL, 10.0 * i)
+            refresh(manager, clock, (i + 0.5) * SEND_INTERVAL, 10.0 * i)
+        assert [x for _, x, _ in manager._history[1]] == [0.0, 10.0, 20.0, 30.0, 40.0, 50.0]
+
+        clock.now = 3.5 * SEND_INTERVAL + INTERPOLATION_DELAY
+        assert manager.get_interpolated_players()[0]["x"] == pytest.approx(35.0)
+
+
+def test_stopped_player_is_not_extrapolated():
+    clock = SimpleNamespace(now=0.0)
+    manager = OnlineManager()
+    with mock.patch("src.core.managers.online_manager.time", SimpleNamespace(monotonic=lambda: clock.now)):
+        for i in range(4):
+            refresh(manager, clock, i * SEND_INTERVAL, 10.0 * i)
+        # Stands at 30 from here on
+        t = 3 * SEND_INTERVAL
+        while t < 3 * SEND_INTERVAL + 2 * INTERPOLATION_DELAY:
+            t += SEND_INTERVAL / 2
+            refresh(manager, clock, t, 30.0)
+            clock.now = t
+            assert manager.get_interpolated_players()[0]["x"] <= 30.0
+
+
+def test_moves_within_one_clock_tick():
+    clock = SimpleNamespace(now=0.0)
+    manager = OnlineManager()
+    with mock.patch("src.core.managers.online_manager.time", SimpleNamespace(monotonic=lambda: clock.now)):
+        refresh(manager, clock, 0.0, 0.0)
+        refresh(manager, clock, 0.0, 10.0)
+        assert list(manager._history[1]) == [(0.0, 10.0, 0.0)]
+        refresh(manager, clock, 0.1, 20.0)
+        refresh(manager, clock, 0.1, 30.0)
+        assert [x for _, x, _ in manager._history[1]] == [10.0, 30.0]
+
+        clock.now = 0.5
+        assert manager.get_interpolated_players()[0]["x"] >= 30.0
+
+
+def test_sample_at_equal_timestamps():
+    samples = deque([(0.0, 0.0, 0.0), (0.0, 10.0, 5.0)])
+    assert OnlineManager._sample_at(samples, 0.5) == (10.0, 5.0)
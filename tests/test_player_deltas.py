@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from server.playerHandler import PlayerHandler
+from server.sharedPlayerTable import SharedPlayerTable
+
+MAPS = ["map.tmx", "gym.tmx", "mountain.tmx"]
+
+
+@pytest.fixture(params=[PlayerHandler, SharedPlayerTable])
+def handler(request):
+    return request.param()
+
+
+def apply(replica: dict, answer: dict) -> None:
+    if answer["full"]:
+        replica.clear()
+    replica.update(answer["players"])
+    for pid in answer["removed"]:
+        replica.pop(pid, None)
+
+
+def test_radius_query_sees_players_that_did_not_move(handler):
+    requester = handler.register()
+    still = handler.register()
+    handler.update(requester, 0.0, 0.0, "map.tmx")
+    handler.update(still, 100.0, 0.0, "map.tmx")
+    seq = handler.players_since(None, "map.tmx", (0.0, 0.0, 50.0))["seq"]
+
+    # The requester walks up to a player that stays put
+    handler.update(requester, 90.0, 0.0, "map.tmx")
+    answer = handler.players_since(seq, "map.tmx", (90.0, 0.0, 50.0))
+    assert still in answer["players"]
+
+
+def test_players_on_other_maps_are_not_removed(handler):
+    elsewhere = handler.register()
+    handler.update(elsewhere, 1.0, 1.0, "gym.tmx")
+    seq = handler.players_since(None, "map.tmx")["seq"]
+
+    handler.update(elsewhere, 2.0, 2.0, "gym.tmx")
+    handler.update(elsewhere, 2.0, 2.0, "mountain.tmx")
+    newcomer = handler.register()
+    handler.update(newcomer, 3.0, 3.0, "gym.tmx")
+    answer = handler.players_since(seq, "map.tmx")
+    assert answer["players"] == {}
+    assert answer["removed"] == []
+
+
+def test_player_leaving_the_map_is_removed(handler):
+    pid = handler.register()
+    handler.update(pid, 1.0, 1.0, "map.tmx")
+    seq = handler.players_since(None, "map.tmx")["seq"]
+
+    handler.update(pid, 1.0, 1.0, "gym.tmx")
+    handler.update(pid, 1.0, 1.0, "mountain.tmx")
+    assert handler.players_since(seq, "map.tmx")["removed"] == [pid]
+
+
+def test_deltas_keep_a_replica_in_sync(handler):
+    rng = random.Random(7)
+    pids = []
+    clients = [(map_name, {}, [None]) for map_name in (None, *MAPS)]
+    for step in range(3000):
+        if rng.random() < 0.05 or not pids:
+            pids.append(handler.register())
+        else:
+            pid = rng.choice(pids)
+            handler.update(pid, float(rng.randint(0, 9)), 0.0, rng.choice(MAPS))
+        if step % 5 == 0:
+            for map_name, replica, seq in clients:
+                answer = handler.players_since(seq[0], map_name)
+                apply(replica, answer)
+                seq[0] = answer["seq"]
+                assert replica == handler.list_players(map_name)
@@ -0,0 +1,78 @@
+import pytest
+
+from server.playerHandler import PlayerHandler
+
+TIMEOUT = 60.0
+START = 1000.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def handler(clock):
+    return PlayerHandler(timeout_seconds=TIMEOUT, check_interval_seconds=1.0, clock=clock)
+
+
+def test_idle_player_expires_after_exactly_the_timeout(handler, clock):
+    pid = handler.register()
+    handler.update(pid, 1.0, 1.0, "map.tmx")
+
+    clock.now = START + TIMEOUT - 0.5
+    assert handler.expire() == []
+    clock.now = START + TIMEOUT
+    assert handler.expire() == [pid]
+    assert handler.list_players() == {}
+    assert not handler.update(pid, 0.0, 0.0, "map.tmx")
+
+
+def test_moving_player_stays(handler, clock):
+    idle = handler.register()
+    moving = handler.register()
+    late = handler.register()
+    handler.update(idle, 1.0, 1.0, "map.tmx")
+    handler.update(moving, 1.0, 1.0, "map.tmx")
+    clock.now += 30.0
+    handler.update(late, 2.0, 2.0, "map.tmx")
+
+    expired = []
+    for step in range(1, 10):
+        clock.now += 10.0
+        handler.update(moving, 1.0 + step, 1.0, "map.tmx")
+        expired.append((clock.now - START, handler.expire()))
+
+    assert [(t, pids) for t, pids in expired if pids] == [(TIMEOUT, [idle]), (TIMEOUT + 30.0, [late])]
+    assert list(handler.list_players()) == [moving]
+
+
+def test_resending_the_same_position_is_not_activity(handler, clock):
+    pid = handler.register()
+    handler.update(pid, 5.0, 5.0, "map.tmx")
+    clock.now += TIMEOUT - 1.0
+    handler.update(pid, 5.0, 5.0, "map.tmx")
+    clock.now += 1.0
+    assert handler.expire() == [pid]
+
+
+def test_expired_players_show_up_as_removed_in_deltas(handler, clock):
+    pids = [handler.register() for _ in range(3)]
+    for pid in pids:
+        handler.update(pid, 1.0, 1.0, "map.tmx")
+    seq = handler.players_since(None, "map.tmx")["seq"]
+
+    clock.now += TIMEOUT
+    assert sorted(handler.expire()) == sorted(pids)
+    delta = handler.players_since(seq, "map.tmx")
+    assert not delta["full"]
+    assert delta["players"] == {}
+    assert sorted(delta["removed"]) == sorted(pids)
@@ -0,0 +1,58 @@
+import pytest
+
+from server.playerHandler import PlayerHandler
+from server.sharedPlayerTable import MAX_MAPS, SharedPlayerTable
+from shared.wireFormat import KNOWN_MAPS, MapTable, decode_players, encode_players
+
+
+def test_players_round_trip():
+    maps = MapTable()
+    answer = {
+        "seq": 7,
+        "full": False,
+        "players": {3: {"id": 3, "x": 1.5, "y": -2.0, "map": "gym.tmx"}},
+        "removed": [4, 5],
+    }
+    assert decode_players(encode_players(answer, maps), maps.names()) == answer
+
+
+def test_large_seq_and_counts_encode():
+    players = {pid: {"id": pid, "x": 0.0, "y": 0.0, "map": "map.tmx"} for pid in range(70000)}
+    answer = {"seq": 2**40, "full": True, "players": players, "removed": list(range(70000, 140000))}
+    maps = MapTable()
+    decoded = decode_players(encode_players(answer, maps), maps.names())
+    assert decoded["seq"] == 2**40
+    assert len(decoded["players"]) == 70000
+    assert len(decoded["removed"]) == 70000
+
+
+def test_maps_without_an_id_encode_as_unknown():
+    maps = MapTable()
+    answer = {
+        "seq": 1,
+        "full": True,
+        "players": {1: {"id": 1, "x": 0.0, "y": 0.0, "map": "new_map.tmx"}},
+        "removed": [],
+    }
+    assert decode_players(encode_players(answer, maps), maps.names())["players"][1]["map"] is None
+
+
+@pytest.mark.parametrize("handler_type", [PlayerHandler, SharedPlayerTable])
+def test_any_map_name_is_accepted(handler_type):
+    handler = handler_type()
+    pid = handler.register()
+    assert handler.update(pid, 1.0, 1.0, "new_map.tmx")
+    assert handler.list_players("new_map.tmx")[pid]["map"] == "new_map.tmx"
+
+
+def test_full_shared_map_table_keeps_known_maps():
+    table = SharedPlayerTable()
+    pid = table.register()
+    extra = MAX_MAPS - len(KNOWN_MAPS)
+    assert all(table.update_many([(pid, 0.0, 0.0, f"junk{i}.tmx") for i in range(extra)]))
+    with pytest.raises(ValueError):
+        table.update(pid, 0.0, 0.0, "one_too_many.tmx")
+    # Only the item that does not fit fails
+    assert table.update_many([(pid, 1.0, 1.0, "map.tmx"), (pid, 2.0, 2.0, "nope.tmx")]) == [True, None]
+    for name in KNOWN_MAPS:
+        assert table.update(pid, 3.0, 3.0, name)